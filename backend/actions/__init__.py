@@ -8,7 +8,16 @@ that sequence multiple tool calls together with:
 - Execution tracing for feedback loops
 """
 
-from backend.actions.base import Action, ActionResult, ActionContext, ActionRegistry
+from backend.actions.base import (
+    Action,
+    ActionResult,
+    ActionContext,
+    ActionRegistry,
+    ToolStep,
+    BranchStep,
+    clear_shared_tool_cache,
+)
+from backend.actions.dag import DAG, Step
 from backend.actions.definitions import REGISTERED_ACTIONS
 
 __all__ = [
@@ -16,5 +25,10 @@ __all__ = [
     "ActionResult", 
     "ActionContext",
     "ActionRegistry",
+    "ToolStep",
+    "BranchStep",
+    "clear_shared_tool_cache",
+    "DAG",
+    "Step",
     "REGISTERED_ACTIONS",
 ]
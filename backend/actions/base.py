@@ -8,18 +8,76 @@ Actions are composable units that can:
 4. Produce detailed execution traces
 """
 
+import asyncio
+import copy
+import dataclasses
+import inspect
+import itertools
 import json
 import logging
+import secrets
+import sys
 import time
-import uuid
-from abc import ABC, abstractmethod
+from abc import ABC
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, List, Optional, Tuple, Type, get_origin
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger("exchange-backend.actions")
 
+_loads = orjson.loads if orjson else json.loads
+
+# Short ids: a random per-process prefix + a counter (next() is atomic under the GIL)
+_ID_COUNTER = itertools.count()
+_ID_PREFIX = secrets.token_hex(3)
+
+
+def _short_id() -> str:
+    """Hex id (10+ chars), unique within the process and across restarts."""
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):04x}"
+
+
+# Cross-context cache for read-only tools: (tool fn, call key) -> (expires, result)
+_SHARED_TOOL_CACHE: Dict[Tuple[Any, Any], Tuple[float, Any]] = {}
+_SHARED_TOOL_CACHE_SIZE = 256
+_MISS = object()
+
+
+def clear_shared_tool_cache():
+    """Forget every shared tool result, e.g. after a data sync or a new tool registry."""
+    _SHARED_TOOL_CACHE.clear()
+
+
+def _call_key(tool_name: str, arguments: Dict[str, Any]) -> Optional[Tuple]:
+    """Hashable cache key for a tool call, or None if an argument is unhashable."""
+    key = (tool_name, tuple(sorted(arguments.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Last (epoch seconds, ISO string) pair handed out by _now_iso
+_TS_CACHE: List[Any] = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """UTC ISO timestamp, reformatted at most once per millisecond."""
+    t = time.time()
+    ts = _TS_CACHE
+    if t - ts[0] > 0.001:
+        ts[0] = t
+        ts[1] = datetime.utcfromtimestamp(t).isoformat()
+    return ts[1]
+
 
 class ActionStatus(Enum):
     """Status of an action execution."""
@@ -31,66 +89,182 @@ class ActionStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
-class ToolCall:
+def _describe_fields(cls) -> List[Tuple[str, bool]]:
+    """Return ``(name, required)`` for each init field of a (future) dataclass."""
+    if "__dataclass_fields__" in cls.__dict__:
+        return [
+            (f.name, f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING)
+            for f in dataclasses.fields(cls)
+            if f.init
+        ]
+    
+    # Called before @dataclass has run: read annotations and class-level defaults
+    described = []
+    for name, annotation in cls.__dict__.get("__annotations__", {}).items():
+        if annotation is ClassVar or get_origin(annotation) is ClassVar:
+            continue
+        default = cls.__dict__.get(name, dataclasses.MISSING)
+        if isinstance(default, dataclasses.Field):
+            if not default.init:
+                continue
+            required = default.default is dataclasses.MISSING and default.default_factory is dataclasses.MISSING
+        else:
+            required = default is dataclasses.MISSING
+        described.append((name, required))
+    return described
+
+
+class FastDataclass:
+    """
+    Mixin that code-generates ``to_dict``/``from_dict`` for a dataclass.
+    
+    Both functions are compiled once per class, at class creation time, into
+    straight-line code (a single dict literal / constructor call) instead of
+    walking fields on every call. Subclasses customize the generated code with:
+    
+    - ``_dict_prelude``: source lines executed at the top of ``to_dict``
+    - ``_dict_exprs``: field name -> expression used instead of ``self.<field>``
+    - ``_dict_extra``: extra output key -> expression, appended after the fields
+    - ``_from_dict_exprs``: field name -> expression over ``d`` used by ``from_dict``
+    
+    Expressions are evaluated in the defining module's namespace.
+    """
+    
+    __slots__ = ()
+    
+    _dict_prelude: ClassVar[Tuple[str, ...]] = ()
+    _dict_exprs: ClassVar[Dict[str, str]] = {}
+    _dict_extra: ClassVar[Dict[str, str]] = {}
+    _from_dict_exprs: ClassVar[Dict[str, str]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        described = _describe_fields(cls)
+        namespace = sys.modules[cls.__module__].__dict__
+        
+        items = [f"{name!r}: {cls._dict_exprs.get(name, 'self.' + name)}" for name, _ in described]
+        items += [f"{key!r}: {expr}" for key, expr in cls._dict_extra.items()]
+        to_dict_src = "\n".join([
+            "def to_dict(self):",
+            *(f"    {line}" for line in cls._dict_prelude),
+            "    return {" + ", ".join(items) + "}",
+        ])
+        
+        from_dict_lines = ["def from_dict(cls, d):", "    kw = {}"]
+        for name, required in described:
+            if name in cls._from_dict_exprs:
+                from_dict_lines.append(f"    kw[{name!r}] = {cls._from_dict_exprs[name]}")
+            elif required:
+                from_dict_lines.append(f"    kw[{name!r}] = d[{name!r}]")
+            else:
+                from_dict_lines.append(f"    if {name!r} in d: kw[{name!r}] = d[{name!r}]")
+        from_dict_lines.append("    return cls(**kw)")
+        
+        generated: Dict[str, Any] = {}
+        exec(to_dict_src, namespace, generated)
+        exec("\n".join(from_dict_lines), namespace, generated)
+        
+        generated["to_dict"].__qualname__ = f"{cls.__qualname__}.to_dict"
+        generated["from_dict"].__qualname__ = f"{cls.__qualname__}.from_dict"
+        cls.to_dict = generated["to_dict"]
+        cls.from_dict = classmethod(generated["from_dict"])
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ToolCall(FastDataclass):
     """Record of a single tool invocation."""
     tool_name: str
     arguments: Dict[str, Any]
-    result: Any = None
+    result: Any = None  # Already parsed by Action.call_tool()
     error: Optional[str] = None
-    duration_ms: float = 0
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    
-    def to_dict(self) -> dict:
-        return {
-            "tool_name": self.tool_name,
-            "arguments": self.arguments,
-            "result": self.result if not isinstance(self.result, str) else json.loads(self.result) if self.result.startswith("{") else self.result,
-            "error": self.error,
-            "duration_ms": self.duration_ms,
-            "timestamp": self.timestamp,
-        }
-
-
-@dataclass
-class ActionResult:
+    duration_ns: int = 0
+    timestamp: str = field(default_factory=_now_iso)
+    
+    _dict_extra = {"duration_ms": "self.duration_ns / 1_000_000"}
+    _from_dict_exprs = {
+        "duration_ns": "d['duration_ns'] if 'duration_ns' in d else round(d.get('duration_ms', 0) * 1_000_000)",
+    }
+    
+    @property
+    def duration_ms(self) -> float:
+        """Call duration in milliseconds."""
+        return self.duration_ns / 1_000_000
+    
+    def __repr__(self) -> str:
+        state = f"error={self.error!r}" if self.error else "ok"
+        return f"<ToolCall {self.tool_name} {state} {self.duration_ms:.1f}ms>"
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ActionResult(FastDataclass):
     """Result of an action execution with full trace."""
     action_name: str
     status: ActionStatus
     output: Any = None
     error: Optional[str] = None
     tool_calls: List[ToolCall] = field(default_factory=list)
-    duration_ms: float = 0
-    execution_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    dropped_tool_calls: int = 0  # Oldest calls discarded by the action's trace_limit
+    duration_ns: int = 0
+    execution_id: str = field(default_factory=_short_id)
+    timestamp: str = field(default_factory=_now_iso)
+    
+    # One pass over the trace builds both the serialized calls and tool names
+    _dict_prelude = (
+        "tools_used = []",
+        "tool_calls = []",
+        "append_used = tools_used.append",
+        "append_call = tool_calls.append",
+        "for tc in self.tool_calls:",
+        "    append_used(tc.tool_name)",
+        "    append_call(tc.to_dict())",
+    )
+    _dict_exprs = {
+        "status": "self.status.value",
+        "tool_calls": "tool_calls",
+    }
+    _dict_extra = {
+        "tools_used": "tools_used",
+        "duration_ms": "self.duration_ns / 1_000_000",
+    }
+    _from_dict_exprs = {
+        "status": "ActionStatus(d['status'])",
+        "tool_calls": "[ToolCall.from_dict(tc) for tc in d.get('tool_calls', ())]",
+        "duration_ns": "d['duration_ns'] if 'duration_ns' in d else round(d.get('duration_ms', 0) * 1_000_000)",
+    }
+    
+    @property
+    def duration_ms(self) -> float:
+        """Total action duration in milliseconds."""
+        return self.duration_ns / 1_000_000
+    
+    def __repr__(self) -> str:
+        return (
+            f"<ActionResult {self.action_name} {self.status.value} "
+            f"id={self.execution_id} calls={len(self.tool_calls)}>"
+        )
     
     @property
     def tools_used(self) -> List[str]:
         """List of tool names that were called."""
         return [tc.tool_name for tc in self.tool_calls]
     
-    def to_dict(self) -> dict:
-        return {
-            "execution_id": self.execution_id,
-            "action_name": self.action_name,
-            "status": self.status.value,
-            "output": self.output,
-            "error": self.error,
-            "tool_calls": [tc.to_dict() for tc in self.tool_calls],
-            "tools_used": self.tools_used,
-            "duration_ms": self.duration_ms,
-            "timestamp": self.timestamp,
-        }
-
-
-@dataclass
-class ActionContext:
+    def to_json_bytes(self) -> bytes:
+        """Serialize the full result (including trace) to UTF-8 JSON."""
+        if orjson:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NAIVE_UTC)
+        return json.dumps(self.to_dict()).encode()
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ActionContext(FastDataclass):
     """Context passed through action execution."""
     user_query: str
     model_name: str
     provider: str
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    session_id: str = field(default_factory=_short_id)
     variables: Dict[str, Any] = field(default_factory=dict)
+    # Parsed tool results for this workflow, keyed by (tool_name, sorted kwargs)
+    _tool_cache: Dict[Tuple, Any] = field(default_factory=dict, init=False)
     
     def set(self, key: str, value: Any):
         """Store a value in context for subsequent steps."""
@@ -101,6 +275,73 @@ class ActionContext:
         return self.variables.get(key, default)
 
 
+@dataclass(frozen=True)
+class ToolStep:
+    """Declarative step: call a tool and store its parsed result in the context."""
+    tool: str
+    store: Optional[str] = None  # Context key for the result (defaults to the tool name)
+    args: Any = None  # Dict of arguments, or callable(context) -> dict
+
+
+@dataclass(frozen=True)
+class BranchStep:
+    """Declarative step: run one of two step lists depending on the context."""
+    predicate: Callable[[ActionContext], bool]
+    then: Tuple[Any, ...] = ()
+    otherwise: Tuple[Any, ...] = ()
+
+
+def _compile_steps(cls) -> Callable:
+    """
+    Compile an action's declarative ``steps`` into a specialized execute().
+    
+    The step list is unrolled into straight-line source with every step's
+    arguments/predicates bound as constants, so running the action costs one
+    bound call per step rather than an interpreted walk over the list.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = [
+        "def execute(self, context):",
+        "    call = self._call_tool_fast",
+        "    store = context.set",
+    ]
+    
+    def emit(steps, indent):
+        pad = "    " * indent
+        if not steps:
+            lines.append(f"{pad}pass")
+        for step in steps:
+            ref = f"_s{len(namespace)}"
+            if isinstance(step, ToolStep):
+                key = step.store or step.tool
+                if step.args is None:
+                    call_args = "{}"
+                elif callable(step.args):
+                    namespace[ref] = step.args
+                    call_args = f"{ref}(context)"
+                else:
+                    namespace[ref] = dict(step.args)
+                    call_args = ref
+                lines.append(f"{pad}store({key!r}, call({step.tool!r}, {call_args}))")
+            elif isinstance(step, BranchStep):
+                namespace[ref] = step.predicate
+                lines.append(f"{pad}if {ref}(context):")
+                emit(step.then, indent + 1)
+                lines.append(f"{pad}else:")
+                emit(step.otherwise, indent + 1)
+            else:
+                raise TypeError(f"{cls.__name__}.steps: unsupported step {step!r}")
+    
+    emit(cls.steps, 1)
+    lines.append("    return self.finish(context)")
+    
+    generated: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace, generated)
+    execute = generated["execute"]
+    execute.__qualname__ = f"{cls.__qualname__}.execute"
+    return execute
+
+
 class Action(ABC):
     """
     Base class for defining composable actions.
@@ -125,57 +366,157 @@ class Action(ABC):
                         self.call_tool("read_email", email_id=email["id"])
                 
                 return self.complete(output={"summary": "..."})
+    
+    Actions that issue independent tool calls can implement aexecute()
+    instead and fan them out concurrently:
+    
+            async def aexecute(self, context: ActionContext) -> ActionResult:
+                me, inbox = await self.acall_many([
+                    ("whoami", {}),
+                    ("get_inbox", {"limit": 20, "unread_only": True}),
+                ])
+                return self.complete(output={"user": me, "inbox": inbox})
+    
+    Simple pipelines can be declared as ``steps`` instead of code; they are
+    compiled into execute() when the class is created, and finish() turns
+    the collected context into the result:
+    
+            steps = [
+                ToolStep("whoami", store="me"),
+                ToolStep("get_inbox", store="inbox", args={"limit": 20}),
+            ]
+            
+            def finish(self, context: ActionContext) -> ActionResult:
+                return self.complete(output={"unread": context.get("inbox")})
     """
     
     # Override these in subclasses
     name: str = "base_action"
     description: str = "Base action"
     tags: List[str] = []  # For categorization: ["email", "calendar", "lookup"]
+    steps: List[Any] = []  # Optional declarative ToolStep/BranchStep pipeline
+    max_concurrency: int = 8  # Tool calls in flight at once via acall_tool()
+    # Read-only tools whose results are shared across contexts: name -> TTL seconds
+    shared_cache_ttl: Dict[str, float] = {"whoami": 60.0}
     
-    def __init__(self, tool_registry: Dict[str, Callable] = None):
+    def __init__(
+        self,
+        tool_registry: Dict[str, Callable] = None,
+        trace_limit: Optional[int] = None,
+    ):
         """
         Initialize action with tool registry.
         
         Args:
             tool_registry: Dict mapping tool names to callable functions.
                           If None, tools must be set via set_tools().
+            trace_limit: Keep only the most recent N tool calls in the trace
+                        (unbounded if None). Older calls are counted in
+                        ActionResult.dropped_tool_calls.
         """
         self._tools = tool_registry or {}
-        self._tool_calls: List[ToolCall] = []
-        self._start_time: float = 0
+        self._trace_limit = trace_limit or None
+        self._reset_trace()
+        self._start_ns: int = 0
         self._context: Optional[ActionContext] = None
+        self._limiter = asyncio.Semaphore(self.max_concurrency)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "steps" in cls.__dict__ and "execute" not in cls.__dict__:
+            cls.execute = _compile_steps(cls)
+        if cls.execute is Action.execute and cls.aexecute is Action.aexecute:
+            raise TypeError(f"Action {cls.__name__} must implement execute(), aexecute() or steps")
     
     def set_tools(self, tool_registry: Dict[str, Callable]):
         """Set the tool registry (for dependency injection in tests)."""
         self._tools = tool_registry
+        clear_shared_tool_cache()
     
-    def call_tool(self, tool_name: str, **kwargs) -> Any:
+    def call_tool(self, tool_name: str, *, cache: bool = True, **kwargs) -> Any:
         """
         Call a tool and record the invocation.
         
+        Identical calls (same tool and hashable arguments) within one
+        ActionContext return the first call's parsed result without invoking
+        the tool again or adding to the trace.
+        
         Args:
             tool_name: Name of the tool to call
+            cache: Set False for tools that must run every time (side effects)
             **kwargs: Arguments to pass to the tool
             
         Returns:
             Parsed result from the tool (dict if JSON, else raw string)
         """
-        if tool_name not in self._tools:
-            raise ValueError(f"Unknown tool: {tool_name}. Available: {list(self._tools.keys())}")
+        return self._call_tool_fast(tool_name, kwargs, cache)
+    
+    def _call_tool_fast(self, tool_name: str, arguments: Dict[str, Any], cache: bool = True) -> Any:
+        """
+        call_tool() taking an already-built arguments dict.
         
-        start = time.perf_counter()
-        tool_call = ToolCall(tool_name=tool_name, arguments=kwargs)
+        The dict is recorded on the ToolCall as-is, so internal callers such
+        as compiled ``steps`` pipelines can pass a prebuilt dict without
+        re-packing keyword arguments on every call.
+        """
+        fn = self._tools.get(tool_name)
+        if fn is None:
+            raise ValueError(f"Unknown tool: {tool_name}. Available: {sorted(self._tools)}")
+        
+        key = _call_key(tool_name, arguments) if cache else None
+        if key is not None:
+            cached = self._cache_get(fn, key)
+            if cached is not _MISS:
+                return cached
+        
+        start = time.perf_counter_ns()
+        tool_call = ToolCall(tool_name=tool_name, arguments=arguments)
         
         try:
-            result = self._tools[tool_name](**kwargs)
-            tool_call.result = result
+            result = fn(**arguments)
+            tool_call.result = result = self._parse_result(result)
+            if key is not None:
+                self._cache_put(fn, key, result)
+            return result
             
-            # Parse JSON results for easier access
-            if isinstance(result, str):
-                try:
-                    return json.loads(result)
-                except json.JSONDecodeError:
-                    return result
+        except Exception as e:
+            tool_call.error = str(e)
+            logger.error(f"Tool {tool_name} failed: {e}")
+            raise
+        finally:
+            tool_call.duration_ns = time.perf_counter_ns() - start
+            self._record(tool_call)
+    
+    async def acall_tool(self, tool_name: str, *, cache: bool = True, **kwargs) -> Any:
+        """
+        Async counterpart of call_tool().
+        
+        Coroutine tools are awaited directly; regular tools run in a worker
+        thread so that several calls can be in flight at once, bounded by
+        max_concurrency to respect the MCP server's limits.
+        """
+        fn = self._tools.get(tool_name)
+        if fn is None:
+            raise ValueError(f"Unknown tool: {tool_name}. Available: {sorted(self._tools)}")
+        
+        key = _call_key(tool_name, kwargs) if cache else None
+        if key is not None:
+            cached = self._cache_get(fn, key)
+            if cached is not _MISS:
+                return cached
+        
+        start = time.perf_counter_ns()
+        tool_call = ToolCall(tool_name=tool_name, arguments=kwargs)
+        
+        try:
+            async with self._limiter:
+                if inspect.iscoroutinefunction(fn):
+                    result = await fn(**kwargs)
+                else:
+                    result = await asyncio.to_thread(fn, **kwargs)
+            tool_call.result = result = self._parse_result(result)
+            if key is not None:
+                self._cache_put(fn, key, result)
             return result
             
         except Exception as e:
@@ -183,8 +524,92 @@ class Action(ABC):
             logger.error(f"Tool {tool_name} failed: {e}")
             raise
         finally:
-            tool_call.duration_ms = (time.perf_counter() - start) * 1000
-            self._tool_calls.append(tool_call)
+            tool_call.duration_ns = time.perf_counter_ns() - start
+            self._record(tool_call)
+    
+    async def acall_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run independent tool calls concurrently.
+        
+        Args:
+            calls: (tool_name, arguments) pairs
+            
+        Returns:
+            Parsed results in the same order as ``calls``
+        """
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.acall_tool(name, **args)) for name, args in calls]
+        return [task.result() for task in tasks]
+    
+    def _cache_get(self, fn: Callable, key: Tuple) -> Any:
+        """Look a call up in the context cache, then the shared TTL cache."""
+        if self._context is not None:
+            cached = self._context._tool_cache.get(key, _MISS)
+            if cached is not _MISS:
+                return cached
+        if key[0] in self.shared_cache_ttl:
+            entry = _SHARED_TOOL_CACHE.get((fn, key))
+            if entry is not None and entry[0] > time.monotonic():
+                # A copy per caller, so one context's edits don't leak into another's
+                return copy.deepcopy(entry[1])
+        return _MISS
+    
+    def _cache_put(self, fn: Callable, key: Tuple, result: Any):
+        """Remember a successful call's parsed result."""
+        if self._context is not None:
+            self._context._tool_cache[key] = result
+        ttl = self.shared_cache_ttl.get(key[0])
+        if ttl:
+            now = time.monotonic()
+            if len(_SHARED_TOOL_CACHE) >= _SHARED_TOOL_CACHE_SIZE:
+                for stale in [k for k, (expires, _) in _SHARED_TOOL_CACHE.items() if expires <= now]:
+                    del _SHARED_TOOL_CACHE[stale]
+                if len(_SHARED_TOOL_CACHE) >= _SHARED_TOOL_CACHE_SIZE:
+                    # Still full of fresh results: drop the oldest (insertion order)
+                    _SHARED_TOOL_CACHE.pop(next(iter(_SHARED_TOOL_CACHE)))
+            # Keyed on the tool function too, so a new tool registry never sees stale results
+            _SHARED_TOOL_CACHE[(fn, key)] = (now + ttl, copy.deepcopy(result))
+    
+    @staticmethod
+    def _parse_result(result: Any) -> Any:
+        """
+        Parse JSON string/bytes results once, for both the caller and the trace.
+        
+        Anything that is not valid JSON (and every non-string result) is
+        passed through unchanged.
+        """
+        if isinstance(result, (str, bytes)):
+            try:
+                return _loads(result)
+            except ValueError:
+                return result
+        return result
+    
+    def _reset_trace(self):
+        """Start a fresh trace: a bounded ring buffer if trace_limit is set."""
+        self._tool_calls = deque(maxlen=self._trace_limit) if self._trace_limit else []
+        self._dropped_tool_calls = 0
+    
+    def _record(self, tool_call: ToolCall):
+        """Append a call to the trace, counting the one a full buffer evicts."""
+        tool_calls = self._tool_calls
+        if len(tool_calls) == self._trace_limit:
+            self._dropped_tool_calls += 1
+        tool_calls.append(tool_call)
+    
+    def _take_tool_calls(self) -> List[ToolCall]:
+        """
+        Hand the recorded trace over to a result without copying it.
+        
+        run()/arun() are the only entry points and start every execution with
+        a fresh list, so the returned list is never shared with a later one.
+        A bounded trace is materialized into a list here.
+        """
+        tool_calls = self._tool_calls
+        self._tool_calls = []
+        if self._trace_limit:
+            return list(tool_calls)
+        return tool_calls
     
     def complete(
         self,
@@ -192,36 +617,67 @@ class Action(ABC):
         status: ActionStatus = ActionStatus.SUCCESS
     ) -> ActionResult:
         """Create a successful result."""
-        duration = (time.perf_counter() - self._start_time) * 1000
+        duration = time.perf_counter_ns() - self._start_ns
         return ActionResult(
             action_name=self.name,
             status=status,
             output=output,
-            tool_calls=self._tool_calls.copy(),
-            duration_ms=duration,
+            tool_calls=self._take_tool_calls(),
+            dropped_tool_calls=self._dropped_tool_calls,
+            duration_ns=duration,
         )
     
     def fail(self, error: str) -> ActionResult:
         """Create a failed result."""
-        duration = (time.perf_counter() - self._start_time) * 1000
+        duration = time.perf_counter_ns() - self._start_ns
         return ActionResult(
             action_name=self.name,
             status=ActionStatus.FAILED,
             error=error,
-            tool_calls=self._tool_calls.copy(),
-            duration_ms=duration,
+            tool_calls=self._take_tool_calls(),
+            dropped_tool_calls=self._dropped_tool_calls,
+            duration_ns=duration,
         )
     
-    @abstractmethod
     def execute(self, context: ActionContext) -> ActionResult:
         """
         Execute the action.
         
-        Override this method to define your action's logic.
+        Override this method (or aexecute()) to define your action's logic.
         Use self.call_tool() to invoke tools.
         Use self.complete() or self.fail() to return results.
+        
+        The default drives aexecute() on a private event loop, so it must not
+        be called from a running loop - use arun() there instead.
         """
-        pass
+        return asyncio.run(self.aexecute(context))
+    
+    async def aexecute(self, context: ActionContext) -> ActionResult:
+        """
+        Execute the action asynchronously.
+        
+        Override this method to fan out tool calls with acall_tool() or
+        acall_many(). The default runs execute() in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute, context)
+    
+    async def execute_stream(self, context: ActionContext) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the action, yielding progress events as they become ready.
+        
+        Events are dicts with a "type" key; the last one is always
+        ``{"type": "result", "data": ActionResult}``. Override to emit partial
+        results early - the default yields only the final result.
+        """
+        yield {"type": "result", "data": await self.aexecute(context)}
+    
+    def finish(self, context: ActionContext) -> ActionResult:
+        """
+        Build the result of a declarative ``steps`` pipeline.
+        
+        Override to shape the output; the default returns the context variables.
+        """
+        return self.complete(output=dict(context.variables))
     
     def run(self, context: ActionContext) -> ActionResult:
         """
@@ -230,9 +686,11 @@ class Action(ABC):
         This is the main entry point - it wraps execute() with
         timing, error handling, and trace collection.
         """
-        self._tool_calls = []
-        self._start_time = time.perf_counter()
+        self._reset_trace()
+        self._start_ns = time.perf_counter_ns()
         self._context = context
+        # A semaphore binds to the loop it is first used on; start fresh
+        self._limiter = asyncio.Semaphore(self.max_concurrency)
         
         try:
             logger.info(f"Starting action: {self.name}")
@@ -242,6 +700,40 @@ class Action(ABC):
         except Exception as e:
             logger.error(f"Action {self.name} failed: {e}")
             return self.fail(str(e))
+    
+    async def arun(self, context: ActionContext) -> ActionResult:
+        """Async counterpart of run(), wrapping aexecute()."""
+        self._reset_trace()
+        self._start_ns = time.perf_counter_ns()
+        self._context = context
+        # A semaphore binds to the loop it is first used on; start fresh
+        self._limiter = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            logger.info(f"Starting action: {self.name}")
+            result = await self.aexecute(context)
+            logger.info(f"Action {self.name} completed: {result.status.value}")
+            return result
+        except Exception as e:
+            logger.error(f"Action {self.name} failed: {e}")
+            return self.fail(str(e))
+    
+    async def arun_stream(self, context: ActionContext) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming counterpart of arun(), wrapping execute_stream()."""
+        self._reset_trace()
+        self._start_ns = time.perf_counter_ns()
+        self._context = context
+        self._limiter = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            logger.info(f"Starting action: {self.name}")
+            async for event in self.execute_stream(context):
+                if event["type"] == "result":
+                    logger.info(f"Action {self.name} completed: {event['data'].status.value}")
+                yield event
+        except Exception as e:
+            logger.error(f"Action {self.name} failed: {e}")
+            yield {"type": "result", "data": self.fail(str(e))}
 
 
 class ActionRegistry:
@@ -257,6 +749,8 @@ class ActionRegistry:
     def __init__(self):
         self._actions: Dict[str, Type[Action]] = {}
         self._tools: Dict[str, Callable] = {}
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        self._by_tag: Dict[str, List[Type[Action]]] = defaultdict(list)
     
     def register(self, action_class: Type[Action]) -> Type[Action]:
         """
@@ -267,35 +761,59 @@ class ActionRegistry:
             class MyAction(Action):
                 ...
         """
+        action_class.name = sys.intern(action_class.name)
+        previous = self._actions.get(action_class.name)
+        if previous is not None:
+            for tag in previous.tags:
+                self._by_tag[tag].remove(previous)
         self._actions[action_class.name] = action_class
+        for tag in action_class.tags:
+            self._by_tag[tag].append(action_class)
+        self._list_cache = None
         logger.debug(f"Registered action: {action_class.name}")
         return action_class
     
     def set_tools(self, tools: Dict[str, Callable]):
-        """Set the tool registry for all actions."""
-        self._tools = tools
+        """
+        Set the tool registry for all actions.
+        
+        Names are interned so that lookups with the string literals used at
+        call_tool() call sites (interned by the compiler) hit on identity.
+        """
+        self._tools = {sys.intern(name): fn for name, fn in tools.items()}
+        # Results are keyed on the old tool functions; don't keep them alive
+        clear_shared_tool_cache()
     
     def get(self, name: str) -> Optional[Type[Action]]:
         """Get an action class by name."""
         return self._actions.get(name)
     
     def list_actions(self) -> List[Dict[str, Any]]:
-        """List all registered actions with metadata."""
-        return [
-            {
-                "name": ac.name,
-                "description": ac.description,
-                "tags": ac.tags,
-            }
-            for ac in self._actions.values()
-        ]
+        """
+        List all registered actions with metadata.
+        
+        The list is built once and reused until the next register() call;
+        callers must treat it as read-only.
+        """
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "name": ac.name,
+                    "description": ac.description,
+                    "tags": ac.tags,
+                }
+                for ac in self._actions.values()
+            ]
+        return self._list_cache
     
     def find_by_tag(self, tag: str) -> List[Type[Action]]:
-        """Find actions by tag."""
-        return [
-            ac for ac in self._actions.values()
-            if tag in ac.tags
-        ]
+        """
+        Find actions by tag.
+        
+        Served from a reverse index maintained by register(); callers must
+        treat the returned list as read-only.
+        """
+        return self._by_tag.get(tag, [])
     
     def execute(self, action_name: str, context: ActionContext) -> ActionResult:
         """
@@ -314,6 +832,28 @@ class ActionRegistry:
         
         action = action_class(tool_registry=self._tools)
         return action.run(context)
+    
+    async def aexecute(self, action_name: str, context: ActionContext) -> ActionResult:
+        """Async counterpart of execute(), for use inside a running event loop."""
+        action_class = self._actions.get(action_name)
+        if not action_class:
+            raise ValueError(f"Unknown action: {action_name}")
+        
+        action = action_class(tool_registry=self._tools)
+        return await action.arun(context)
+    
+    def astream(self, action_name: str, context: ActionContext) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a registered action, streaming its progress events.
+        
+        Raises ValueError immediately (not on first iteration) for unknown actions.
+        """
+        action_class = self._actions.get(action_name)
+        if not action_class:
+            raise ValueError(f"Unknown action: {action_name}")
+        
+        action = action_class(tool_registry=self._tools)
+        return action.arun_stream(context)
 
 
 # Global registry instance
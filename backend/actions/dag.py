@@ -0,0 +1,105 @@
+"""
+Dependency graphs of action steps.
+
+A DAG declares what each step needs instead of the order to run it in, so
+independent steps (typically tool calls) run concurrently and each step
+starts as soon as its own inputs are ready.
+"""
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    A named unit of work in a DAG.
+    
+    ``fn`` is called with the results of ``depends_on`` as keyword arguments
+    (named after those steps or DAG inputs) and may return a value or an
+    awaitable.
+    """
+    name: str
+    fn: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+class DAG:
+    """
+    A set of steps wired by their dependencies.
+    
+    Example:
+        dag = DAG([
+            Step("me", lambda: self.acall_tool("whoami")),
+            Step("inbox", lambda: self.acall_tool("get_inbox", limit=50)),
+            Step("summary", summarize, depends_on=("me", "inbox")),
+        ])
+        results = await dag.run_async()
+    """
+    
+    def __init__(self, steps: List[Step]):
+        self._order = self._toposort(steps)
+    
+    @staticmethod
+    def _toposort(steps: List[Step]) -> List[Step]:
+        """Order steps so every dependency precedes its dependents."""
+        by_name: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in by_name:
+                raise ValueError(f"Duplicate step: {step.name}")
+            by_name[step.name] = step
+        
+        order: List[Step] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+        
+        def visit(step: Step):
+            if state.get(step.name) == 2:
+                return
+            if state.get(step.name) == 1:
+                raise ValueError(f"Dependency cycle through step: {step.name}")
+            state[step.name] = 1
+            for dep in step.depends_on:
+                if dep in by_name:
+                    visit(by_name[dep])
+            state[step.name] = 2
+            order.append(step)
+        
+        for step in steps:
+            visit(step)
+        return order
+    
+    async def run_async(self, **inputs: Any) -> Dict[str, Any]:
+        """
+        Run every step, each as soon as its dependencies have finished.
+        
+        Args:
+            **inputs: Values available to steps as dependencies by name
+        
+        Returns:
+            The inputs plus every step's result, keyed by name
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        async def run(step: Step) -> Any:
+            kwargs = {}
+            for dep in step.depends_on:
+                if dep in tasks:
+                    kwargs[dep] = await tasks[dep]
+                elif dep in inputs:
+                    kwargs[dep] = inputs[dep]
+                else:
+                    raise ValueError(f"Step {step.name} depends on unknown {dep!r}")
+            result = step.fn(**kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        
+        async with asyncio.TaskGroup() as tg:
+            for step in self._order:
+                tasks[step.name] = tg.create_task(run(step))
+        
+        results = dict(inputs)
+        results.update((name, task.result()) for name, task in tasks.items())
+        return results
@@ -5,8 +5,204 @@ These actions show how to compose tool calls into reusable workflows.
 Each action is self-documenting and testable.
 """
 
-from typing import Any, Dict, List
-from backend.actions.base import Action, ActionContext, ActionResult, ActionStatus, registry
+import asyncio
+import re
+import warnings
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
+from backend.actions.base import (
+    Action,
+    ActionContext,
+    ActionResult,
+    ActionStatus,
+    ToolStep,
+    registry,
+)
+from backend.actions.dag import DAG, Step
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; overlaps are compared pairwise in Python
+    np = None
+
+# Words of 3+ letters in lowercased text
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Leading reply/forward markers, possibly stacked ("RE: Fwd: ...")
+_REPLY_PREFIX_RE = re.compile(r'^(?:(?:re|fwd?)\s*:\s*)+', re.IGNORECASE)
+
+# Maximal runs of 3+ letters: any keyword found in a text lies inside one
+_LETTER_RUN_RE = re.compile(r'[a-z]{3,}')
+
+# Common words to ignore when extracting meeting keywords
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "need",
+    "meeting", "call", "sync", "discussion", "review", "update", "weekly",
+    "monthly", "daily", "team", "group", "re", "fwd", "fw"
+})
+
+# Below this many meetings the pairwise Python scan beats building arrays
+_VECTORIZE_MIN_MEETINGS = 16
+
+
+@lru_cache(maxsize=512)
+def _extract_keywords(subject: str, body: str) -> Tuple[str, ...]:
+    """
+    Extract up to 10 meaningful keywords from meeting subject and body.
+    
+    Memoized: a meeting's keywords are needed both for its briefing and
+    for conflict alternatives, so the second extraction is a cache hit.
+    """
+    keywords = []
+    seen = set()
+    for word in _WORD_RE.findall(f"{subject} {body}".lower()):
+        if word not in _STOPWORDS and word not in seen:
+            seen.add(word)
+            keywords.append(word)
+    return tuple(keywords[:10])
+
+
+def _overlapping_pairs(meetings: List[Dict[str, Any]]) -> List[Tuple[int, int]]:
+    """
+    Return (i, j) index pairs, i < j, of meetings whose times overlap.
+    
+    Large calendars with complete, parseable times are checked with one
+    NumPy broadcast over datetime64 arrays; otherwise (or without NumPy)
+    the ISO strings are compared pairwise, falling back to equal start
+    times when an end is missing.
+    """
+    starts = [m.get("start", "") for m in meetings]
+    ends = [m.get("end", "") for m in meetings]
+    
+    if np is not None and len(meetings) >= _VECTORIZE_MIN_MEETINGS and all(starts) and all(ends):
+        try:
+            with warnings.catch_warnings():
+                # Timezone-suffixed strings parse (as UTC) with a DeprecationWarning
+                warnings.simplefilter("ignore", DeprecationWarning)
+                start_arr = np.array(starts, dtype="datetime64[s]")
+                end_arr = np.array(ends, dtype="datetime64[s]")
+        except ValueError:
+            pass  # Malformed timestamp: use the string comparison below
+        else:
+            overlap = (start_arr[:, None] < end_arr[None, :]) & (start_arr[None, :] < end_arr[:, None])
+            rows, cols = np.nonzero(np.triu(overlap, k=1))
+            return list(zip(rows.tolist(), cols.tolist()))
+    
+    pairs = []
+    count = len(meetings)
+    for i in range(count):
+        start1, end1 = starts[i], ends[i]
+        for j in range(i + 1, count):
+            start2, end2 = starts[j], ends[j]
+            # Simple string comparison works for ISO format times
+            # Overlap if: start1 < end2 AND start2 < end1
+            if start1 and start2 and end1 and end2:
+                if start1 < end2 and start2 < end1:
+                    pairs.append((i, j))
+            elif start1 and start2:
+                # Fallback: check if start times are the same
+                if start1 == start2:
+                    pairs.append((i, j))
+    return pairs
+
+
+def _principals(value: Any) -> Set[str]:
+    """
+    Normalize an attendee/recipient field to lowercased names and addresses.
+    
+    Accepts a list of names or {"name", "email"} dicts, or a single
+    ';'-separated string as returned by the Exchange tools.
+    """
+    if not value:
+        return set()
+    if isinstance(value, str):
+        value = value.split(";")
+    principals = set()
+    for item in value:
+        if isinstance(item, dict):
+            principals.add(str(item.get("name", "")).strip().lower())
+            principals.add(str(item.get("email", "")).strip().lower())
+        else:
+            principals.add(str(item).strip().lower())
+    principals.discard("")
+    return principals
+
+
+class _EmailPool:
+    """
+    Lowercased email pool with inverted indexes for per-meeting scans.
+    
+    Built once per briefing so each meeting only visits the emails that
+    can match it instead of rescanning (and re-lowering) the whole pool.
+    """
+    
+    def __init__(self, emails: List[Dict]):
+        self.emails: List[Dict[str, Any]] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)  # letter run -> email indexes
+        self.by_principal: Dict[str, List[int]] = defaultdict(list)  # lowercased sender/recipient -> indexes
+        self._keyword_hits: Dict[str, Set[int]] = {}
+        
+        for i, email in enumerate(emails):
+            sender = email.get("from", {})
+            if isinstance(sender, dict):
+                sender_name = sender.get("name", "")
+                sender_email = sender.get("email", "")
+            else:
+                sender_name = str(sender)
+                sender_email = ""
+            subject_lc = email.get("subject", "").lower()
+            body_lc = email.get("bodyPreview", email.get("body", "")).lower()
+            prepped = {
+                "text_lc": f"{subject_lc} {body_lc}",
+                "sender_name": sender_name,
+                "sender_name_lc": sender_name.lower(),
+                "sender_email": sender_email,
+                "orig": email,
+            }
+            self.emails.append(prepped)
+            
+            for token in set(_LETTER_RUN_RE.findall(prepped["text_lc"])):
+                self.postings[token].append(i)
+            principals = _principals(email.get("to"))
+            principals.update((prepped["sender_name_lc"], sender_email.lower()))
+            principals.discard("")
+            for principal in principals:
+                self.by_principal[principal].append(i)
+    
+    def __len__(self) -> int:
+        return len(self.emails)
+    
+    def keyword_matches(self, keywords) -> List[Tuple[int, Set[str]]]:
+        """
+        (index, matched keywords) for each email containing any keyword, in pool order.
+        
+        Matching is pure set work over the posting lists; no email text is
+        scanned per meeting.
+        """
+        matches: Dict[int, Set[str]] = defaultdict(set)
+        for kw in keywords:
+            hits = self._keyword_hits.get(kw)
+            if hits is None:
+                # Substring semantics: expand the keyword over the vocabulary once
+                hits = set()
+                for token, indexes in self.postings.items():
+                    if kw in token:
+                        hits.update(indexes)
+                self._keyword_hits[kw] = hits
+            for i in hits:
+                matches[i].add(kw)
+        return sorted(matches.items())
+    
+    def involving(self, principals: Set[str]) -> List[int]:
+        """Indexes, in pool order, of emails sent by or to any of the principals."""
+        found: Set[int] = set()
+        for principal in principals:
+            found.update(self.by_principal.get(principal, ()))
+        return sorted(found)
 
 
 @registry.register
@@ -24,17 +220,15 @@ class DailySummaryAction(Action):
     description = "Generate a daily summary of emails and meetings"
     tags = ["email", "calendar", "summary"]
     
-    def execute(self, context: ActionContext) -> ActionResult:
-        # Step 1: Get user info
-        me = self.call_tool("whoami")
+    async def aexecute(self, context: ActionContext) -> ActionResult:
+        # Steps 1-3: Get user info, today's meetings and unread emails concurrently
+        me, meetings, inbox = await self.acall_many([
+            ("whoami", {}),
+            ("get_todays_meetings", {}),
+            ("get_inbox", {"limit": 20, "unread_only": True}),
+        ])
         context.set("user", me)
-        
-        # Step 2: Get today's meetings
-        meetings = self.call_tool("get_todays_meetings")
         context.set("meetings", meetings)
-        
-        # Step 3: Get unread emails
-        inbox = self.call_tool("get_inbox", limit=20, unread_only=True)
         context.set("inbox", inbox)
         
         # Step 4: Compile summary
@@ -81,10 +275,8 @@ class EmailThreadAction(Action):
         
         # Step 2: Search for related emails
         subject = email.get("subject", "")
-        # Remove Re:/Fwd: prefixes for search
-        clean_subject = subject
-        for prefix in ["Re: ", "RE: ", "Fwd: ", "FWD: ", "Fw: "]:
-            clean_subject = clean_subject.replace(prefix, "")
+        # Remove leading Re:/Fwd: prefixes for search
+        clean_subject = _REPLY_PREFIX_RE.sub("", subject, count=1)
         
         related = self.call_tool("search_emails", query=clean_subject, limit=10)
         
@@ -114,37 +306,35 @@ class MeetingPrepAction(Action):
     description = "Prepare background info for a meeting"
     tags = ["calendar", "email", "lookup"]
     
-    def execute(self, context: ActionContext) -> ActionResult:
+    async def aexecute(self, context: ActionContext) -> ActionResult:
         meeting_id = context.get("meeting_id")
         if not meeting_id:
             # If no specific meeting, get next meeting
-            today = self.call_tool("get_todays_meetings")
+            today = await self.acall_tool("get_todays_meetings")
             if today.get("meetings"):
                 meeting = today["meetings"][0]
             else:
-                calendar = self.call_tool("get_calendar", days=7)
+                calendar = await self.acall_tool("get_calendar", days=7)
                 if calendar.get("meetings"):
                     meeting = calendar["meetings"][0]
                 else:
                     return self.fail("No upcoming meetings found")
         else:
-            meetings = self.call_tool("search_meetings", query=meeting_id, limit=1)
+            meetings = await self.acall_tool("search_meetings", query=meeting_id, limit=1)
             if not meetings.get("results"):
                 return self.fail(f"Meeting not found: {meeting_id}")
             meeting = meetings["results"][0]
         
         context.set("meeting", meeting)
         
-        # Search for relevant emails
+        # Search for relevant emails and look up the organizer concurrently
         subject = meeting.get("subject", "")
-        related_emails = self.call_tool("search_emails", query=subject, limit=5)
-        
-        # Look up organizer
         organizer_name = meeting.get("organizer", "")
+        calls = [("search_emails", {"query": subject, "limit": 5})]
         if organizer_name:
-            organizer = self.call_tool("find_colleague", name=organizer_name)
-        else:
-            organizer = None
+            calls.append(("find_colleague", {"name": organizer_name}))
+        related_emails, *rest = await self.acall_many(calls)
+        organizer = rest[0] if rest else None
         
         prep = {
             "meeting": meeting,
@@ -170,24 +360,23 @@ class ColleagueLookupAction(Action):
     description = "Look up a colleague with recent interactions"
     tags = ["lookup", "email", "calendar"]
     
-    def execute(self, context: ActionContext) -> ActionResult:
+    async def aexecute(self, context: ActionContext) -> ActionResult:
         name = context.get("colleague_name")
         if not name:
             return self.fail("colleague_name required in context")
         
         # Step 1: Find the colleague
-        colleague = self.call_tool("find_colleague", name=name)
+        colleague = await self.acall_tool("find_colleague", name=name)
         if colleague.get("error") or not colleague.get("name"):
             return self.fail(f"Colleague not found: {name}")
         
         context.set("colleague", colleague)
         
-        # Step 2: Find recent emails
-        email_query = f"from:{name} OR to:{name}"
-        emails = self.call_tool("search_emails", query=name, limit=10)
-        
-        # Step 3: Find meetings together
-        meetings = self.call_tool("search_meetings", query=name, limit=5)
+        # Steps 2-3: Find recent emails and meetings together, concurrently
+        emails, meetings = await self.acall_many([
+            ("search_emails", {"query": name, "limit": 10}),
+            ("search_meetings", {"query": name, "limit": 5}),
+        ])
         
         result = {
             "colleague": colleague,
@@ -212,13 +401,15 @@ class InboxTriageAction(Action):
     description = "Triage unread inbox by priority"
     tags = ["email", "summary"]
     
-    def execute(self, context: ActionContext) -> ActionResult:
+    steps = [
         # Get user info for context
-        me = self.call_tool("whoami")
-        my_dept = me.get("department", "")
-        
+        ToolStep("whoami", store="me"),
         # Get unread inbox
-        inbox = self.call_tool("get_inbox", limit=50, unread_only=True)
+        ToolStep("get_inbox", store="inbox", args={"limit": 50, "unread_only": True}),
+    ]
+    
+    def finish(self, context: ActionContext) -> ActionResult:
+        inbox = context.get("inbox")
         emails = inbox.get("emails", [])
         
         # Categorize
@@ -260,45 +451,78 @@ class DailyBriefingAction(Action):
     4. Identifying key collaborators and recent findings
     5. Compiling a formatted briefing document
     
-    Output is structured for printing/carrying to meetings.
+    Output is structured for printing/carrying to meetings. Set
+    ``format="json"`` in the context to skip rendering the printable text
+    ("print_ready") when only the structured briefings are needed.
+    
+    execute_stream() yields each meeting's briefing as soon as it is ready,
+    then the conflicts, then the final result.
     """
     name = "daily_briefing"
     description = "Generate printable meeting intelligence briefing for today"
     tags = ["calendar", "email", "search", "prep", "briefing"]
     
-    def execute(self, context: ActionContext) -> ActionResult:
-        # Step 1: Get user info and today's meetings
-        me = self.call_tool("whoami")
+    async def aexecute(self, context: ActionContext) -> ActionResult:
+        result = None
+        async for event in self.execute_stream(context):
+            if event["type"] == "result":
+                result = event["data"]
+        return result
+    
+    async def execute_stream(self, context: ActionContext) -> AsyncIterator[Dict[str, Any]]:
+        # Steps 1-2: Fetch user info, today's meetings and recent email together;
+        # the pool is built as soon as inbox and sent have both arrived
+        fetched = await DAG([
+            Step("me", lambda: self.acall_tool("whoami")),
+            Step("today_meetings", lambda: self.acall_tool("get_todays_meetings")),
+            Step("inbox", lambda: self.acall_tool("get_inbox", limit=50, unread_only=False)),
+            Step("sent", lambda: self.acall_tool("get_sent", limit=30)),
+            Step(
+                "emails",
+                lambda inbox, sent: inbox.get("emails", []) + sent.get("emails", []),
+                depends_on=("inbox", "sent"),
+            ),
+            # Lowercase and index the pool once instead of rescanning it per meeting
+            Step("pool", _EmailPool, depends_on=("emails",)),
+        ]).run_async()
+        me = fetched["me"]
+        today_meetings = fetched["today_meetings"]
         context.set("user", me)
         
-        today_meetings = self.call_tool("get_todays_meetings")
         meetings = today_meetings.get("meetings", [])
         
         if not meetings:
-            return self.complete(output={
+            yield {"type": "result", "data": self.complete(output={
                 "date": today_meetings.get("date", "today"),
                 "user": me.get("name"),
                 "message": "No meetings scheduled for today.",
                 "briefings": []
-            })
+            })}
+            return
         
         context.set("meetings_count", len(meetings))
-        
-        # Step 2: Get recent emails from inbox and sent
-        inbox = self.call_tool("get_inbox", limit=50, unread_only=False)
-        sent = self.call_tool("get_sent", limit=30)
-        
-        all_recent_emails = inbox.get("emails", []) + sent.get("emails", [])
-        context.set("email_pool_size", len(all_recent_emails))
-        
-        # Step 3: Process each meeting
-        briefings = []
-        for meeting in meetings:
-            briefing = self._process_meeting(meeting, all_recent_emails, context)
-            briefings.append(briefing)
+        context.set("email_pool_size", len(fetched["emails"]))
+        pool = fetched["pool"]
+        
+        # Step 3: Process meetings concurrently, emitting each briefing as it completes
+        async def process(index: int, meeting: Dict[str, Any]):
+            return index, await self._process_meeting(meeting, pool, context)
+        
+        tasks = [asyncio.create_task(process(i, m)) for i, m in enumerate(meetings)]
+        briefings: List[Dict[str, Any]] = [None] * len(meetings)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, briefing = await next_done
+                briefings[index] = briefing
+                yield {"type": "briefing", "index": index, "data": briefing}
+        finally:
+            # Consumer went away or a meeting failed: don't leave searches running
+            for task in tasks:
+                task.cancel()
         
         # Step 4: Detect scheduling conflicts and suggest alternatives
-        conflicts = self._detect_conflicts(meetings, all_recent_emails)
+        conflicts = self._detect_conflicts(meetings, pool)
+        yield {"type": "conflicts", "data": conflicts}
         
         # Step 5: Compile final briefing document
         output = {
@@ -308,62 +532,55 @@ class DailyBriefingAction(Action):
             "meetings_count": len(meetings),
             "conflicts": conflicts,
             "briefings": briefings,
-            "print_ready": self._format_for_print(briefings, me, today_meetings.get("date"), conflicts),
         }
+        if context.get("format", "both") != "json":
+            output["print_ready"] = self._format_for_print(briefings, me, today_meetings.get("date"), conflicts)
         
-        return self.complete(output=output)
+        yield {"type": "result", "data": self.complete(output=output)}
     
-    def _detect_conflicts(self, meetings: List[Dict[str, Any]], emails: List[Dict] = None) -> List[Dict[str, Any]]:
+    def _detect_conflicts(self, meetings: List[Dict[str, Any]], emails: "_EmailPool" = None) -> List[Dict[str, Any]]:
         """Detect overlapping meetings and suggest alternative contributors."""
         conflicts = []
         
-        # Parse meeting times and check for overlaps
-        for i, m1 in enumerate(meetings):
-            for m2 in meetings[i+1:]:
-                start1 = m1.get("start", "")
-                end1 = m1.get("end", "")
-                start2 = m2.get("start", "")
-                end2 = m2.get("end", "")
-                
-                is_conflict = False
-                # Simple string comparison works for ISO format times
-                # Overlap if: start1 < end2 AND start2 < end1
-                if start1 and start2 and end1 and end2:
-                    if start1 < end2 and start2 < end1:
-                        is_conflict = True
-                elif start1 and start2:
-                    # Fallback: check if start times are the same
-                    if start1 == start2:
-                        is_conflict = True
-                
-                if is_conflict:
-                    conflict = {
-                        "meeting1": m1.get("subject", "Unknown"),
-                        "meeting2": m2.get("subject", "Unknown"),
-                        "time1": start1,
-                        "time2": start2,
-                        "alternatives1": [],
-                        "alternatives2": [],
-                    }
-                    
-                    # Find alternative contributors for each conflicting meeting
-                    if emails:
-                        conflict["alternatives1"] = self._find_alternative_contributors(
-                            m1, emails, exclude=m1.get("attendees", [])
-                        )
-                        conflict["alternatives2"] = self._find_alternative_contributors(
-                            m2, emails, exclude=m2.get("attendees", [])
-                        )
-                    
-                    conflicts.append(conflict)
+        # A meeting in several conflicts gets the same alternatives each time
+        alternatives: Dict[int, List[Dict]] = {}
+        
+        def alternatives_for(index: int) -> List[Dict]:
+            if index not in alternatives:
+                meeting = meetings[index]
+                alternatives[index] = self._find_alternative_contributors(
+                    meeting, emails, exclude=meeting.get("attendees", [])
+                )
+            return alternatives[index]
+        
+        # Find overlapping pairs, then build results for the (few) real conflicts
+        for i, j in _overlapping_pairs(meetings):
+            m1, m2 = meetings[i], meetings[j]
+            conflict = {
+                "meeting1": m1.get("subject", "Unknown"),
+                "meeting2": m2.get("subject", "Unknown"),
+                "time1": m1.get("start", ""),
+                "time2": m2.get("start", ""),
+                "alternatives1": [],
+                "alternatives2": [],
+            }
+            
+            # Find alternative contributors for each conflicting meeting
+            if emails:
+                conflict["alternatives1"] = alternatives_for(i)
+                conflict["alternatives2"] = alternatives_for(j)
+            
+            conflicts.append(conflict)
         
         return conflicts
     
-    def _find_alternative_contributors(self, meeting: Dict[str, Any], emails: List[Dict], exclude: List = None) -> List[Dict]:
+    def _find_alternative_contributors(self, meeting: Dict[str, Any], emails: "_EmailPool", exclude: List = None) -> List[Dict]:
         """Find people discussing related topics who could potentially attend instead."""
         subject = meeting.get("subject", "")
         body = meeting.get("body", "")
-        keywords = self._extract_keywords(subject, body)
+        keywords = _extract_keywords(subject, body)
+        if not keywords:
+            return []  # Nothing can match; skip building the exclude set
         
         # Get names to exclude (current attendees)
         exclude_names = set()
@@ -372,41 +589,33 @@ class DailyBriefingAction(Action):
                 name = a.get("name", a) if isinstance(a, dict) else str(a)
                 exclude_names.add(name.lower())
         
-        # Find people in emails matching meeting keywords
-        contributor_scores = {}
-        
-        for email in emails:
-            email_subject = email.get("subject", "").lower()
-            email_body = email.get("bodyPreview", email.get("body", "")).lower()
-            email_text = f"{email_subject} {email_body}"
-            
-            # Check if email relates to meeting topics
-            keyword_matches = sum(1 for kw in keywords if kw in email_text)
-            if keyword_matches == 0:
-                continue
-            
-            # Get sender
-            sender = email.get("from", {})
-            sender_name = sender.get("name", "") if isinstance(sender, dict) else str(sender)
-            sender_email = sender.get("email", "") if isinstance(sender, dict) else ""
-            
-            if sender_name and sender_name.lower() not in exclude_names:
-                key = sender_name
-                if key not in contributor_scores:
-                    contributor_scores[key] = {"name": sender_name, "email": sender_email, "score": 0, "topics": set()}
-                contributor_scores[key]["score"] += keyword_matches
-                contributor_scores[key]["topics"].update(kw for kw in keywords if kw in email_text)
-        
-        # Sort by score and return top alternatives
-        alternatives = sorted(contributor_scores.values(), key=lambda x: x["score"], reverse=True)[:3]
-        
-        # Convert topics set to list for JSON serialization
-        for alt in alternatives:
-            alt["topics"] = list(alt["topics"])[:3]
-        
-        return alternatives
+        # Find people in emails matching meeting keywords; scores, topics and
+        # contact details are kept in parallel maps keyed by sender name
+        scores: Counter = Counter()
+        topics: Dict[str, Set[str]] = defaultdict(set)
+        sender_emails: Dict[str, str] = {}
+        
+        # Only emails sharing a keyword with the meeting can score
+        for i, matched in emails.keyword_matches(keywords):
+            email = emails.emails[i]
+            sender_name = email["sender_name"]
+            if sender_name and email["sender_name_lc"] not in exclude_names:
+                scores[sender_name] += len(matched)
+                topics[sender_name] |= matched
+                sender_emails.setdefault(sender_name, email["sender_email"])
+        
+        # Materialize only the top alternatives (topics as a list for JSON)
+        return [
+            {
+                "name": name,
+                "email": sender_emails[name],
+                "score": score,
+                "topics": list(topics[name])[:3],
+            }
+            for name, score in scores.most_common(3)
+        ]
     
-    def _process_meeting(self, meeting: Dict[str, Any], emails: List[Dict], context: ActionContext) -> Dict[str, Any]:
+    async def _process_meeting(self, meeting: Dict[str, Any], emails: "_EmailPool", context: ActionContext) -> Dict[str, Any]:
         """Process a single meeting and gather intelligence."""
         subject = meeting.get("subject", "")
         attendees = meeting.get("attendees", [])
@@ -415,41 +624,34 @@ class DailyBriefingAction(Action):
         body = meeting.get("body", "")
         
         # Extract keywords from subject and body for searching
-        keywords = self._extract_keywords(subject, body)
+        keywords = _extract_keywords(subject, body)
         
         # Find emails involving attendees
         attendee_emails = []
+        if isinstance(attendees, str):
+            attendees = [a.strip() for a in attendees.split(";") if a.strip()]
         attendee_names = [a.get("name", a) if isinstance(a, dict) else a for a in attendees]
         
-        for email in emails:
-            sender = email.get("from", {})
-            sender_name = sender.get("name", "") if isinstance(sender, dict) else str(sender)
-            recipients = email.get("to", [])
-            
-            # Check if any attendee is involved
-            involved = False
-            for attendee in attendee_names:
-                if attendee and (
-                    attendee.lower() in sender_name.lower() or
-                    any(attendee.lower() in str(r).lower() for r in recipients)
-                ):
-                    involved = True
-                    break
-            
-            if involved:
-                attendee_emails.append(email)
+        # Exact name/address matches; substring matching let "Al" match "Alice"
+        for i in emails.involving(_principals(attendees)):
+            attendee_emails.append(emails.emails[i]["orig"])
         
         # Search for topic-related emails
         topic_emails = []
         if keywords:
-            search_result = self.call_tool("search_emails", query=" ".join(keywords[:3]), limit=10)
+            search_result = await self.acall_tool("search_emails", query=" ".join(keywords[:3]), limit=10)
             topic_emails = search_result.get("results", [])
         
+        # Resolve each related email's sender once for both passes below
+        related = attendee_emails + topic_emails
+        sender_names = []
+        for email in related:
+            sender = email.get("from", {})
+            sender_names.append(sender.get("name", "") if isinstance(sender, dict) else str(sender))
+        
         # Identify key collaborators (most frequent in related emails)
         collaborator_counts = {}
-        for email in attendee_emails + topic_emails:
-            sender = email.get("from", {})
-            sender_name = sender.get("name", "") if isinstance(sender, dict) else str(sender)
+        for sender_name in sender_names:
             if sender_name:
                 collaborator_counts[sender_name] = collaborator_counts.get(sender_name, 0) + 1
         
@@ -463,15 +665,16 @@ class DailyBriefingAction(Action):
         # Extract findings (recent email snippets)
         findings = []
         seen_subjects = set()
-        for email in (attendee_emails + topic_emails)[:10]:
+        for email, sender_name in zip(related[:10], sender_names):
             email_subject = email.get("subject", "")
             if email_subject not in seen_subjects:
                 seen_subjects.add(email_subject)
+                preview = email.get("bodyPreview") or email.get("body") or ""
                 findings.append({
                     "subject": email_subject,
-                    "from": email.get("from", {}).get("name", "") if isinstance(email.get("from"), dict) else str(email.get("from", "")),
+                    "from": sender_name,
                     "date": email.get("received", email.get("sent", "")),
-                    "preview": email.get("bodyPreview", email.get("body", ""))[:150] + "..." if len(email.get("bodyPreview", email.get("body", ""))) > 150 else email.get("bodyPreview", email.get("body", "")),
+                    "preview": preview[:150] + "..." if len(preview) > 150 else preview,
                 })
         
         return {
@@ -482,7 +685,7 @@ class DailyBriefingAction(Action):
                 "attendees": attendee_names,
                 "location": meeting.get("location", ""),
             },
-            "agenda_keywords": keywords,
+            "agenda_keywords": list(keywords),
             "key_collaborators": [{"name": name, "email_count": count} for name, count in key_collaborators],
             "related_findings": findings[:5],
             "email_count": {
@@ -491,35 +694,6 @@ class DailyBriefingAction(Action):
             },
         }
     
-    def _extract_keywords(self, subject: str, body: str) -> List[str]:
-        """Extract meaningful keywords from meeting subject and body."""
-        # Common words to ignore
-        stopwords = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-            "be", "have", "has", "had", "do", "does", "did", "will", "would",
-            "could", "should", "may", "might", "must", "shall", "can", "need",
-            "meeting", "call", "sync", "discussion", "review", "update", "weekly",
-            "monthly", "daily", "team", "group", "re", "fwd", "fw"
-        }
-        
-        # Combine and clean text
-        text = f"{subject} {body}".lower()
-        
-        # Extract words
-        import re
-        words = re.findall(r'\b[a-z]{3,}\b', text)
-        
-        # Filter and dedupe
-        keywords = []
-        seen = set()
-        for word in words:
-            if word not in stopwords and word not in seen:
-                seen.add(word)
-                keywords.append(word)
-        
-        return keywords[:10]
-    
     def _format_for_print(self, briefings: List[Dict], user: Dict, date: str, conflicts: List[Dict] = None) -> str:
         """Format briefings as printable text."""
         lines = [
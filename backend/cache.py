@@ -0,0 +1,82 @@
+"""
+Short-lived in-process cache for read-only API responses.
+
+The dashboard and UI poll the same GET endpoints every few seconds; caching
+their payloads briefly turns most polls into a dict lookup. Concurrent misses
+on a key share a single load, and writers invalidate by key prefix.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+# Entries (or locks) beyond this trigger a sweep; keys embed query params, so
+# clients can mint new keys and the oldest fresh entries are evicted if need be
+MAX_ENTRIES = 1024
+
+_entries: Dict[str, Tuple[float, Any]] = {}  # key -> (expires_at, value)
+_locks: Dict[str, asyncio.Lock] = {}
+_generation = 0  # bumped by invalidate() so in-flight loads don't store stale values
+
+
+def _fresh(key: str) -> Tuple[bool, Any]:
+    """Return (True, value) for an unexpired entry, else (False, None)."""
+    entry = _entries.get(key)
+    if entry and entry[0] > time.monotonic():
+        return True, entry[1]
+    return False, None
+
+
+async def cached(key: str, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return the value cached under key, loading it when missing or expired.
+    
+    Args:
+        key: Cache key, e.g. "fb:recent:50"
+        ttl: Seconds a loaded value stays fresh
+        loader: Coroutine function producing the value
+    
+    Returns:
+        The cached or freshly loaded value
+    """
+    hit, value = _fresh(key)
+    if hit:
+        return value
+    
+    if len(_locks) >= MAX_ENTRIES:
+        _sweep()
+    async with _locks.setdefault(key, asyncio.Lock()):
+        # Another request may have loaded it while we waited
+        hit, value = _fresh(key)
+        if hit:
+            return value
+        
+        generation = _generation
+        value = await loader()
+        if generation == _generation:
+            if len(_entries) >= MAX_ENTRIES:
+                _sweep()
+            _entries[key] = (time.monotonic() + ttl, value)
+        return value
+
+
+def invalidate(*prefixes: str):
+    """Drop every entry whose key starts with one of the prefixes."""
+    global _generation
+    _generation += 1
+    for key in [k for k in _entries if k.startswith(prefixes)]:
+        del _entries[key]
+
+
+def _sweep():
+    """Remove expired entries (then the soonest to expire, if still full) and idle locks."""
+    now = time.monotonic()
+    for key in [k for k, (expires_at, _) in _entries.items() if expires_at <= now]:
+        del _entries[key]
+    if len(_entries) >= MAX_ENTRIES:
+        # Evict down to 3/4 full so the next few stores don't sweep again
+        by_expiry = sorted(_entries, key=lambda k: _entries[k][0])
+        for key in by_expiry[:len(_entries) - MAX_ENTRIES * 3 // 4]:
+            del _entries[key]
+    for key in [k for k, lock in _locks.items() if not lock.locked() and k not in _entries]:
+        del _locks[key]
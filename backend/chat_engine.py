@@ -5,32 +5,187 @@ Wraps LangChain functionality for use by the backend server.
 Supports multiple LLM providers: Ollama (local) or OpenAI-compatible APIs.
 """
 
+import asyncio
+import hashlib
+import importlib
 import json
 import logging
 import os
 import warnings
-from typing import Optional, Tuple, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple, List
 
-from langchain_core.tools import tool
-from langchain_core.language_models.chat_models import BaseChatModel
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-# Suppress LangGraph deprecation warning
-warnings.filterwarnings("ignore", message=".*create_react_agent.*")
-from langgraph.prebuilt import create_react_agent
+from backend.semantic_cache import SemanticCache
 
-# Import MCP server components (initialized by backend.server)
-from exchange_mcp_server import server as mcp_server
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
 
 logger = logging.getLogger("exchange-backend.chat")
 
 
+def _dump(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dump_listing(head: Dict[str, Any], key: str, rows: List[str]) -> str:
+    """
+    Serialize head plus a list of pre-serialized rows, matching _dump's layout.
+    
+    Args:
+        head: Scalar fields written before the list
+        key: Name of the list field
+        rows: Row fragments from the _*_fragment helpers below
+    """
+    parts = ["{\n"]
+    for name, value in head.items():
+        parts.append(f"  {_dump(name)}: {_dump(value)},\n")
+    if rows:
+        parts.append(f"  {_dump(key)}: [\n" + ",\n".join(rows) + "\n  ]\n}")
+    else:
+        parts.append(f"  {_dump(key)}: []\n}}")
+    return "".join(parts)
+
+
+def _fragment(row: Dict[str, Any]) -> str:
+    """Serialize a row as it appears nested inside a _dump_listing list."""
+    return "    " + _dump(row).replace("\n", "\n    ")
+
+
+# Listing rows are deterministic in their fields, so each distinct row is
+# serialized once; a changed field (e.g. is_read) is simply a new cache key.
+
+@lru_cache(maxsize=4096)
+def _inbox_fragment(id_, subject, sender, date, is_read, importance, preview) -> str:
+    return _fragment({
+        "id": id_,
+        "subject": subject,
+        "from": sender,
+        "date": date,
+        "is_read": is_read,
+        "importance": importance,
+        "preview": preview
+    })
+
+
+@lru_cache(maxsize=4096)
+def _sent_fragment(id_, subject, recipient, date, snippet) -> str:
+    return _fragment({
+        "id": id_,
+        "subject": subject,
+        "to": recipient,
+        "date": date,
+        "preview": snippet
+    })
+
+
+@lru_cache(maxsize=4096)
+def _meeting_fragment(id_, subject, organizer, start, end, location) -> str:
+    return _fragment({
+        "id": id_,
+        "subject": subject,
+        "organizer": organizer,
+        "start": start,
+        "end": end,
+        "location": location
+    })
+
+
+# Small local models sometimes pass None or an empty schema object ({}) for
+# optional tool arguments, so tools coerce their inputs instead of failing.
+
+def _coerce_int(value: Any, default: int) -> int:
+    """Return value as an int, or default if it is missing or not numeric."""
+    if type(value) is int:
+        return value
+    if value is None or isinstance(value, dict):
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _coerce_bool(value: Any, default: bool = False) -> bool:
+    """Return value as given, or default if it is missing."""
+    if value is None or isinstance(value, dict):
+        return default
+    return value
+
+
+def _coerce_str(value: Any) -> Optional[str]:
+    """Return value as a str, or None if it is missing."""
+    if value is None or isinstance(value, dict):
+        return None
+    return str(value)
+
+# provider -> (module, class name, pip package); "ollama" is the default
+_LLM_PROVIDERS = {
+    "openai": ("langchain_openai", "ChatOpenAI", "langchain-openai"),
+    "ollama": ("langchain_ollama", "ChatOllama", "langchain-ollama"),
+}
+
+# Chat model classes imported so far, and clients built by create_llm()
+_LLM_CLASS_CACHE: Dict[str, type] = {}
+_LLM_INSTANCE_CACHE: Dict[tuple, "BaseChatModel"] = {}
+
+
+# Heavy imports resolved on first use (see the accessors below)
+_create_react_agent = None
+_mcp_server = None
+
+
+def _get_create_react_agent():
+    """Import LangGraph's create_react_agent on first use, silencing its deprecation warning."""
+    global _create_react_agent
+    if _create_react_agent is None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=".*create_react_agent.*")
+            from langgraph.prebuilt import create_react_agent
+        _create_react_agent = create_react_agent
+    return _create_react_agent
+
+
+def _get_mcp_server():
+    """Import the MCP server module (initialized by backend.server) on first use."""
+    global _mcp_server
+    if _mcp_server is None:
+        from exchange_mcp_server import server as mcp_server
+        _mcp_server = mcp_server
+    return _mcp_server
+
+
+def _get_llm_class(provider: str) -> type:
+    """Import (once) and return the chat model class for a provider."""
+    llm_class = _LLM_CLASS_CACHE.get(provider)
+    if llm_class is None:
+        module_name, class_name, package = _LLM_PROVIDERS[provider]
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            raise ImportError(
+                f"{package} not installed. Run:\n"
+                f"  pip install {package}"
+            )
+        llm_class = _LLM_CLASS_CACHE[provider] = getattr(module, class_name)
+    return llm_class
+
+
 def create_llm(
     provider: str = "ollama",
     model: str = "llama3.2",
     api_key: str = "",
     base_url: str = "",
     temperature: float = 0
-) -> BaseChatModel:
+) -> "BaseChatModel":
     """
     Create an LLM instance based on provider.
     
@@ -42,17 +197,17 @@ def create_llm(
         temperature: Sampling temperature (0 = deterministic)
     
     Returns:
-        Configured LLM instance
+        Configured LLM instance, shared by all callers with the same settings
     """
+    if provider != "openai":
+        provider = "ollama"  # default
+    
+    key = (provider, model, api_key, base_url, temperature)
+    llm = _LLM_INSTANCE_CACHE.get(key)
+    if llm is not None:
+        return llm
+    
     if provider == "openai":
-        try:
-            from langchain_openai import ChatOpenAI
-        except ImportError:
-            raise ImportError(
-                "langchain-openai not installed. Run:\n"
-                "  pip install langchain-openai"
-            )
-        
         kwargs = {
             "model": model,
             "temperature": temperature,
@@ -62,12 +217,11 @@ def create_llm(
         # Custom base URL for OpenAI-compatible providers
         if base_url:
             kwargs["base_url"] = base_url
-            
-        return ChatOpenAI(**kwargs)
+    else:
+        kwargs = {"model": model, "temperature": temperature}
     
-    else:  # ollama (default)
-        from langchain_ollama import ChatOllama
-        return ChatOllama(model=model, temperature=temperature)
+    llm = _LLM_INSTANCE_CACHE[key] = _get_llm_class(provider)(**kwargs)
+    return llm
 
 
 # ============================================================================
@@ -76,14 +230,13 @@ def create_llm(
 
 def get_data_source():
     """Get the data loader (must be called after initialization)."""
-    return mcp_server.data_source
+    return _get_mcp_server().data_source
 
 def get_vector_store():
     """Get the vector store (must be called after initialization)."""
-    return mcp_server.vector_store
+    return _get_mcp_server().vector_store
 
 
-@tool
 def whoami() -> str:
     """Get information about the current user - name, email, department, unread emails, meetings today."""
     data_loader = get_data_source()
@@ -91,17 +244,16 @@ def whoami() -> str:
     unread = data_loader.get_unread_count()
     today_meetings = len(data_loader.get_todays_meetings())
     
-    return json.dumps({
+    return _dump({
         "name": me.get("DisplayName"),
         "email": me.get("Email"),
         "department": me.get("Department"),
         "title": me.get("JobTitle"),
         "unread_emails": unread,
         "meetings_today": today_meetings
-    }, indent=2)
+    })
 
 
-@tool
 def get_inbox(limit: Optional[int] = 10, unread_only: Optional[bool] = False) -> str:
     """Get emails from my inbox.
     
@@ -111,36 +263,21 @@ def get_inbox(limit: Optional[int] = 10, unread_only: Optional[bool] = False) ->
     """
     data_loader = get_data_source()
     
-    if limit is None or isinstance(limit, dict):
-        limit = 10
-    try:
-        limit = int(limit)
-    except (ValueError, TypeError):
-        limit = 10
-    if unread_only is None or isinstance(unread_only, dict):
-        unread_only = False
+    limit = _coerce_int(limit, 10)
+    unread_only = _coerce_bool(unread_only)
         
-    emails = data_loader.get_inbox(limit=limit, unread_only=unread_only)
+    cols = data_loader.get_inbox_projection(limit=limit, unread_only=unread_only)
     
-    return json.dumps({
-        "count": len(emails),
-        "unread_total": data_loader.get_unread_count(),
-        "emails": [
-            {
-                "id": e["Id"],
-                "subject": e["Subject"],
-                "from": e.get("FromName") or e["From"],
-                "date": e["ReceivedDate"],
-                "is_read": e.get("IsRead", False),
-                "importance": e.get("Importance", "Normal"),
-                "preview": e.get("Body", "")[:150] + "..." if len(e.get("Body", "")) > 150 else e.get("Body", "")
-            }
-            for e in emails
-        ]
-    }, indent=2)
+    return _dump_listing(
+        {"count": len(cols.ids), "unread_total": data_loader.get_unread_count()},
+        "emails",
+        list(map(
+            _inbox_fragment, cols.ids, cols.subjects, cols.senders, cols.dates,
+            cols.is_read, cols.importance, cols.previews,
+        )),
+    )
 
 
-@tool
 def get_sent(limit: Optional[int] = 10) -> str:
     """Get emails I've sent.
     
@@ -149,31 +286,17 @@ def get_sent(limit: Optional[int] = 10) -> str:
     """
     data_loader = get_data_source()
     
-    if limit is None or isinstance(limit, dict):
-        limit = 10
-    try:
-        limit = int(limit)
-    except (ValueError, TypeError):
-        limit = 10
+    limit = _coerce_int(limit, 10)
         
-    emails = data_loader.get_sent_items(limit=limit)
+    cols = data_loader.get_sent_projection(limit=limit)
     
-    return json.dumps({
-        "count": len(emails),
-        "emails": [
-            {
-                "id": e["Id"],
-                "subject": e["Subject"],
-                "to": e.get("ToName") or e["To"],
-                "date": e["ReceivedDate"],
-                "preview": e.get("Body", "")[:100]
-            }
-            for e in emails
-        ]
-    }, indent=2)
+    return _dump_listing(
+        {"count": len(cols.ids)},
+        "emails",
+        list(map(_sent_fragment, cols.ids, cols.subjects, cols.recipients, cols.dates, cols.snippets)),
+    )
 
 
-@tool
 def read_email(email_id: Optional[str] = None) -> str:
     """Read the full content of a specific email by its ID.
     
@@ -182,12 +305,13 @@ def read_email(email_id: Optional[str] = None) -> str:
     """
     data_loader = get_data_source()
     
-    if email_id is None or isinstance(email_id, dict):
+    email_id = _coerce_str(email_id)
+    if email_id is None:
         return json.dumps({"error": "Please provide an email_id"})
         
-    email = data_loader.get_email_by_id(str(email_id))
+    email = data_loader.get_email_by_id(email_id)
     if email:
-        return json.dumps({
+        return _dump({
             "id": email["Id"],
             "subject": email["Subject"],
             "from": email.get("FromName") or email["From"],
@@ -196,11 +320,10 @@ def read_email(email_id: Optional[str] = None) -> str:
             "body": email["Body"],
             "importance": email.get("Importance", "Normal"),
             "has_attachments": email.get("HasAttachments", False)
-        }, indent=2)
+        })
     return json.dumps({"error": f"Email not found: {email_id}"})
 
 
-@tool
 def search_emails(query: Optional[str] = None, limit: Optional[int] = 10) -> str:
     """Search my emails using natural language. Examples: 'emails about pipeline failures', 'messages from the data team about Spark'.
     
@@ -210,26 +333,20 @@ def search_emails(query: Optional[str] = None, limit: Optional[int] = 10) -> str
     """
     vector_store = get_vector_store()
     
-    if query is None or isinstance(query, dict):
+    query = _coerce_str(query)
+    if query is None:
         return json.dumps({"error": "Please provide a search query"})
-    query = str(query)
-    if limit is None or isinstance(limit, dict):
-        limit = 10
-    try:
-        limit = int(limit)
-    except (ValueError, TypeError):
-        limit = 10
+    limit = _coerce_int(limit, 10)
         
     results = vector_store.search_emails(query, limit=limit)
     
-    return json.dumps({
+    return _dump({
         "query": query,
         "count": len(results),
         "results": results
-    }, indent=2)
+    })
 
 
-@tool
 def get_calendar(days: Optional[int] = 7) -> str:
     """Get my upcoming meetings for the next N days.
     
@@ -238,39 +355,23 @@ def get_calendar(days: Optional[int] = 7) -> str:
     """
     data_loader = get_data_source()
     
-    if days is None or isinstance(days, dict):
-        days = 7
-    try:
-        days = int(days)
-    except (ValueError, TypeError):
-        days = 7
+    days = _coerce_int(days, 7)
         
-    meetings = data_loader.get_calendar(days=days)
+    cols = data_loader.get_calendar_projection(days=days)
     
-    return json.dumps({
-        "days_ahead": days,
-        "count": len(meetings),
-        "meetings": [
-            {
-                "id": m["Id"],
-                "subject": m["Subject"],
-                "organizer": m.get("OrganizerName") or m["Organizer"],
-                "start": m["StartTime"],
-                "end": m["EndTime"],
-                "location": m.get("Location", "")
-            }
-            for m in meetings
-        ]
-    }, indent=2)
+    return _dump_listing(
+        {"days_ahead": days, "count": len(cols.ids)},
+        "meetings",
+        list(map(_meeting_fragment, *cols)),
+    )
 
 
-@tool
 def get_todays_meetings() -> str:
     """Get all meetings scheduled for today."""
     data_loader = get_data_source()
     meetings = data_loader.get_todays_meetings()
     
-    return json.dumps({
+    return _dump({
         "count": len(meetings),
         "meetings": [
             {
@@ -283,10 +384,9 @@ def get_todays_meetings() -> str:
             }
             for m in meetings
         ]
-    }, indent=2)
+    })
 
 
-@tool
 def search_meetings(query: Optional[str] = None, limit: Optional[int] = 10) -> str:
     """Search my meetings using natural language. Examples: 'architecture reviews', '1:1 meetings', 'sprint planning'.
     
@@ -296,26 +396,20 @@ def search_meetings(query: Optional[str] = None, limit: Optional[int] = 10) -> s
     """
     vector_store = get_vector_store()
     
-    if query is None or isinstance(query, dict):
+    query = _coerce_str(query)
+    if query is None:
         return json.dumps({"error": "Please provide a search query"})
-    query = str(query)
-    if limit is None or isinstance(limit, dict):
-        limit = 10
-    try:
-        limit = int(limit)
-    except (ValueError, TypeError):
-        limit = 10
+    limit = _coerce_int(limit, 10)
         
     results = vector_store.search_meetings(query, limit=limit)
     
-    return json.dumps({
+    return _dump({
         "query": query,
         "count": len(results),
         "results": results
-    }, indent=2)
+    })
 
 
-@tool
 def find_colleague(query: Optional[str] = None) -> str:
     """Find a colleague by name, email, or department.
     
@@ -324,13 +418,13 @@ def find_colleague(query: Optional[str] = None) -> str:
     """
     data_loader = get_data_source()
     
-    if query is None or isinstance(query, dict):
+    query = _coerce_str(query)
+    if query is None:
         return json.dumps({"error": "Please provide a search query"})
-    query = str(query)
     
     colleagues = data_loader.search_colleagues(query)
     
-    return json.dumps({
+    return _dump({
         "query": query,
         "count": len(colleagues),
         "colleagues": [
@@ -343,10 +437,9 @@ def find_colleague(query: Optional[str] = None) -> str:
             }
             for c in colleagues
         ]
-    }, indent=2)
+    })
 
 
-@tool
 def list_colleagues(department: Optional[str] = None, limit: Optional[int] = 20) -> str:
     """List colleagues, optionally filtered by department.
     
@@ -356,18 +449,12 @@ def list_colleagues(department: Optional[str] = None, limit: Optional[int] = 20)
     """
     data_loader = get_data_source()
     
-    if isinstance(department, dict):
-        department = None
-    if limit is None or isinstance(limit, dict):
-        limit = 20
-    try:
-        limit = int(limit)
-    except (ValueError, TypeError):
-        limit = 20
+    department = _coerce_str(department)
+    limit = _coerce_int(limit, 20)
         
     colleagues = data_loader.get_colleagues(department=department, limit=limit)
     
-    return json.dumps({
+    return _dump({
         "filter": department or "all",
         "count": len(colleagues),
         "colleagues": [
@@ -379,24 +466,23 @@ def list_colleagues(department: Optional[str] = None, limit: Optional[int] = 20)
             }
             for c in colleagues
         ]
-    }, indent=2)
+    })
 
 
-@tool
 def get_stats() -> str:
     """Get email and meeting statistics - inbox count, unread count, top senders, meeting counts."""
     data_loader = get_data_source()
     email_stats = data_loader.get_email_stats()
     meeting_stats = data_loader.get_meeting_stats()
     
-    return json.dumps({
+    return _dump({
         "email": email_stats,
         "meetings": meeting_stats
-    }, indent=2)
+    })
 
 
-# All available tools
-TOOLS = [
+# All available tools, as plain functions; get_tools() wraps them for LangChain
+TOOL_FUNCTIONS = [
     whoami,
     get_inbox,
     get_sent,
@@ -410,6 +496,146 @@ TOOLS = [
     get_stats
 ]
 
+# Argument schemas as {tool name: {arg: (type, default)}}, declared up front so
+# building the LangChain tools needs no signature introspection. Keep these in
+# sync with the function signatures above.
+_TOOL_ARGS: Dict[str, Dict[str, Tuple[Any, Any]]] = {
+    "whoami": {},
+    "get_inbox": {"limit": (Optional[int], 10), "unread_only": (Optional[bool], False)},
+    "get_sent": {"limit": (Optional[int], 10)},
+    "read_email": {"email_id": (Optional[str], None)},
+    "search_emails": {"query": (Optional[str], None), "limit": (Optional[int], 10)},
+    "get_calendar": {"days": (Optional[int], 7)},
+    "get_todays_meetings": {},
+    "search_meetings": {"query": (Optional[str], None), "limit": (Optional[int], 10)},
+    "find_colleague": {"query": (Optional[str], None)},
+    "list_colleagues": {"department": (Optional[str], None), "limit": (Optional[int], 20)},
+    "get_stats": {},
+}
+
+_TOOLS: Optional[List[Any]] = None
+
+
+def get_tools() -> List[Any]:
+    """Return TOOL_FUNCTIONS as LangChain tools, importing langchain_core on first use."""
+    global _TOOLS
+    if _TOOLS is None:
+        from langchain_core.tools import StructuredTool
+        from pydantic import create_model
+        _TOOLS = [
+            StructuredTool.from_function(
+                fn,
+                args_schema=create_model(fn.__name__, **_TOOL_ARGS[fn.__name__]),
+            )
+            for fn in TOOL_FUNCTIONS
+        ]
+    return _TOOLS
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve TOOLS lazily (see get_tools)."""
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Agent instructions; only the user's name, email and department vary
+_SYSTEM_PROMPT_TEMPLATE = """You are a helpful personal assistant with access to the user's Exchange email and calendar data.
+
+IMPORTANT: You MUST use the available tools to answer questions about emails, meetings, or colleagues.
+NEVER make up or hallucinate data - always call the appropriate tool first.
+
+Available tools:
+- whoami: Get your user info
+- get_inbox: Get inbox emails  
+- get_sent: Get sent emails
+- read_email: Read a specific email by ID
+- search_emails: Search emails with natural language
+- get_calendar: Get upcoming meetings
+- get_todays_meetings: Get today's meetings
+- search_meetings: Search meetings with natural language
+- find_colleague: Find a colleague
+- list_colleagues: List colleagues by department
+- get_stats: Get email/meeting statistics
+
+The user is: {name} ({email}) from {department}.
+
+When responding:
+- ALWAYS call a tool first to get real data
+- Summarize the tool results clearly
+- Be concise but informative
+- Highlight important/urgent items"""
+
+
+# (provider, model, api key digest, base_url, data source) -> (llm, system prompt, agent, user email),
+# least recently used first; bounded so replaced data sources and LLM clients can be freed
+_AGENT_CACHE: OrderedDict[tuple, Tuple[Any, str, Any, str]] = OrderedDict()
+_AGENT_CACHE_SIZE = 8
+
+
+def _build_agent(provider: str, model: str, api_key: str, base_url: str) -> Tuple[Any, str, Any, str]:
+    """
+    Build (once per configuration) the tool-bound LLM, system prompt and agent.
+    
+    Keyed on a digest of the API key so the cache never holds it in plain
+    text, and on the current data source so a re-initialized mailbox gets a
+    fresh prompt.
+    """
+    data_loader = get_data_source()
+    key = (provider, model, hashlib.sha256(api_key.encode()).hexdigest(), base_url, data_loader)
+    cached = _AGENT_CACHE.get(key)
+    if cached is not None:
+        _AGENT_CACHE.move_to_end(key)
+        return cached
+    
+    # Initialize LLM based on provider
+    base_llm = create_llm(
+        provider=provider,
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=0
+    )
+    
+    # Build system prompt
+    me = data_loader.get_me()
+    
+    system_prompt = _SYSTEM_PROMPT_TEMPLATE.format(
+        name=me.get("DisplayName", "Unknown"),
+        email=me.get("Email", "Unknown"),
+        department=me.get("Department", "Unknown"),
+    )
+
+    # Bind tools to the LLM
+    tools = get_tools()
+    llm = base_llm.bind_tools(tools)
+    
+    # Create the agent
+    create_react_agent = _get_create_react_agent()
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=".*create_react_agent.*")
+        agent = create_react_agent(llm, tools, prompt=system_prompt)
+    
+    cached = _AGENT_CACHE[key] = (llm, system_prompt, agent, me.get("Email", ""))
+    while len(_AGENT_CACHE) > _AGENT_CACHE_SIZE:
+        _AGENT_CACHE.popitem(last=False)
+    return cached
+
+
+# Shown when the model produced no answer; never cached, so a retry can do better
+_NO_ANSWER = "I couldn't process that request."
+
+
+def _chunk_text(content: Any) -> str:
+    """Text of a message chunk's content (a string, or a list of content blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "")
+        for block in content or ()
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
 
 # ============================================================================
 # Chat Engine Class
@@ -423,7 +649,8 @@ class ChatEngine:
         model: str = "llama3.2",
         provider: str = "ollama",
         api_key: str = "",
-        base_url: str = ""
+        base_url: str = "",
+        cache_ttl_seconds: float = 600
     ):
         """
         Initialize the chat engine.
@@ -433,97 +660,188 @@ class ChatEngine:
             provider: LLM provider - "ollama" or "openai"
             api_key: API key (required for openai provider)
             base_url: Custom base URL for OpenAI-compatible APIs
+            cache_ttl_seconds: Lifetime of semantic cache entries (0 disables the cache)
         """
         self.model_name = model
         self.provider = provider
         self.tools_used_in_last_call: List[str] = []
         
-        # Initialize LLM based on provider
-        base_llm = create_llm(
-            provider=provider,
-            model=model,
-            api_key=api_key,
-            base_url=base_url,
-            temperature=0
+        # LLM, system prompt and agent are shared by engines with the same settings
+        self.llm, self.system_prompt, self.agent, user_email = _build_agent(
+            provider, model, api_key, base_url
         )
         
-        # Build system prompt
-        data_loader = get_data_source()
-        me = data_loader.get_me()
-        
-        self.system_prompt = f"""You are a helpful personal assistant with access to the user's Exchange email and calendar data.
-
-IMPORTANT: You MUST use the available tools to answer questions about emails, meetings, or colleagues.
-NEVER make up or hallucinate data - always call the appropriate tool first.
-
-Available tools:
-- whoami: Get your user info
-- get_inbox: Get inbox emails  
-- get_sent: Get sent emails
-- read_email: Read a specific email by ID
-- search_emails: Search emails with natural language
-- get_calendar: Get upcoming meetings
-- get_todays_meetings: Get today's meetings
-- search_meetings: Search meetings with natural language
-- find_colleague: Find a colleague
-- list_colleagues: List colleagues by department
-- get_stats: Get email/meeting statistics
-
-The user is: {me.get('DisplayName', 'Unknown')} ({me.get('Email', 'Unknown')}) from {me.get('Department', 'Unknown')}.
-
-When responding:
-- ALWAYS call a tool first to get real data
-- Summarize the tool results clearly
-- Be concise but informative
-- Highlight important/urgent items"""
-
-        # Bind tools to the LLM
-        self.llm = base_llm.bind_tools(TOOLS)
-        
-        # Create the agent
-        self.agent = create_react_agent(self.llm, TOOLS, prompt=self.system_prompt)
+        # Semantic response cache, namespaced by user and model (in the vector store's ChromaDB)
+        self.cache: Optional[SemanticCache] = None
+        vector_store = get_vector_store()
+        if cache_ttl_seconds and vector_store is not None:
+            try:
+                self.cache = SemanticCache(
+                    vector_store.client,
+                    namespace=user_email or "default",
+                    model=f"{provider}:{model}",
+                    ttl_seconds=cache_ttl_seconds,
+                )
+            except Exception as e:
+                logger.warning(f"Semantic cache unavailable: {e}")
         
         provider_info = f"{provider}:{model}"
         if base_url:
             provider_info += f" @ {base_url}"
         logger.info(f"ChatEngine initialized with {provider_info}")
     
-    def chat(self, message: str) -> Tuple[str, List[str]]:
+    def clear_cache(self):
+        """Forget cached answers, which may describe mailbox data that has since changed."""
+        if not self.cache:
+            return
+        try:
+            self.cache.clear()
+        except Exception as e:
+            logger.warning(f"Semantic cache clear failed: {e}")
+    
+    def _cache_lookup(self, message: str, no_cache: bool) -> Optional[Tuple[str, List[str]]]:
+        """Return a cached (response, tools_used) for message, if enabled and present."""
+        if not self.cache or no_cache:
+            return None
+        try:
+            return self.cache.lookup(message)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+    
+    def _cache_store(self, message: str, response: str, tools_used: List[str]):
+        """Remember a fresh response in the semantic cache, if enabled."""
+        if self.cache:
+            try:
+                self.cache.store(message, response, tools_used)
+            except Exception as e:
+                logger.warning(f"Semantic cache store failed: {e}")
+    
+    @staticmethod
+    def _parse_result(result: Any) -> Tuple[Optional[str], List[str]]:
+        """Extract (response_text, tools_used) from an agent result; the text is None if there is no answer."""
+        # Track which tools were used (distinct names, in first-use order)
+        tools_used: Dict[str, None] = {}
+        if result and "messages" in result:
+            for msg in result["messages"]:
+                if hasattr(msg, "tool_calls") and msg.tool_calls:
+                    for tc in msg.tool_calls:
+                        if isinstance(tc, dict) and "name" in tc:
+                            tools_used[tc["name"]] = None
+        
+        # The answer is the last AI message that is not a tool request; in a
+        # normal run that is the final message, so this loop exits at once
+        response = None
+        if result and "messages" in result:
+            for msg in reversed(result["messages"]):
+                if getattr(msg, "type", None) != "ai" or msg.tool_calls:
+                    continue
+                if msg.content:
+                    response = msg.content
+                    break
+        
+        return response, list(tools_used)
+    
+    def chat(self, message: str, no_cache: bool = False) -> Tuple[str, List[str]]:
         """
         Send a message and get a response.
         
+        A near-duplicate of a recent message is answered from the semantic
+        cache without calling the LLM; pass no_cache=True to force a fresh
+        answer (e.g. "refresh" prompts).
+        
         Returns:
             Tuple of (response_text, list_of_tools_used)
         """
         self.tools_used_in_last_call = []
         
+        cached = self._cache_lookup(message, no_cache)
+        if cached:
+            self.tools_used_in_last_call = cached[1]
+            return cached
+        
         result = self.agent.invoke({"messages": [("user", message)]})
+        response, tools_used = self._parse_result(result)
+        self.tools_used_in_last_call = tools_used
         
-        # Track which tools were used
-        tools_used = []
-        if result and "messages" in result:
-            for msg in result["messages"]:
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tc in msg.tool_calls:
-                        if isinstance(tc, dict) and "name" in tc:
-                            tools_used.append(tc["name"])
+        if response is None:
+            return _NO_ANSWER, tools_used
+        self._cache_store(message, response, tools_used)
+        return response, tools_used
+    
+    async def achat(self, message: str, no_cache: bool = False) -> Tuple[str, List[str]]:
+        """
+        Async version of chat().
         
-        self.tools_used_in_last_call = tools_used
+        Runs the agent with ainvoke, so the LLM round-trips don't tie up a
+        worker thread, and the tool calls a model emits in one turn (e.g.
+        get_inbox + get_todays_meetings) run concurrently.
         
-        # Extract the final AI response
-        response = "I couldn't process that request."
-        if result and "messages" in result:
-            for msg in reversed(result["messages"]):
-                # Skip tool call messages
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    continue
-                # Get content from AI message
-                if hasattr(msg, "content") and msg.content:
-                    content = msg.content
-                    # Skip if it's just echoing the user message
-                    if content.strip() == message.strip():
-                        continue
-                    response = content
-                    break
+        Returns:
+            Tuple of (response_text, list_of_tools_used)
+        """
+        self.tools_used_in_last_call = []
         
+        cached = await asyncio.to_thread(self._cache_lookup, message, no_cache)
+        if cached:
+            self.tools_used_in_last_call = cached[1]
+            return cached
+        
+        result = await self.agent.ainvoke({"messages": [("user", message)]})
+        response, tools_used = self._parse_result(result)
+        self.tools_used_in_last_call = tools_used
+        
+        if response is None:
+            return _NO_ANSWER, tools_used
+        await asyncio.to_thread(self._cache_store, message, response, tools_used)
         return response, tools_used
+    
+    async def chat_stream(self, message: str, no_cache: bool = False) -> AsyncIterator[Tuple[Optional[str], List[str]]]:
+        """
+        Streaming version of achat().
+        
+        Yields (delta_text, tools_used_so_far) as the model produces tokens,
+        so callers can show the answer while it is being written. A delta of
+        None means the text so far belonged to a turn that went on to call
+        tools and should be discarded. The full response (as from achat())
+        is the concatenation of the deltas after the last None; a cached
+        answer arrives as a single delta.
+        """
+        self.tools_used_in_last_call = []
+        
+        cached = await asyncio.to_thread(self._cache_lookup, message, no_cache)
+        if cached:
+            self.tools_used_in_last_call = cached[1]
+            yield cached
+            return
+        
+        tools_used: Dict[str, None] = {}
+        parts: List[str] = []
+        calls_tools = False  # whether the current model turn has requested tools
+        async for chunk, _metadata in self.agent.astream(
+            {"messages": [("user", message)]}, stream_mode="messages"
+        ):
+            # A tool result means the next model output starts a new turn
+            if getattr(chunk, "type", None) not in ("ai", "AIMessageChunk"):
+                calls_tools = False
+                continue
+            tool_calls = getattr(chunk, "tool_call_chunks", None) or getattr(chunk, "tool_calls", None) or ()
+            for tc in tool_calls:
+                if tc.get("name"):
+                    tools_used[tc["name"]] = None
+            if tool_calls and not calls_tools:
+                # Like _parse_result, only the final turn without tool calls is the answer
+                calls_tools = True
+                if parts:
+                    parts = []
+                    yield None, list(tools_used)
+            text = _chunk_text(chunk.content)
+            if text and not calls_tools:
+                parts.append(text)
+                yield text, list(tools_used)
+        
+        self.tools_used_in_last_call = list(tools_used)
+        if not parts:
+            yield _NO_ANSWER, self.tools_used_in_last_call
+            return
+        await asyncio.to_thread(self._cache_store, message, "".join(parts), self.tools_used_in_last_call)
@@ -12,16 +12,110 @@ import json
 import logging
 import os
 import sqlite3
+import queue
+import secrets
 import threading
-import uuid
 from contextlib import contextmanager
-from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger("exchange-backend.interaction_log")
 
+# JSON for TEXT columns (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+if orjson:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Columns read back into InteractionLog / ToolCallLog (avoids SELECT *)
+_INTERACTION_COLS = (
+    "interaction_id, session_id, timestamp, user_query, model_provider, model_name, "
+    "response, total_duration_ms, feedback_rating, feedback_comment, "
+    "feedback_categories, feedback_timestamp"
+)
+_TC_COLS = "interaction_id, tool_name, arguments, result, error, duration_ms, timestamp"
+
+# Statements are module constants so sqlite3's per-connection statement
+# cache sees the identical string on every call
+_SQL_INSERT_INTERACTION = """
+    INSERT INTO interactions (
+        interaction_id, session_id, timestamp, user_query,
+        model_provider, model_name, response, total_duration_ms
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_TOOL_CALL = """
+    INSERT INTO tool_calls (
+        interaction_id, tool_name, arguments, result,
+        error, duration_ms, timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_FEEDBACK = """
+    UPDATE interactions 
+    SET feedback_rating = ?, 
+        feedback_comment = ?,
+        feedback_categories = ?,
+        feedback_timestamp = ?
+    WHERE interaction_id = ?
+"""
+_SQL_INTERACTION_EXISTS = "SELECT 1 FROM interactions WHERE interaction_id = ?"
+_SQL_SELECT_INTERACTION = f"SELECT {_INTERACTION_COLS} FROM interactions WHERE interaction_id = ?"
+_SQL_SELECT_TOOL_CALLS = f"SELECT {_TC_COLS} FROM tool_calls WHERE interaction_id = ? ORDER BY timestamp"
+_SQL_SELECT_RECENT = f"SELECT {_INTERACTION_COLS} FROM interactions ORDER BY timestamp DESC LIMIT ?"
+_SQL_SELECT_SESSION = f"SELECT {_INTERACTION_COLS} FROM interactions WHERE session_id = ? ORDER BY timestamp"
+_SQL_SELECT_NEGATIVE = (
+    f"SELECT {_INTERACTION_COLS} FROM interactions "
+    "WHERE feedback_rating = -1 ORDER BY feedback_timestamp DESC LIMIT ?"
+)
+_SQL_FEEDBACK_STATS = """
+    SELECT 
+        COUNT(*) as total_interactions,
+        SUM(CASE WHEN feedback_rating IS NOT NULL THEN 1 ELSE 0 END) as rated_count,
+        SUM(CASE WHEN feedback_rating = 1 THEN 1 ELSE 0 END) as thumbs_up,
+        SUM(CASE WHEN feedback_rating = -1 THEN 1 ELSE 0 END) as thumbs_down,
+        SUM(CASE WHEN feedback_rating = 0 THEN 1 ELSE 0 END) as neutral,
+        AVG(total_duration_ms) as avg_duration_ms
+    FROM interactions
+"""
+_SQL_TOOL_STATS = """
+    SELECT 
+        tool_name,
+        COUNT(*) as call_count,
+        AVG(duration_ms) as avg_duration_ms,
+        SUM(CASE WHEN error IS NOT NULL THEN 1 ELSE 0 END) as error_count
+    FROM tool_calls
+    GROUP BY tool_name
+    ORDER BY call_count DESC
+"""
+# Count feedback categories (JSON arrays) in SQL via JSON1
+_SQL_CATEGORY_COUNTS = """
+    SELECT je.value AS category, COUNT(*) AS count
+    FROM interactions, json_each(interactions.feedback_categories) AS je
+    WHERE interactions.feedback_categories IS NOT NULL
+        AND json_valid(interactions.feedback_categories)
+    GROUP BY je.value
+"""
+
+# Largest IN (...) list per tool-call query; stays under SQLite's host-parameter limit
+_IN_CHUNK = 512
+
+
+@lru_cache(maxsize=None)
+def _sql_tool_calls_in(size: int) -> str:
+    """Tool-call query for `size` ids (a power of two, so few distinct statements exist)."""
+    return f"SELECT {_TC_COLS} FROM tool_calls WHERE interaction_id IN ({','.join('?' * size)}) ORDER BY id"
+
 
 @dataclass
 class ToolCallLog:
@@ -63,9 +157,32 @@ class InteractionLog:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        d = asdict(self)
-        d["tool_calls"] = [asdict(tc) for tc in self.tool_calls]
-        return d
+        # Built by hand: asdict() recurses and deep-copies every field
+        return {
+            "interaction_id": self.interaction_id,
+            "session_id": self.session_id,
+            "timestamp": self.timestamp,
+            "user_query": self.user_query,
+            "model_provider": self.model_provider,
+            "model_name": self.model_name,
+            "response": self.response,
+            "tool_calls": [
+                {
+                    "tool_name": tc.tool_name,
+                    "arguments": tc.arguments,
+                    "result": tc.result,
+                    "error": tc.error,
+                    "duration_ms": tc.duration_ms,
+                    "timestamp": tc.timestamp,
+                }
+                for tc in self.tool_calls
+            ],
+            "total_duration_ms": self.total_duration_ms,
+            "feedback_rating": self.feedback_rating,
+            "feedback_comment": self.feedback_comment,
+            "feedback_categories": self.feedback_categories,
+            "feedback_timestamp": self.feedback_timestamp,
+        }
 
 
 class InteractionStore:
@@ -79,12 +196,19 @@ class InteractionStore:
     - Export to JSON/CSV
     """
     
-    def __init__(self, db_path: str | Path | None = None):
+    # Bump when the DDL in _init_schema changes so existing databases re-run it
+    SCHEMA_VERSION = 2
+    
+    # Refresh planner statistics (ANALYZE) after this many logged interactions
+    ANALYZE_EVERY = 10_000
+    
+    def __init__(self, db_path: str | Path | None = None, pool_size: int = 8):
         """
         Initialize the interaction store.
         
         Args:
             db_path: Path to SQLite database. Defaults to data/interactions.db
+            pool_size: Number of pooled connections (caps concurrent queries)
         """
         if db_path is None:
             data_path = os.getenv("DATA_PATH", "data")
@@ -93,33 +217,78 @@ class InteractionStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self._local = threading.local()
+        # Connections are shared by whichever thread borrows them (see _conn)
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=pool_size)
+        for i in range(pool_size):
+            self._pool.put(self._make_conn(enable_wal=(i == 0)))
+        self._writes_since_analyze = 0
+        # Bumped on every write through this store, so callers can tell
+        # whether anything changed (e.g. for HTTP ETags)
+        self.version = 0
         self._init_schema()
         
         logger.info(f"InteractionStore initialized at {self.db_path}")
     
-    def _get_conn(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
-        if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(str(self.db_path))
-            self._local.conn.row_factory = sqlite3.Row
-        return self._local.conn
+    def _make_conn(self, enable_wal: bool = False) -> sqlite3.Connection:
+        """Open a configured database connection."""
+        # Autocommit mode; _transaction issues BEGIN/COMMIT explicitly
+        conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        if enable_wal:
+            # Persistent in the database file, so only needed once
+            conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes synchronous=NORMAL safe against corruption (only the
+        # last commits can be lost on power failure) and lets readers
+        # proceed while a chat interaction is being written
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+        # Transactions are small (at most a log batch), so keep dirty pages
+        # in memory until COMMIT instead of spilling them to the WAL early
+        conn.execute("PRAGMA cache_spill=OFF")
+        return conn
     
     @contextmanager
-    def _transaction(self):
-        """Context manager for database transactions."""
-        conn = self._get_conn()
+    def _conn(self):
+        """Borrow a pooled connection for the duration of the block."""
+        conn = self._pool.get()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        finally:
+            self._pool.put(conn)
+    
+    @contextmanager
+    def _transaction(self):
+        """Context manager for database transactions."""
+        with self._conn() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+    
+    @staticmethod
+    def _select(conn: sqlite3.Connection, sql: str, params=()) -> sqlite3.Cursor:
+        """Run a query that yields plain tuples in _INTERACTION_COLS/_TC_COLS order."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
     
     def _init_schema(self):
-        """Initialize database schema."""
-        with self._transaction() as conn:
-            conn.executescript("""
+        """Initialize database schema (skipped when user_version is current)."""
+        # executescript manages its own transaction, so it runs outside _transaction
+        with self._conn() as conn:
+            # A header read instead of a write transaction on warm starts
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+                return
+            
+            conn.executescript(f"""
+                BEGIN;
+                
                 CREATE TABLE IF NOT EXISTS interactions (
                     interaction_id TEXT PRIMARY KEY,
                     session_id TEXT NOT NULL,
@@ -154,10 +323,20 @@ class InteractionStore:
                     ON interactions(timestamp);
                 CREATE INDEX IF NOT EXISTS idx_interactions_feedback 
                     ON interactions(feedback_rating);
-                CREATE INDEX IF NOT EXISTS idx_tool_calls_interaction 
-                    ON tool_calls(interaction_id);
-                CREATE INDEX IF NOT EXISTS idx_tool_calls_name 
-                    ON tool_calls(tool_name);
+                -- Covers the tool_usage aggregation; replaces idx_tool_calls_name
+                CREATE INDEX IF NOT EXISTS idx_tool_calls_name_cov
+                    ON tool_calls(tool_name, duration_ms, error);
+                DROP INDEX IF EXISTS idx_tool_calls_name;
+                CREATE INDEX IF NOT EXISTS idx_interactions_rating_fbts
+                    ON interactions(feedback_rating, feedback_timestamp DESC);
+                -- Also serves interaction_id lookups; replaces idx_tool_calls_interaction
+                CREATE INDEX IF NOT EXISTS idx_tool_calls_interaction_ts
+                    ON tool_calls(interaction_id, timestamp);
+                DROP INDEX IF EXISTS idx_tool_calls_interaction;
+                
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+                
+                COMMIT;
             """)
     
     def log_interaction(self, interaction: InteractionLog) -> str:
@@ -166,45 +345,78 @@ class InteractionStore:
         
         Args:
             interaction: The interaction to log
-            
+        
         Returns:
             The interaction_id
         """
+        self.log_interactions([interaction])
+        return interaction.interaction_id
+    
+    def log_interactions(self, interactions: List[InteractionLog]) -> int:
+        """
+        Log a batch of interactions in a single transaction.
+        
+        Args:
+            interactions: The interactions to log
+        
+        Returns:
+            Number of interactions written
+        """
+        if not interactions:
+            return 0
+        
         with self._transaction() as conn:
-            conn.execute("""
-                INSERT INTO interactions (
-                    interaction_id, session_id, timestamp, user_query,
-                    model_provider, model_name, response, total_duration_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                interaction.interaction_id,
-                interaction.session_id,
-                interaction.timestamp,
-                interaction.user_query,
-                interaction.model_provider,
-                interaction.model_name,
-                interaction.response,
-                interaction.total_duration_ms,
-            ))
+            conn.executemany(_SQL_INSERT_INTERACTION, [
+                (
+                    interaction.interaction_id,
+                    interaction.session_id,
+                    interaction.timestamp,
+                    interaction.user_query,
+                    interaction.model_provider,
+                    interaction.model_name,
+                    interaction.response,
+                    interaction.total_duration_ms,
+                )
+                for interaction in interactions
+            ])
             
-            for tc in interaction.tool_calls:
-                conn.execute("""
-                    INSERT INTO tool_calls (
-                        interaction_id, tool_name, arguments, result,
-                        error, duration_ms, timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            conn.executemany(_SQL_INSERT_TOOL_CALL, [
+                (
                     interaction.interaction_id,
                     tc.tool_name,
-                    json.dumps(tc.arguments),
+                    _dumps(tc.arguments),
                     tc.result,
                     tc.error,
                     tc.duration_ms,
                     tc.timestamp,
-                ))
+                )
+                for interaction in interactions
+                for tc in interaction.tool_calls
+            ])
         
-        logger.debug(f"Logged interaction {interaction.interaction_id}")
-        return interaction.interaction_id
+        self.version += 1
+        logger.debug(f"Logged {len(interactions)} interaction(s)")
+        
+        self._writes_since_analyze += len(interactions)
+        if self._writes_since_analyze >= self.ANALYZE_EVERY:
+            self._writes_since_analyze = 0
+            threading.Thread(target=self.analyze, name="interaction-analyze", daemon=True).start()
+        
+        return len(interactions)
+    
+    def analyze(self):
+        """Refresh the query planner's statistics for all tables and indexes."""
+        try:
+            with self._conn() as conn:
+                conn.execute("ANALYZE")
+            logger.info("Refreshed interaction database statistics")
+        except sqlite3.Error as e:
+            logger.warning(f"ANALYZE failed: {e}")
+    
+    def optimize(self):
+        """Run PRAGMA optimize, as SQLite recommends before closing long-lived connections."""
+        with self._conn() as conn:
+            conn.execute("PRAGMA optimize")
     
     def add_feedback(
         self,
@@ -221,127 +433,113 @@ class InteractionStore:
             rating: 1 (thumbs up), -1 (thumbs down), 0 (neutral)
             comment: Optional feedback comment
             categories: Optional list of feedback categories (speed, quality, accuracy)
-            
+        
         Returns:
             True if successful, False if interaction not found
         """
         timestamp = datetime.utcnow().isoformat()
-        categories_json = json.dumps(categories) if categories else None
+        categories_json = _dumps(categories) if categories else None
         
         with self._transaction() as conn:
-            cursor = conn.execute("""
-                UPDATE interactions 
-                SET feedback_rating = ?, 
-                    feedback_comment = ?,
-                    feedback_categories = ?,
-                    feedback_timestamp = ?
-                WHERE interaction_id = ?
-            """, (rating, comment, categories_json, timestamp, interaction_id))
+            cursor = conn.execute(
+                _SQL_UPDATE_FEEDBACK,
+                (rating, comment, categories_json, timestamp, interaction_id)
+            )
             
             if cursor.rowcount == 0:
                 return False
         
+        self.version += 1
         logger.info(f"Feedback added to {interaction_id}: rating={rating}, categories={categories}")
         return True
     
-    def get_interaction(self, interaction_id: str) -> Optional[InteractionLog]:
-        """Get a single interaction by ID."""
-        conn = self._get_conn()
+    def add_feedback_batch(
+        self,
+        feedback: List[Tuple[str, int, Optional[str], Optional[List[str]]]]
+    ) -> int:
+        """
+        Add feedback to several interactions in a single transaction.
         
-        row = conn.execute(
-            "SELECT * FROM interactions WHERE interaction_id = ?",
-            (interaction_id,)
-        ).fetchone()
+        Args:
+            feedback: (interaction_id, rating, comment, categories) tuples,
+                      applied in order so later feedback for an id wins
         
-        if not row:
-            return None
+        Returns:
+            Number of interactions updated
+        """
+        if not feedback:
+            return 0
         
-        tool_calls = conn.execute(
-            "SELECT * FROM tool_calls WHERE interaction_id = ? ORDER BY timestamp",
-            (interaction_id,)
-        ).fetchall()
+        timestamp = datetime.utcnow().isoformat()
+        with self._transaction() as conn:
+            cursor = conn.executemany(_SQL_UPDATE_FEEDBACK, [
+                (rating, comment, _dumps(categories) if categories else None, timestamp, interaction_id)
+                for interaction_id, rating, comment, categories in feedback
+            ])
+            updated = cursor.rowcount
         
-        return self._row_to_interaction(row, tool_calls)
+        self.version += 1
+        logger.info(f"Feedback added to {updated} of {len(feedback)} interaction(s)")
+        return updated
+    
+    def has_interaction(self, interaction_id: str) -> bool:
+        """Check whether an interaction has been logged."""
+        with self._conn() as conn:
+            return self._select(conn, _SQL_INTERACTION_EXISTS, (interaction_id,)).fetchone() is not None
+    
+    def get_interaction(self, interaction_id: str) -> Optional[InteractionLog]:
+        """Get a single interaction by ID."""
+        with self._conn() as conn:
+            row = self._select(
+                conn,
+                _SQL_SELECT_INTERACTION,
+                (interaction_id,)
+            ).fetchone()
+            
+            if not row:
+                return None
+            
+            tool_calls = self._select(
+                conn,
+                _SQL_SELECT_TOOL_CALLS,
+                (interaction_id,)
+            ).fetchall()
+            
+            return self._row_to_interaction(row, tool_calls)
     
     def get_recent(self, limit: int = 50) -> List[InteractionLog]:
         """Get recent interactions."""
-        conn = self._get_conn()
-        
-        rows = conn.execute(
-            "SELECT * FROM interactions ORDER BY timestamp DESC LIMIT ?",
-            (limit,)
-        ).fetchall()
-        
-        interactions = []
-        for row in rows:
-            tool_calls = conn.execute(
-                "SELECT * FROM tool_calls WHERE interaction_id = ?",
-                (row["interaction_id"],)
+        with self._conn() as conn:
+            rows = self._select(
+                conn,
+                _SQL_SELECT_RECENT,
+                (limit,)
             ).fetchall()
-            interactions.append(self._row_to_interaction(row, tool_calls))
-        
-        return interactions
+            
+            return self._rows_to_interactions(conn, rows)
     
     def get_by_session(self, session_id: str) -> List[InteractionLog]:
         """Get all interactions for a session."""
-        conn = self._get_conn()
-        
-        rows = conn.execute(
-            "SELECT * FROM interactions WHERE session_id = ? ORDER BY timestamp",
-            (session_id,)
-        ).fetchall()
-        
-        interactions = []
-        for row in rows:
-            tool_calls = conn.execute(
-                "SELECT * FROM tool_calls WHERE interaction_id = ?",
-                (row["interaction_id"],)
+        with self._conn() as conn:
+            rows = self._select(
+                conn,
+                _SQL_SELECT_SESSION,
+                (session_id,)
             ).fetchall()
-            interactions.append(self._row_to_interaction(row, tool_calls))
-        
-        return interactions
+            
+            return self._rows_to_interactions(conn, rows)
     
     def get_feedback_stats(self) -> Dict[str, Any]:
         """Get aggregate feedback statistics."""
-        conn = self._get_conn()
-        
-        stats = conn.execute("""
-            SELECT 
-                COUNT(*) as total_interactions,
-                SUM(CASE WHEN feedback_rating IS NOT NULL THEN 1 ELSE 0 END) as rated_count,
-                SUM(CASE WHEN feedback_rating = 1 THEN 1 ELSE 0 END) as thumbs_up,
-                SUM(CASE WHEN feedback_rating = -1 THEN 1 ELSE 0 END) as thumbs_down,
-                SUM(CASE WHEN feedback_rating = 0 THEN 1 ELSE 0 END) as neutral,
-                AVG(total_duration_ms) as avg_duration_ms
-            FROM interactions
-        """).fetchone()
-        
-        tool_stats = conn.execute("""
-            SELECT 
-                tool_name,
-                COUNT(*) as call_count,
-                AVG(duration_ms) as avg_duration_ms,
-                SUM(CASE WHEN error IS NOT NULL THEN 1 ELSE 0 END) as error_count
-            FROM tool_calls
-            GROUP BY tool_name
-            ORDER BY call_count DESC
-        """).fetchall()
-        
-        # Count feedback categories
-        category_rows = conn.execute("""
-            SELECT feedback_categories FROM interactions 
-            WHERE feedback_categories IS NOT NULL AND feedback_categories != ''
-        """).fetchall()
+        with self._conn() as conn:
+            stats = conn.execute(_SQL_FEEDBACK_STATS).fetchone()
+            tool_stats = conn.execute(_SQL_TOOL_STATS).fetchall()
+            category_rows = conn.execute(_SQL_CATEGORY_COUNTS).fetchall()
         
         category_counts = {"speed": 0, "quality": 0, "accuracy": 0}
         for row in category_rows:
-            try:
-                categories = json.loads(row["feedback_categories"])
-                for cat in categories:
-                    if cat in category_counts:
-                        category_counts[cat] += 1
-            except (json.JSONDecodeError, TypeError):
-                pass
+            if row["category"] in category_counts:
+                category_counts[row["category"]] = row["count"]
         
         return {
             "total_interactions": stats["total_interactions"],
@@ -368,75 +566,105 @@ class InteractionStore:
     
     def get_negative_feedback(self, limit: int = 20) -> List[InteractionLog]:
         """Get interactions with negative feedback for review."""
-        conn = self._get_conn()
-        
-        rows = conn.execute(
-            "SELECT * FROM interactions WHERE feedback_rating = -1 ORDER BY feedback_timestamp DESC LIMIT ?",
-            (limit,)
-        ).fetchall()
-        
-        interactions = []
-        for row in rows:
-            tool_calls = conn.execute(
-                "SELECT * FROM tool_calls WHERE interaction_id = ?",
-                (row["interaction_id"],)
+        with self._conn() as conn:
+            rows = self._select(
+                conn,
+                _SQL_SELECT_NEGATIVE,
+                (limit,)
             ).fetchall()
-            interactions.append(self._row_to_interaction(row, tool_calls))
-        
-        return interactions
+            
+            return self._rows_to_interactions(conn, rows)
     
-    def export_to_json(self, filepath: str | Path, limit: int = None):
-        """Export interactions to JSON file."""
-        interactions = self.get_recent(limit) if limit else self.get_recent(10000)
+    def export_to_json(self, filepath: str | Path, limit: int = None, chunk_size: int = 500):
+        """
+        Export interactions (newest first) to a JSON file.
         
-        with open(filepath, "w") as f:
-            json.dump(
-                [i.to_dict() for i in interactions],
-                f,
-                indent=2
+        Rows are streamed from SQLite and written chunk by chunk, so memory
+        use is bounded by chunk_size rather than the size of the export.
+        """
+        count = 0
+        with self._conn() as conn, open(filepath, "wb") as f:
+            cursor = self._select(
+                conn,
+                _SQL_SELECT_RECENT,
+                (limit or 10000,)
             )
+            f.write(b"[")
+            while rows := cursor.fetchmany(chunk_size):
+                for interaction in self._rows_to_interactions(conn, rows):
+                    if orjson:
+                        # orjson serializes the dataclasses directly, without asdict()
+                        item = orjson.dumps(interaction, option=orjson.OPT_INDENT_2)
+                    else:
+                        item = json.dumps(interaction.to_dict(), indent=2).encode()
+                    # Nest each item one level deep, as json.dump(indent=2) would
+                    f.write(b",\n  " if count else b"\n  ")
+                    f.write(item.replace(b"\n", b"\n  "))
+                    count += 1
+            f.write(b"\n]" if count else b"]")
+        
+        logger.info(f"Exported {count} interactions to {filepath}")
+    
+    def _rows_to_interactions(self, conn: sqlite3.Connection, rows) -> List[InteractionLog]:
+        """Convert interaction rows to InteractionLogs, loading their tool calls in bulk."""
+        tool_calls_by_id: Dict[str, list] = {row[0]: [] for row in rows}
+        ids = list(tool_calls_by_id)
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            # Pad to a power of two (repeating an id doesn't change the IN
+            # result) so the statement cache only ever sees a few shapes
+            size = 1 << (len(chunk) - 1).bit_length()
+            chunk += chunk[-1:] * (size - len(chunk))
+            tc_rows = self._select(conn, _sql_tool_calls_in(size), chunk)
+            for tc in tc_rows:
+                tool_calls_by_id[tc[0]].append(tc)
         
-        logger.info(f"Exported {len(interactions)} interactions to {filepath}")
+        return [self._row_to_interaction(row, tool_calls_by_id[row[0]]) for row in rows]
     
     def _row_to_interaction(self, row, tool_call_rows) -> InteractionLog:
-        """Convert database rows to InteractionLog."""
+        """Convert database rows (tuples in _INTERACTION_COLS/_TC_COLS order) to InteractionLog."""
         tool_calls = [
             ToolCallLog(
-                tool_name=tc["tool_name"],
-                arguments=json.loads(tc["arguments"]),
-                result=tc["result"],
-                error=tc["error"],
-                duration_ms=tc["duration_ms"],
-                timestamp=tc["timestamp"],
+                tool_name=tool_name,
+                arguments=_loads(arguments),
+                result=result,
+                error=error,
+                duration_ms=duration_ms,
+                timestamp=timestamp,
             )
-            for tc in tool_call_rows
+            for _, tool_name, arguments, result, error, duration_ms, timestamp in tool_call_rows
         ]
         
+        (
+            interaction_id, session_id, timestamp, user_query, model_provider, model_name,
+            response, total_duration_ms, feedback_rating, feedback_comment,
+            feedback_categories, feedback_timestamp,
+        ) = row
+        
         # Parse feedback categories if present
         categories = None
         try:
-            if row["feedback_categories"]:
-                categories = json.loads(row["feedback_categories"])
-        except (json.JSONDecodeError, KeyError):
+            if feedback_categories:
+                categories = _loads(feedback_categories)
+        except json.JSONDecodeError:
             pass
         
         return InteractionLog(
-            interaction_id=row["interaction_id"],
-            session_id=row["session_id"],
-            timestamp=row["timestamp"],
-            user_query=row["user_query"],
-            model_provider=row["model_provider"],
-            model_name=row["model_name"],
-            response=row["response"],
+            interaction_id=interaction_id,
+            session_id=session_id,
+            timestamp=timestamp,
+            user_query=user_query,
+            model_provider=model_provider,
+            model_name=model_name,
+            response=response,
             tool_calls=tool_calls,
-            total_duration_ms=row["total_duration_ms"],
-            feedback_rating=row["feedback_rating"],
-            feedback_comment=row["feedback_comment"],
+            total_duration_ms=total_duration_ms,
+            feedback_rating=feedback_rating,
+            feedback_comment=feedback_comment,
             feedback_categories=categories,
-            feedback_timestamp=row["feedback_timestamp"],
+            feedback_timestamp=feedback_timestamp,
         )
 
-
 # Global instance (lazy initialization)
 _store: Optional[InteractionStore] = None
 
@@ -482,8 +710,8 @@ def create_interaction_log(
     ]
     
     return InteractionLog(
-        interaction_id=str(uuid.uuid4())[:12],
-        session_id=session_id or str(uuid.uuid4())[:8],
+        interaction_id=secrets.token_hex(6),
+        session_id=session_id or secrets.token_hex(4),
         timestamp=datetime.utcnow().isoformat(),
         user_query=user_query,
         response=response,
@@ -0,0 +1,124 @@
+"""
+Semantic response cache for the chat engine.
+
+Stores answered prompts in a ChromaDB collection (embedded with the same
+default embedding function as the email/meeting vector store) and returns a
+prior response when a new prompt is close enough in meaning, skipping the
+LLM round-trip and tool calls entirely.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger("exchange-backend.semantic_cache")
+
+# Words that don't change what a prompt asks for
+_STOPWORDS = frozenset("""
+    a an the and or but of in on at to for from by with about as is are was were
+    be been am do does did have has had i me my mine you your we us our it its
+    this that these those there here what whats which who whom how when where
+    can could would will shall should please show tell give list get find any
+    all some s t
+""".split())
+
+
+def _key_terms(text: str) -> FrozenSet[str]:
+    """
+    Content words that must match exactly for two prompts to share an answer.
+    
+    Embeddings place "open email 12" next to "open email 13" and "emails from
+    alice" next to "emails from bob", so every word other than a stopword
+    (lowercased, with a plural "s" dropped) is compared literally; the
+    embedding distance then only has to absorb phrasing and word order.
+    """
+    terms = set()
+    for word in re.findall(r"\w+", text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.add(word)
+    return frozenset(terms)
+
+
+class SemanticCache:
+    """Near-duplicate prompt cache, namespaced per user and model with a TTL."""
+    
+    COLLECTION_NAME = "chat_response_cache"
+    
+    def __init__(
+        self,
+        client,
+        namespace: str,
+        model: str = "",
+        max_distance: float = 0.15,
+        ttl_seconds: float = 600,
+    ):
+        """
+        Args:
+            client: ChromaDB client (e.g. VectorStore.client)
+            namespace: Cache partition, typically the user's email address
+            model: Answering model (e.g. "ollama:llama3.2"); other models'
+                   answers are never returned
+            max_distance: Cosine distance below which a cached prompt matches
+            ttl_seconds: Age after which entries are ignored, so mailbox
+                         changes are not masked by stale answers
+        """
+        self.namespace = namespace
+        self.model = model
+        self.max_distance = max_distance
+        self.ttl_seconds = ttl_seconds
+        self.collection = client.get_or_create_collection(
+            name=self.COLLECTION_NAME,
+            metadata={"hnsw:space": "cosine", "description": "Cached chat responses"},
+        )
+    
+    def lookup(self, message: str) -> Optional[Tuple[str, List[str]]]:
+        """Return (response, tools_used) for a fresh, similar prompt, or None."""
+        results = self.collection.query(
+            query_texts=[message],
+            n_results=1,
+            where={"$and": [
+                {"namespace": self.namespace},
+                {"model": self.model},
+                {"created": {"$gte": time.time() - self.ttl_seconds}},
+            ]},
+            include=["documents", "metadatas", "distances"],
+        )
+        
+        distances = results.get("distances") or [[]]
+        if not distances[0] or distances[0][0] >= self.max_distance:
+            return None
+        if _key_terms(results["documents"][0][0]) != _key_terms(message):
+            return None
+        
+        meta = results["metadatas"][0][0]
+        logger.info(f"Semantic cache hit (distance {distances[0][0]:.3f})")
+        return meta["response"], json.loads(meta["tools_used"])
+    
+    def store(self, message: str, response: str, tools_used: List[str]):
+        """Remember the response to a prompt (replacing any previous answer to it)."""
+        now = time.time()
+        # Expired entries are never returned, so drop them rather than let them pile up
+        self.collection.delete(where={"created": {"$lt": now - self.ttl_seconds}})
+        
+        key = hashlib.sha1(f"{self.namespace}\n{self.model}\n{message}".encode()).hexdigest()
+        self.collection.upsert(
+            ids=[key],
+            documents=[message],
+            metadatas=[{
+                "namespace": self.namespace,
+                "model": self.model,
+                "response": response,
+                "tools_used": json.dumps(tools_used),
+                "created": now,
+            }],
+        )
+    
+    def clear(self):
+        """Forget every answer in this namespace (for all models), e.g. after a data sync."""
+        self.collection.delete(where={"namespace": self.namespace})
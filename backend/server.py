@@ -5,33 +5,47 @@ FastAPI Backend Server for Exchange MCP Assistant.
 Provides:
 - REST API for chat interactions
 - WebSocket for streaming responses  
+- Server-sent event streams for actions
 - Background task for periodic data sync
 - Health/status endpoints
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import os
+import secrets
 import sys
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from exchange_mcp_server import server as mcp_server
-from backend.chat_engine import ChatEngine
+from backend.chat_engine import ChatEngine, TOOL_FUNCTIONS
+from backend.actions import REGISTERED_ACTIONS, ActionContext, clear_shared_tool_cache
+from backend.cache import cached, invalidate
 from backend.interaction_log import (
     get_interaction_store,
     create_interaction_log,
+    InteractionLog,
     InteractionStore,
 )
 
@@ -58,6 +72,9 @@ class Config:
     LLM_API_KEY: str = os.getenv("LLM_API_KEY", os.getenv("OPENAI_API_KEY", ""))
     LLM_BASE_URL: str = os.getenv("LLM_BASE_URL", "")
     
+    # Semantic chat cache lifetime (0 disables)
+    CHAT_CACHE_TTL_SECONDS: float = float(os.getenv("CHAT_CACHE_TTL_SECONDS", "600"))
+    
     # Sync settings
     SYNC_INTERVAL_MINUTES: int = int(os.getenv("SYNC_INTERVAL_MINUTES", "5"))
     
@@ -116,6 +133,7 @@ class Config:
             "model": cls.LLM_MODEL,
             "api_key": cls.LLM_API_KEY,
             "base_url": cls.LLM_BASE_URL,
+            "cache_ttl_seconds": cls.CHAT_CACHE_TTL_SECONDS,
         }
 
 
@@ -170,8 +188,18 @@ class SyncManager:
         """Perform an immediate sync."""
         logger.info("Starting data sync...")
         try:
-            # Run sync in thread pool (it's blocking IO)
-            result = await asyncio.to_thread(mcp_server.sync_data)
+            # Run sync in thread pool (it's blocking IO); emails and meetings
+            # are fetched and indexed concurrently once the source is reloaded
+            await asyncio.to_thread(mcp_server.reload_data)
+            emails, meetings = await asyncio.gather(
+                asyncio.to_thread(mcp_server.sync_emails),
+                asyncio.to_thread(mcp_server.sync_meetings),
+            )
+            result = {**emails, **meetings}
+            invalidate("inbox:", "calendar:", "meetings:", "status")
+            clear_shared_tool_cache()  # e.g. whoami's unread and meeting counts
+            if chat_engine is not None:
+                await asyncio.to_thread(chat_engine.clear_cache)
             self.last_sync = datetime.now()
             self.sync_count += 1
             logger.info(f"Sync complete: {result}")
@@ -190,8 +218,116 @@ class SyncManager:
         }
 
 
+class InteractionLogWriter:
+    """Writes interaction logs and feedback in batches from a background task."""
+    
+    def __init__(self, batch_size: int = 50, batch_window: float = 0.05):
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Queued logs not yet committed, so feedback can wait for them
+        self._pending: Dict[str, InteractionLog] = {}
+        # Queued feedback not yet committed, counted per interaction id
+        self._pending_feedback: Counter = Counter()
+    
+    async def start(self):
+        """Start the background writer task."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._write_loop())
+            logger.info("Interaction log writer started")
+    
+    async def stop(self):
+        """Write any queued logs and stop the background writer task."""
+        if self._task:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+            self._queue = None
+            logger.info("Interaction log writer stopped")
+    
+    async def log(self, interaction: InteractionLog) -> str:
+        """Queue an interaction for writing and return its id."""
+        if self._queue is None:
+            # Writer not running (e.g. app used without lifespan): write inline
+            store = get_interaction_store()
+            interaction_id = await asyncio.to_thread(store.log_interaction, interaction)
+            invalidate("fb:")
+            return interaction_id
+        self._pending[interaction.interaction_id] = interaction
+        await self._queue.put(interaction)
+        return interaction.interaction_id
+    
+    def is_known(self, interaction_id: str) -> bool:
+        """Check whether an interaction is queued (but not yet written)."""
+        return interaction_id in self._pending
+    
+    async def add_feedback(
+        self,
+        interaction_id: str,
+        rating: int,
+        comment: Optional[str] = None,
+        categories: Optional[list] = None
+    ):
+        """Queue feedback for an interaction that is logged or queued."""
+        feedback = (interaction_id, rating, comment, categories)
+        if self._queue is None:
+            store = get_interaction_store()
+            await asyncio.to_thread(store.add_feedback_batch, [feedback])
+            invalidate("fb:")
+            return
+        self._pending_feedback[interaction_id] += 1
+        await self._queue.put(feedback)
+    
+    async def flush_if_pending(self, interaction_id: str):
+        """Wait until the given interaction and its feedback (if queued) have been written."""
+        if self._queue is not None and (
+            interaction_id in self._pending or interaction_id in self._pending_feedback
+        ):
+            await self._queue.join()
+    
+    async def _write_loop(self):
+        """Background loop that drains the queue into batched writes."""
+        store = get_interaction_store()
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            try:
+                while batch[-1] is not None and len(batch) < self.batch_size:
+                    batch.append(await asyncio.wait_for(self._queue.get(), self.batch_window))
+            except asyncio.TimeoutError:
+                pass
+            
+            stopping = batch[-1] is None
+            logs = [item for item in batch if isinstance(item, InteractionLog)]
+            feedback = [item for item in batch if isinstance(item, tuple)]
+            # Logs go first so feedback queued right behind its interaction applies
+            if logs:
+                try:
+                    await asyncio.to_thread(store.log_interactions, logs)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(logs)} interaction logs: {e}")
+                for item in logs:
+                    self._pending.pop(item.interaction_id, None)
+            if feedback:
+                try:
+                    await asyncio.to_thread(store.add_feedback_batch, feedback)
+                except Exception as e:
+                    logger.error(f"Failed to write {len(feedback)} feedback entries: {e}")
+                for item in feedback:
+                    self._pending_feedback[item[0]] -= 1
+                    if self._pending_feedback[item[0]] <= 0:
+                        del self._pending_feedback[item[0]]
+            if logs or feedback:
+                invalidate("fb:")
+            for _ in batch:
+                self._queue.task_done()
+
+
 # Global instances
 sync_manager = SyncManager(interval_minutes=config.SYNC_INTERVAL_MINUTES)
+log_writer = InteractionLogWriter()
 chat_engine: Optional[ChatEngine] = None
 
 
@@ -207,7 +343,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Exchange MCP Backend...")
     logger.info(f"Data source: {config.DATA_SOURCE}")
-    logger.info(f"LLM provider: {config.LLM_PROVIDER}")
+    logger.info(f"LLM provider: {config.LLM_PROVIDER} ({config.LLM_MODEL})")
     logger.info(f"Data path: {config.DATA_PATH}")
     logger.info(f"ChromaDB path: {config.CHROMA_DB_PATH}")
     
@@ -221,17 +357,23 @@ async def lifespan(app: FastAPI):
     )
     logger.info("MCP server initialized")
     
+    # Bind the chat tools' underlying functions for actions
+    REGISTERED_ACTIONS.set_tools({fn.__name__: fn for fn in TOOL_FUNCTIONS})
+    
     # Initialize chat engine with configured LLM
     llm_config = config.get_llm_config()
     chat_engine = ChatEngine(**llm_config)
     
-    # Start sync manager
+    # Start sync manager and interaction log writer
     await sync_manager.start()
+    await log_writer.start()
     
     yield
     
     # Shutdown
     await sync_manager.stop()
+    await log_writer.stop()
+    await asyncio.to_thread(get_interaction_store().optimize)
     logger.info("Backend shutdown complete")
 
 
@@ -239,7 +381,9 @@ app = FastAPI(
     title="Exchange MCP Backend",
     description="Backend API for Exchange email/calendar assistant",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Encode JSON responses with orjson when it is installed
+    default_response_class=ORJSONResponse if orjson else JSONResponse,
 )
 
 # CORS middleware for frontend
@@ -260,6 +404,7 @@ class ChatRequest(BaseModel):
     """Chat request model."""
     message: str
     session_id: Optional[str] = None
+    no_cache: bool = False  # Bypass the semantic response cache
     
 class ChatResponse(BaseModel):
     """Chat response model."""
@@ -290,6 +435,12 @@ class FeedbackResponse(BaseModel):
     message: str
 
 
+class ActionRequest(BaseModel):
+    """Action execution request model."""
+    variables: dict = {}  # Context variables, e.g. {"format": "json"}
+    session_id: Optional[str] = None
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -307,11 +458,28 @@ async def health():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
-@app.get("/api/status")
-async def status():
-    """Get system status including user info, stats, and sync status."""
+def _render_json(payload) -> bytes:
+    """Serialize a payload once so cached endpoints can serve the same bytes."""
+    if orjson:
+        return orjson.dumps(payload)
+    # Same output as JSONResponse
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+# /api/status is polled by the UI; concurrent pollers share one refresh per TTL
+STATUS_TTL_SECONDS = 2.0
+
+
+async def _load_status() -> dict:
+    """Gather the /api/status payload, running the data source calls concurrently."""
     data_loader = mcp_server.data_source
-    me = data_loader.get_me()
+    me, unread, todays_meetings, email_stats, meeting_stats = await asyncio.gather(
+        asyncio.to_thread(data_loader.get_me),
+        asyncio.to_thread(data_loader.get_unread_count),
+        asyncio.to_thread(data_loader.get_todays_meetings),
+        asyncio.to_thread(data_loader.get_email_stats),
+        asyncio.to_thread(data_loader.get_meeting_stats),
+    )
     
     return {
         "user": {
@@ -321,32 +489,34 @@ async def status():
             "title": me.get("JobTitle")
         },
         "stats": {
-            "unread_emails": data_loader.get_unread_count(),
-            "meetings_today": len(data_loader.get_todays_meetings()),
-            "total_emails": data_loader.get_email_stats().get("total", 0),
-            "total_meetings": data_loader.get_meeting_stats().get("total", 0)
+            "unread_emails": unread,
+            "meetings_today": len(todays_meetings),
+            "total_emails": email_stats.get("total", 0),
+            "total_meetings": meeting_stats.get("total", 0)
         },
         "sync": sync_manager.get_status(),
         "model": f"{config.LLM_PROVIDER}:{config.LLM_MODEL}"
     }
 
 
+@app.get("/api/status")
+async def status():
+    """Get system status including user info, stats, and sync status."""
+    return await cached("status", STATUS_TTL_SECONDS, _load_status)
+
+
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """Send a chat message and get a response."""
-    import time
-    
     if not chat_engine:
         raise HTTPException(status_code=503, detail="Chat engine not initialized")
     
-    start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     
     try:
-        response, tools_used = await asyncio.to_thread(
-            chat_engine.chat, request.message
-        )
+        response, tools_used = await chat_engine.achat(request.message, request.no_cache)
         
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         # Log the interaction
         interaction_log = create_interaction_log(
@@ -359,8 +529,7 @@ async def chat(request: ChatRequest):
             session_id=request.session_id,
         )
         
-        store = get_interaction_store()
-        interaction_id = store.log_interaction(interaction_log)
+        interaction_id = await log_writer.log(interaction_log)
         
         return ChatResponse(
             response=response,
@@ -385,60 +554,98 @@ async def trigger_sync():
 
 @app.post("/api/feedback", response_model=FeedbackResponse)
 async def submit_feedback(request: FeedbackRequest):
-    """Submit feedback for an interaction."""
+    """Submit feedback for an interaction (written behind, in batches)."""
     store = get_interaction_store()
+    if not (
+        log_writer.is_known(request.interaction_id)
+        or await asyncio.to_thread(store.has_interaction, request.interaction_id)
+    ):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Interaction not found: {request.interaction_id}"
+        )
     
-    success = store.add_feedback(
+    await log_writer.add_feedback(
         interaction_id=request.interaction_id,
         rating=request.rating,
         comment=request.comment,
         categories=request.categories
     )
+    return FeedbackResponse(
+        success=True,
+        message="Feedback recorded successfully"
+    )
+
+
+# Distinguishes ETags across restarts, since the store version starts at 0
+_ETAG_EPOCH = secrets.token_hex(4)
+
+
+async def _versioned_json(request: Request, key: str, ttl: float, load) -> Response:
+    """
+    Serve a JSON body for the interaction store's current version.
     
-    if success:
-        return FeedbackResponse(
-            success=True,
-            message="Feedback recorded successfully"
-        )
-    else:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Interaction not found: {request.interaction_id}"
-        )
+    Answers 304 when the client's If-None-Match already names that version;
+    otherwise the rendered body is cached per version, so any write to the
+    store yields a fresh body and ETag.
+    """
+    version = get_interaction_store().version
+    etag = f'W/"{_ETAG_EPOCH}-{version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    body = await cached(f"{key}:v{version}", ttl, load)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/feedback/stats")
-async def get_feedback_stats():
+async def get_feedback_stats(request: Request):
     """Get aggregate feedback statistics."""
     store = get_interaction_store()
-    return store.get_feedback_stats()
+    
+    async def load() -> bytes:
+        return _render_json(await asyncio.to_thread(store.get_feedback_stats))
+    
+    return await _versioned_json(request, "fb:stats", 60, load)
 
 
 @app.get("/api/feedback/recent")
-async def get_recent_interactions(limit: int = 50):
+async def get_recent_interactions(request: Request, limit: int = 50):
     """Get recent interactions with their feedback status."""
     store = get_interaction_store()
-    interactions = store.get_recent(limit=limit)
-    return {
-        "count": len(interactions),
-        "interactions": [i.to_dict() for i in interactions]
-    }
+    
+    async def load() -> bytes:
+        interactions = await asyncio.to_thread(store.get_recent, limit=limit)
+        return _render_json({
+            "count": len(interactions),
+            "interactions": [i.to_dict() for i in interactions]
+        })
+    
+    return await _versioned_json(request, f"fb:recent:{limit}", 10, load)
 
 
 @app.get("/api/feedback/negative")
-async def get_negative_feedback(limit: int = 20):
+async def get_negative_feedback(request: Request, limit: int = 20):
     """Get interactions with negative feedback for review."""
     store = get_interaction_store()
-    interactions = store.get_negative_feedback(limit=limit)
-    return {
-        "count": len(interactions),
-        "interactions": [i.to_dict() for i in interactions]
-    }
+    
+    async def load() -> bytes:
+        interactions = await asyncio.to_thread(store.get_negative_feedback, limit=limit)
+        return _render_json({
+            "count": len(interactions),
+            "interactions": [i.to_dict() for i in interactions]
+        })
+    
+    return await _versioned_json(request, f"fb:neg:{limit}", 10, load)
 
 
 @app.get("/api/feedback/{interaction_id}")
 async def get_interaction(interaction_id: str):
     """Get details of a specific interaction."""
+    await log_writer.flush_if_pending(interaction_id)
     store = get_interaction_store()
     interaction = store.get_interaction(interaction_id)
     
@@ -454,81 +661,196 @@ async def get_interaction(interaction_id: str):
 @app.get("/api/inbox")
 async def get_inbox(limit: int = 10, unread_only: bool = False):
     """Get inbox emails."""
-    data_loader = mcp_server.data_source
-    emails = data_loader.get_inbox(limit=limit, unread_only=unread_only)
-    return {
-        "count": len(emails),
-        "unread_total": data_loader.get_unread_count(),
-        "emails": [
-            {
-                "id": e["Id"],
-                "subject": e["Subject"],
-                "from": e.get("FromName") or e["From"],
-                "date": e["ReceivedDate"],
-                "is_read": e.get("IsRead", False),
-                "importance": e.get("Importance", "Normal"),
-                "preview": e.get("Body", "")[:150]
-            }
-            for e in emails
-        ]
-    }
+    async def load() -> bytes:
+        data_loader = mcp_server.data_source
+        cols = data_loader.get_inbox_projection(limit=limit, unread_only=unread_only)
+        return _render_json({
+            "count": len(cols.ids),
+            "unread_total": data_loader.get_unread_count(),
+            "emails": [
+                {
+                    "id": id_,
+                    "subject": subject,
+                    "from": sender,
+                    "date": date,
+                    "is_read": is_read,
+                    "importance": importance,
+                    "preview": preview
+                }
+                for id_, subject, sender, date, is_read, importance, preview in zip(
+                    cols.ids, cols.subjects, cols.senders, cols.dates,
+                    cols.is_read, cols.importance, cols.previews,
+                )
+            ]
+        })
+    
+    body = await cached(f"inbox:{limit}:{unread_only}", 10, load)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/calendar")
 async def get_calendar(days: int = 7):
     """Get upcoming meetings."""
-    data_loader = mcp_server.data_source
-    meetings = data_loader.get_calendar(days=days)
-    return {
-        "days_ahead": days,
-        "count": len(meetings),
-        "meetings": [
-            {
-                "id": m["Id"],
-                "subject": m["Subject"],
-                "organizer": m.get("OrganizerName") or m["Organizer"],
-                "start": m["StartTime"],
-                "end": m["EndTime"],
-                "location": m.get("Location", "")
-            }
-            for m in meetings
-        ]
-    }
+    async def load() -> bytes:
+        cols = mcp_server.data_source.get_calendar_projection(days=days)
+        return _render_json({
+            "days_ahead": days,
+            "count": len(cols.ids),
+            "meetings": [
+                {
+                    "id": id_,
+                    "subject": subject,
+                    "organizer": organizer,
+                    "start": start,
+                    "end": end,
+                    "location": location
+                }
+                for id_, subject, organizer, start, end, location in zip(*cols)
+            ]
+        })
+    
+    body = await cached(f"calendar:{days}", 10, load)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/meetings/today")
 async def get_todays_meetings():
     """Get today's meetings."""
-    data_loader = mcp_server.data_source
-    meetings = data_loader.get_todays_meetings()
-    return {
-        "count": len(meetings),
-        "meetings": [
-            {
-                "id": m["Id"],
-                "subject": m["Subject"],
-                "start": m["StartTime"],
-                "end": m["EndTime"],
-                "location": m.get("Location", ""),
-                "organizer": m.get("OrganizerName") or m["Organizer"]
-            }
-            for m in meetings
-        ]
-    }
+    async def load() -> bytes:
+        cols = mcp_server.data_source.get_todays_projection()
+        return _render_json({
+            "count": len(cols.ids),
+            "meetings": [
+                {
+                    "id": id_,
+                    "subject": subject,
+                    "start": start,
+                    "end": end,
+                    "location": location,
+                    "organizer": organizer
+                }
+                for id_, subject, organizer, start, end, location in zip(*cols)
+            ]
+        })
+    
+    body = await cached("meetings:today", 10, load)
+    return Response(content=body, media_type="application/json")
+
+
+# ============================================================================
+# Actions API Endpoints
+# ============================================================================
+
+@app.get("/api/actions")
+async def list_actions():
+    """List registered actions."""
+    return {"actions": REGISTERED_ACTIONS.list_actions()}
+
+
+@app.post("/api/actions/{action_name}/stream")
+async def stream_action(action_name: str, request: ActionRequest):
+    """
+    Run an action, streaming its progress as server-sent events.
+    
+    Each event is named after its type (e.g. "briefing", "conflicts"); the
+    final "result" event carries the full ActionResult with its trace.
+    """
+    context_kwargs = {"session_id": request.session_id} if request.session_id else {}
+    context = ActionContext(
+        user_query=f"action:{action_name}",
+        model_name=config.LLM_MODEL,
+        provider=config.LLM_PROVIDER,
+        variables=dict(request.variables),
+        **context_kwargs,
+    )
+    
+    try:
+        events = REGISTERED_ACTIONS.astream(action_name, context)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    async def event_source():
+        async for event in events:
+            if event["type"] == "result":
+                event = {**event, "data": event["data"].to_dict()}
+            yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+    
+    return StreamingResponse(event_source(), media_type="text/event-stream")
 
 
 # ============================================================================
 # WebSocket for Streaming Chat
 # ============================================================================
 
+class WebSocketSender:
+    """
+    Sends websocket frames from a background task, in order.
+    
+    Token deltas arriving within a short window are coalesced into a single
+    {"type": "tokens", "content": [...]} frame instead of one frame each.
+    """
+    
+    _CLOSE = object()
+    
+    def __init__(self, websocket: WebSocket, max_tokens: int = 16, window: float = 0.02):
+        self.websocket = websocket
+        self.max_tokens = max_tokens
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._send_loop())
+    
+    def send(self, frame: dict):
+        """Queue a frame to send as-is (after any tokens queued before it)."""
+        self._queue.put_nowait(frame)
+    
+    def token(self, delta: str):
+        """Queue a token delta for batching."""
+        self._queue.put_nowait(delta)
+    
+    async def close(self):
+        """Send everything queued so far, then stop the sender task."""
+        self._queue.put_nowait(self._CLOSE)
+        try:
+            await self._task
+        except Exception as e:
+            logger.debug(f"WebSocket sender stopped: {e}")
+    
+    async def _send_loop(self):
+        """Background loop that drains the queue onto the websocket."""
+        loop = asyncio.get_running_loop()
+        item = await self._queue.get()
+        while item is not self._CLOSE:
+            if isinstance(item, dict):
+                await self.websocket.send_json(item)
+                item = await self._queue.get()
+                continue
+            
+            # Collect further deltas until the window closes or a frame arrives
+            tokens = [item]
+            item = None
+            deadline = loop.time() + self.window
+            while len(tokens) < self.max_tokens:
+                try:
+                    nxt = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if not isinstance(nxt, str):
+                    item = nxt
+                    break
+                tokens.append(nxt)
+            
+            await self.websocket.send_json({"type": "tokens", "content": tokens})
+            if item is None:
+                item = await self._queue.get()
+
+
 @app.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket):
     """WebSocket endpoint for streaming chat."""
-    import time
-    
     await websocket.accept()
     logger.info("WebSocket client connected")
     
+    sender = WebSocketSender(websocket)
     session_id = None
     
     try:
@@ -542,17 +864,25 @@ async def websocket_chat(websocket: WebSocket):
                 session_id = message.get("session_id", session_id)
                 
                 # Send "thinking" status
-                await websocket.send_json({"type": "status", "content": "thinking"})
+                sender.send({"type": "status", "content": "thinking"})
                 
-                start_time = time.perf_counter()
+                start_ns = time.perf_counter_ns()
                 
-                # Get response
+                # Stream the response as it is generated
                 try:
-                    response, tools_used = await asyncio.to_thread(
-                        chat_engine.chat, user_message
-                    )
+                    parts = []
+                    tools_used = []
+                    async for delta, tools_used in chat_engine.chat_stream(user_message):
+                        if delta is None:
+                            # That text preceded tool calls; the answer comes later
+                            parts = []
+                            sender.send({"type": "reset"})
+                            continue
+                        parts.append(delta)
+                        sender.token(delta)
+                    response = "".join(parts)
                     
-                    duration_ms = (time.perf_counter() - start_time) * 1000
+                    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                     
                     # Log the interaction
                     interaction_log = create_interaction_log(
@@ -565,26 +895,28 @@ async def websocket_chat(websocket: WebSocket):
                         session_id=session_id,
                     )
                     
-                    store = get_interaction_store()
-                    interaction_id = store.log_interaction(interaction_log)
-                    
-                    await websocket.send_json({
-                        "type": "response",
+                    # The id is assigned up front, so the final frame is queued
+                    # before the log is handed to the background writer
+                    sender.send({
+                        "type": "done",
                         "content": response,
                         "tools_used": tools_used,
-                        "interaction_id": interaction_id
+                        "interaction_id": interaction_log.interaction_id
                     })
+                    await log_writer.log(interaction_log)
                 except Exception as e:
-                    await websocket.send_json({
+                    sender.send({
                         "type": "error",
                         "content": str(e)
                     })
             
             elif message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                sender.send({"type": "pong"})
                 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
+    finally:
+        await sender.close()
 
 
 # ============================================================================
@@ -595,14 +927,39 @@ async def websocket_chat(websocket: WebSocket):
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
 
 
+dashboard_path = os.path.join(frontend_path, "dashboard.html")
+
+
+def _load_page(path: str) -> Optional[tuple]:
+    """Read a static page once, returning (body, gzipped body, ETag) or None if missing."""
+    try:
+        with open(path, "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    return body, gzip.compress(body, 9), f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+# The dashboard is polled often; serve it from memory rather than the disk
+_dashboard_page = _load_page(dashboard_path)
+
+
 @app.get("/dashboard.html")
 @app.get("/dashboard")
-async def dashboard():
+async def dashboard(request: Request):
     """Serve the feedback dashboard."""
-    dashboard_path = os.path.join(frontend_path, "dashboard.html")
-    if os.path.exists(dashboard_path):
-        return FileResponse(dashboard_path)
-    return {"error": "Dashboard not found", "path": dashboard_path}
+    if _dashboard_page is None:
+        return {"error": "Dashboard not found", "path": dashboard_path}
+    
+    body, body_gz, etag = _dashboard_page
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = body_gz
+    return Response(content=body, media_type="text/html", headers=headers)
 
 
 # Mount frontend static files AFTER explicit routes
@@ -618,16 +975,12 @@ def main():
     """Run the server."""
     import uvicorn
     
-    print(f"""
-╔══════════════════════════════════════════════════════════════╗
-║           Exchange MCP Backend Server                       ║
-╠══════════════════════════════════════════════════════════════╣
-║  Host:          http://{config.HOST}:{config.PORT}                       ║
-║  LLM:           {config.LLM_PROVIDER}:{config.LLM_MODEL:<15}                 ║
-║  Sync Interval: {config.SYNC_INTERVAL_MINUTES} minutes                                   ║
-║  Debug:         {str(config.DEBUG):<5}                                      ║
-╚══════════════════════════════════════════════════════════════╝
-    """)
+    # Startup details are logged by the lifespan and uvicorn; the summary is for debugging
+    if config.DEBUG:
+        logger.info("Exchange MCP Backend Server")
+        logger.info("  Host:          http://%s:%s", config.HOST, config.PORT)
+        logger.info("  LLM:           %s:%s", config.LLM_PROVIDER, config.LLM_MODEL)
+        logger.info("  Sync interval: %s minutes", config.SYNC_INTERVAL_MINUTES)
     
     uvicorn.run(
         "backend.server:app",
@@ -20,10 +20,76 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, NamedTuple
 from datetime import datetime
 
 
+PREVIEW_LENGTH = 150
+
+
+class EmailColumns(NamedTuple):
+    """Column-oriented view of a list of emails, ready to zip into tool output."""
+    ids: tuple
+    subjects: tuple
+    senders: tuple      # FromName or From
+    recipients: tuple   # ToName or To
+    dates: tuple
+    is_read: tuple
+    importance: tuple
+    previews: tuple     # Body truncated to PREVIEW_LENGTH with "..."
+    snippets: tuple     # First 100 characters of Body
+
+
+class MeetingColumns(NamedTuple):
+    """Column-oriented view of a list of meetings, ready to zip into tool output."""
+    ids: tuple
+    subjects: tuple
+    organizers: tuple   # OrganizerName or Organizer
+    starts: tuple
+    ends: tuple
+    locations: tuple
+
+
+def preview(body: str, length: int = PREVIEW_LENGTH) -> str:
+    """Truncate body to length characters, marking the cut with "..."."""
+    return body if len(body) <= length else body[:length] + "..."
+
+
+def email_row(email: dict) -> tuple:
+    """Display fields of an email, in EmailColumns order."""
+    body = email.get("Body", "")
+    return (
+        email["Id"],
+        email["Subject"],
+        email.get("FromName") or email["From"],
+        email.get("ToName") or email["To"],
+        email["ReceivedDate"],
+        email.get("IsRead", False),
+        email.get("Importance", "Normal"),
+        preview(body),
+        body[:100],
+    )
+
+
+def meeting_row(meeting: dict) -> tuple:
+    """Display fields of a meeting, in MeetingColumns order."""
+    return (
+        meeting["Id"],
+        meeting["Subject"],
+        meeting.get("OrganizerName") or meeting["Organizer"],
+        meeting["StartTime"],
+        meeting["EndTime"],
+        meeting.get("Location", ""),
+    )
+
+
+def _transpose(columns_type, rows: list[tuple]):
+    """Turn display rows into a columns_type of per-field tuples."""
+    if not rows:
+        return columns_type(*([()] * len(columns_type._fields)))
+    return columns_type(*zip(*rows))
+
+
 class DataSourceBase(ABC):
     """Abstract base class for all data sources."""
     
@@ -136,6 +202,38 @@ class DataSourceBase(ABC):
     def get_meeting_stats(self) -> dict:
         """Get meeting statistics."""
         pass
+    
+    # =========================================================================
+    # Projections
+    # =========================================================================
+    
+    def _email_rows(self, emails: list[dict]) -> list[tuple]:
+        """Display rows for emails; sources that precompute them override this."""
+        return [email_row(e) for e in emails]
+    
+    def _meeting_rows(self, meetings: list[dict]) -> list[tuple]:
+        """Display rows for meetings; sources that precompute them override this."""
+        return [meeting_row(m) for m in meetings]
+    
+    def get_inbox_projection(self, limit: int = 20, unread_only: bool = False) -> EmailColumns:
+        """Get inbox emails as display columns."""
+        rows = self._email_rows(self.get_inbox(limit=limit, unread_only=unread_only))
+        return _transpose(EmailColumns, rows)
+    
+    def get_sent_projection(self, limit: int = 20) -> EmailColumns:
+        """Get sent emails as display columns."""
+        rows = self._email_rows(self.get_sent_items(limit=limit))
+        return _transpose(EmailColumns, rows)
+    
+    def get_calendar_projection(self, days: int = 7, include_past: bool = False) -> MeetingColumns:
+        """Get calendar events as display columns."""
+        rows = self._meeting_rows(self.get_calendar(days=days, include_past=include_past))
+        return _transpose(MeetingColumns, rows)
+    
+    def get_todays_projection(self) -> MeetingColumns:
+        """Get today's meetings as display columns."""
+        rows = self._meeting_rows(self.get_todays_meetings())
+        return _transpose(MeetingColumns, rows)
 
 
 def create_data_source(
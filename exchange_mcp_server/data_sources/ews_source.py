@@ -18,10 +18,25 @@ Usage:
 """
 
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from exchange_mcp_server.data_sources import DataSourceBase
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to Python counting
+    np = None
+
+from exchange_mcp_server.data_sources import (
+    DataSourceBase,
+    EmailColumns,
+    MeetingColumns,
+    _transpose,
+    preview,
+)
 
 logger = logging.getLogger("exchange-mcp.ews")
 
@@ -34,6 +49,29 @@ class EWSDataSource(DataSourceBase):
     Uses the exchangelib Python library.
     """
     
+    # Item fields requested from EWS (via QuerySet.only), so responses carry
+    # just what _convert_* and the display rows read instead of every property
+    MESSAGE_FIELDS = (
+        "subject", "sender", "to_recipients", "text_body", "body",
+        "datetime_received", "is_read", "importance", "has_attachments",
+    )
+    MESSAGE_ROW_FIELDS = (
+        "subject", "sender", "to_recipients", "text_body", "body",
+        "datetime_received", "is_read", "importance",
+    )
+    EVENT_FIELDS = (
+        "subject", "start", "end", "location", "organizer", "required_attendees",
+        "text_body", "body", "is_all_day", "is_cancelled",
+    )
+    EVENT_ROW_FIELDS = ("subject", "start", "end", "location", "organizer")
+    
+    # Seconds get_meeting_stats reuses its last result (each refresh is an EWS round-trip)
+    MEETING_STATS_TTL = 60.0
+    
+    # ResolveNames results are memoized per (query, limit); the GAL rarely changes
+    COLLEAGUE_SEARCH_TTL = 300.0
+    COLLEAGUE_SEARCH_CACHE_SIZE = 512
+    
     def __init__(
         self,
         email: str,
@@ -60,11 +98,18 @@ class EWSDataSource(DataSourceBase):
         
         self._account = None
         self._me: dict = {}
+        self._meeting_stats: tuple[float, dict] | None = None  # (computed_at, stats)
+        # (query, limit) -> (fetched_at, results), least recently used first
+        self._colleague_search: OrderedDict[tuple[str, int], tuple[float, list[dict]]] = OrderedDict()
+        self._colleague_search_lock = threading.Lock()  # tools may search from several threads
+        self._tz = None  # EWSTimeZone.localzone(), resolved once in initialize()
+        # (today, days, include_past) -> (start, end); only today's windows are kept
+        self._date_windows: dict[tuple[date, int, bool], tuple] = {}
     
     def initialize(self) -> None:
         """Initialize the EWS connection."""
         try:
-            from exchangelib import Credentials, Account, Configuration, DELEGATE
+            from exchangelib import Credentials, Account, Configuration, DELEGATE, EWSTimeZone
             from exchangelib.protocol import BaseProtocol, NoVerifyHTTPAdapter
         except ImportError as e:
             raise ImportError(
@@ -74,6 +119,9 @@ class EWSDataSource(DataSourceBase):
         
         logger.info(f"Connecting to Exchange as {self.email}...")
         
+        # localzone() reads the system tz database; do it once, not per query
+        self._tz = EWSTimeZone.localzone()
+        
         # Create credentials
         credentials = Credentials(self.username, self.password)
         
@@ -139,9 +187,26 @@ class EWSDataSource(DataSourceBase):
         return []
     
     def search_colleagues(self, query: str, limit: int = 10) -> list[dict]:
-        """Search colleagues using Exchange resolve names."""
-        from exchangelib import ResolveNames
+        """Search colleagues using Exchange resolve names (memoized for COLLEAGUE_SEARCH_TTL)."""
+        key = (query.strip().lower(), limit)
+        now = time.monotonic()
+        with self._colleague_search_lock:
+            cached = self._colleague_search.get(key)
+            if cached is not None and now - cached[0] <= self.COLLEAGUE_SEARCH_TTL:
+                self._colleague_search.move_to_end(key)
+                return [dict(c) for c in cached[1]]
         
+        results = self._resolve_colleagues(query, limit)
+        if results is not None:
+            with self._colleague_search_lock:
+                self._colleague_search[key] = (now, results)
+                self._colleague_search.move_to_end(key)
+                while len(self._colleague_search) > self.COLLEAGUE_SEARCH_CACHE_SIZE:
+                    self._colleague_search.popitem(last=False)
+        return [dict(c) for c in results or []]
+    
+    def _resolve_colleagues(self, query: str, limit: int) -> list[dict] | None:
+        """Run ResolveNames against the GAL; None if the lookup failed."""
         results = []
         try:
             # Use ResolveName to search GAL
@@ -158,6 +223,7 @@ class EWSDataSource(DataSourceBase):
                         break
         except Exception as e:
             logger.warning(f"Error searching GAL: {e}")
+            return None
         
         return results
     
@@ -185,7 +251,7 @@ class EWSDataSource(DataSourceBase):
             "ReceivedDate": msg.datetime_received.isoformat() if msg.datetime_received else "",
             "IsRead": msg.is_read,
             "Importance": str(msg.importance) if msg.importance else "Normal",
-            "HasAttachments": bool(msg.attachments),
+            "HasAttachments": bool(msg.has_attachments),
             "FolderPath": "Inbox"
         }
     
@@ -202,24 +268,58 @@ class EWSDataSource(DataSourceBase):
         except Exception:
             return None
     
-    def get_inbox(self, limit: int = 20, unread_only: bool = False) -> list[dict]:
-        """Get inbox emails."""
-        from exchangelib import Message
+    def _message_rows(self, queryset) -> list[tuple]:
+        """
+        Display rows (EmailColumns order) read straight off EWS messages.
         
+        Skips _convert_message, so fields the list views don't show (such
+        as attachments) are never touched; pair with MESSAGE_ROW_FIELDS.
+        """
+        rows = []
+        for msg in queryset:
+            sender = msg.sender
+            body = msg.text_body or (msg.body or "")
+            rows.append((
+                msg.id if hasattr(msg, 'id') else str(msg.item_id),
+                msg.subject or "",
+                (sender.name or sender.email_address) if sender else "",
+                [r.email_address for r in (msg.to_recipients or [])],
+                msg.datetime_received.isoformat() if msg.datetime_received else "",
+                msg.is_read,
+                str(msg.importance) if msg.importance else "Normal",
+                preview(body),
+                body[:100],
+            ))
+        return rows
+    
+    def _inbox_query(self, limit: int, unread_only: bool, fields: tuple):
+        """Queryset of the newest inbox messages, fetching only fields."""
         queryset = self._account.inbox.filter(is_read=False) if unread_only else self._account.inbox.all()
-        queryset = queryset.order_by('-datetime_received')[:limit]
-        
-        return [self._convert_message(m) for m in queryset]
+        return queryset.only(*fields).order_by('-datetime_received')[:limit]
+    
+    def _sent_query(self, limit: int, fields: tuple):
+        """Queryset of the newest sent messages, fetching only fields."""
+        return self._account.sent.all().only(*fields).order_by('-datetime_sent')[:limit]
+    
+    def get_inbox(self, limit: int = 20, unread_only: bool = False) -> list[dict]:
+        """Get inbox emails."""
+        return [self._convert_message(m) for m in self._inbox_query(limit, unread_only, self.MESSAGE_FIELDS)]
+    
+    def get_inbox_projection(self, limit: int = 20, unread_only: bool = False) -> EmailColumns:
+        """Get inbox emails as display columns."""
+        return _transpose(EmailColumns, self._message_rows(self._inbox_query(limit, unread_only, self.MESSAGE_ROW_FIELDS)))
     
     def get_sent_items(self, limit: int = 20) -> list[dict]:
         """Get sent emails."""
-        queryset = self._account.sent.all().order_by('-datetime_sent')[:limit]
-        
-        emails = [self._convert_message(m) for m in queryset]
+        emails = [self._convert_message(m) for m in self._sent_query(limit, self.MESSAGE_FIELDS)]
         for e in emails:
             e["FolderPath"] = "Sent Items"
         return emails
     
+    def get_sent_projection(self, limit: int = 20) -> EmailColumns:
+        """Get sent emails as display columns."""
+        return _transpose(EmailColumns, self._message_rows(self._sent_query(limit, self.MESSAGE_ROW_FIELDS)))
+    
     def get_unread_count(self) -> int:
         """Get count of unread emails."""
         return self._account.inbox.unread_count
@@ -255,35 +355,78 @@ class EWSDataSource(DataSourceBase):
         except Exception:
             return None
     
+    def _event_rows(self, queryset) -> list[tuple]:
+        """Display rows (MeetingColumns order) read straight off EWS calendar items."""
+        rows = []
+        for event in queryset:
+            organizer = event.organizer
+            rows.append((
+                event.id if hasattr(event, 'id') else str(event.item_id),
+                event.subject or "",
+                organizer.email_address if organizer else "",
+                event.start.isoformat() if event.start else "",
+                event.end.isoformat() if event.end else "",
+                event.location or "",
+            ))
+        return rows
+    
     def get_calendar(self, days: int = 7, include_past: bool = False) -> list[dict]:
         """Get calendar events."""
-        from exchangelib import EWSDateTime, EWSTimeZone
+        return [self._convert_event(e) for e in self._calendar_query(days, include_past).only(*self.EVENT_FIELDS)]
+    
+    def get_calendar_projection(self, days: int = 7, include_past: bool = False) -> MeetingColumns:
+        """Get calendar events as display columns."""
+        return _transpose(MeetingColumns, self._event_rows(self._calendar_query(days, include_past).only(*self.EVENT_ROW_FIELDS)))
+    
+    def _calendar_query(self, days: int, include_past: bool):
+        """Calendar view from today (or a week back) through days ahead."""
+        start_ews, end_ews = self._date_window(days, include_past)
+        return self._account.calendar.view(start=start_ews, end=end_ews)
+    
+    def _date_window(self, days: int, include_past: bool) -> tuple:
+        """
+        Localized (start, end) bounds for a calendar view, memoized for today.
+        
+        Args:
+            days: Days ahead of today the window ends (0 = end of today)
+            include_past: Start a week before today instead of today
         
-        tz = EWSTimeZone.localzone()
-        now = datetime.now()
-        start = now - timedelta(days=7) if include_past else now
-        end = now + timedelta(days=days)
+        Returns:
+            (start, end) EWSDateTimes at midnight and 23:59:59
+        """
+        today = date.today()
+        key = (today, days, include_past)
+        window = self._date_windows.get(key)
+        if window is not None:
+            return window
         
-        start_ews = tz.localize(EWSDateTime(start.year, start.month, start.day))
-        end_ews = tz.localize(EWSDateTime(end.year, end.month, end.day, 23, 59, 59))
+        from exchangelib import EWSDateTime
         
-        queryset = self._account.calendar.view(start=start_ews, end=end_ews)
+        tz = self._tz
+        start = today - timedelta(days=7) if include_past else today
+        end = today + timedelta(days=days)
+        window = (
+            tz.localize(EWSDateTime(start.year, start.month, start.day)),
+            tz.localize(EWSDateTime(end.year, end.month, end.day, 23, 59, 59)),
+        )
         
-        return [self._convert_event(e) for e in queryset]
+        if any(k[0] != today for k in list(self._date_windows)):
+            self._date_windows = {}
+        self._date_windows[key] = window
+        return window
     
     def get_todays_meetings(self) -> list[dict]:
         """Get today's meetings."""
-        from exchangelib import EWSDateTime, EWSTimeZone
-        
-        tz = EWSTimeZone.localzone()
-        today = datetime.now().date()
-        
-        start = tz.localize(EWSDateTime(today.year, today.month, today.day))
-        end = tz.localize(EWSDateTime(today.year, today.month, today.day, 23, 59, 59))
-        
-        queryset = self._account.calendar.view(start=start, end=end)
-        
-        return [self._convert_event(e) for e in queryset]
+        return [self._convert_event(e) for e in self._todays_query().only(*self.EVENT_FIELDS)]
+    
+    def get_todays_projection(self) -> MeetingColumns:
+        """Get today's meetings as display columns."""
+        return _transpose(MeetingColumns, self._event_rows(self._todays_query().only(*self.EVENT_ROW_FIELDS)))
+    
+    def _todays_query(self):
+        """Calendar view covering today."""
+        start, end = self._date_window(0, False)
+        return self._account.calendar.view(start=start, end=end)
     
     # =========================================================================
     # Statistics
@@ -291,55 +434,118 @@ class EWSDataSource(DataSourceBase):
     
     def get_email_stats(self) -> dict:
         """Get email statistics."""
-        inbox = self.get_inbox(limit=50)
-        sent = self.get_sent_items(limit=50)
-        unread_count = self.get_unread_count()
+        # Raw field dicts via values(): no Message objects, no bodies. The
+        # three EWS round-trips are independent, so they run concurrently.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            inbox_f = pool.submit(lambda: list(
+                self._account.inbox.all().order_by('-datetime_received').values("sender", "importance")[:50]
+            ))
+            sent_f = pool.submit(lambda: list(
+                self._account.sent.all().order_by('-datetime_sent').values("datetime_sent")[:50]
+            ))
+            unread_f = pool.submit(self.get_unread_count)
+            inbox, sent_count, unread_count = inbox_f.result(), len(sent_f.result()), unread_f.result()
         
-        sender_counts: dict[str, int] = {}
+        senders = []
+        importances = []
         for email in inbox:
-            sender = email.get("FromName") or email.get("From", "Unknown")
-            sender_counts[sender] = sender_counts.get(sender, 0) + 1
+            sender = email.get("sender")
+            senders.append((sender.name or sender.email_address) if sender else "Unknown")
+            importances.append(str(email.get("importance") or ""))
         
-        top_senders = sorted(sender_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        high_importance = len([e for e in inbox if "high" in e.get("Importance", "").lower()])
+        if np is not None and inbox:
+            top_senders = self._top_counts_np(senders, 5)
+            high_importance = int(np.count_nonzero(
+                np.char.find(np.char.lower(np.array(importances, dtype=str)), "high") >= 0
+            ))
+        else:
+            sender_counts: dict[str, int] = {}
+            for name in senders:
+                sender_counts[name] = sender_counts.get(name, 0) + 1
+            top_senders = sorted(sender_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            high_importance = len([i for i in importances if "high" in i.lower()])
         
         return {
             "inbox_count": len(inbox),
-            "sent_count": len(sent),
+            "sent_count": sent_count,
             "unread_count": unread_count,
             "high_importance": high_importance,
             "top_senders": [{"name": s[0], "count": s[1]} for s in top_senders]
         }
     
+    @staticmethod
+    def _top_counts_np(names: list[str], k: int) -> list[tuple[str, int]]:
+        """The k most frequent names with counts; ties keep first-seen order, as sorted() would."""
+        uniq, first, counts = np.unique(np.array(names, dtype=str), return_index=True, return_counts=True)
+        order = np.lexsort((first, -counts))[:k]
+        return [(str(uniq[i]), int(counts[i])) for i in order]
+    
     def get_meeting_stats(self) -> dict:
         """Get meeting statistics."""
-        all_meetings = self.get_calendar(days=30, include_past=True)
-        now = datetime.now()
+        now = time.monotonic()
+        cached = self._meeting_stats
+        if cached is None or now - cached[0] > self.MEETING_STATS_TTL:
+            cached = self._meeting_stats = (now, self._compute_meeting_stats())
+        return dict(cached[1])
+    
+    def _compute_meeting_stats(self) -> dict:
+        """Aggregate meeting statistics from a single calendar view."""
+        from exchangelib import EWSDateTime
+        
+        tz = self._tz
+        now = EWSDateTime.now(tz)
         my_email = self.get_my_email().lower()
         
-        upcoming = []
-        past = []
-        organized_by_me = []
+        # Same window as get_calendar(days=30, include_past=True); today is inside it
+        start_ews, end_ews = self._date_window(30, True)
+        today_start, today_end = self._date_window(0, False)
+        
+        def as_datetime(value):
+            # All-day items carry dates rather than datetimes
+            if isinstance(value, datetime):
+                return value
+            return tz.localize(EWSDateTime(value.year, value.month, value.day))
+        
+        queryset = self._account.calendar.view(start=start_ews, end=end_ews).only(
+            "start", "end", "organizer"
+        )
+        
+        # One pass over the EWS items pulls out plain numbers; the counts are
+        # then taken over whole arrays
+        starts: list[float] = []
+        ends: list[float] = []
+        organizers: list[str] = []
+        for event in queryset:
+            if event.start:
+                event_start = as_datetime(event.start)
+                starts.append(event_start.timestamp())
+                ends.append((as_datetime(event.end) if event.end else event_start).timestamp())
+            organizer = event.organizer.email_address if event.organizer else None
+            organizers.append((organizer or "").lower())
+        
+        now_ts = now.timestamp()
+        today_start_ts = today_start.timestamp()
+        today_end_ts = today_end.timestamp()
+        if np is not None:
+            starts_np = np.array(starts, dtype=np.float64)
+            ends_np = np.array(ends, dtype=np.float64)
+            upcoming = int(np.count_nonzero(starts_np > now_ts))
+            today = int(np.count_nonzero((starts_np <= today_end_ts) & (ends_np > today_start_ts)))
+        else:
+            upcoming = sum(start > now_ts for start in starts)
+            today = sum(
+                start <= today_end_ts and end > today_start_ts
+                for start, end in zip(starts, ends)
+            )
         
-        for meeting in all_meetings:
-            start_str = meeting.get("StartTime", "")
-            if start_str:
-                try:
-                    start_time = datetime.fromisoformat(start_str)
-                    if start_time > now:
-                        upcoming.append(meeting)
-                    else:
-                        past.append(meeting)
-                except ValueError:
-                    pass
-            
-            if meeting.get("Organizer", "").lower() == my_email:
-                organized_by_me.append(meeting)
+        total = len(organizers)
+        past = len(starts) - upcoming
+        organized_by_me = organizers.count(my_email)
         
         return {
-            "total_meetings": len(all_meetings),
-            "upcoming": len(upcoming),
-            "past": len(past),
-            "organized_by_me": len(organized_by_me),
-            "today": len(self.get_todays_meetings())
+            "total_meetings": total,
+            "upcoming": upcoming,
+            "past": past,
+            "organized_by_me": organized_by_me,
+            "today": today
         }
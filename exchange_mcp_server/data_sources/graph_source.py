@@ -440,21 +440,22 @@ class GraphDataSource(DataSourceBase):
         now = datetime.now()
         my_email = self.get_my_email().lower()
         
+        # Graph's dateTime values share one fixed ISO-8601 layout
+        # (YYYY-MM-DDTHH:MM:SS.fffffff), so their first 19 characters sort
+        # chronologically and compare directly, without parsing each one
+        now_key = now.isoformat(timespec="seconds")
+        
         upcoming = []
         past = []
         organized_by_me = []
         
         for meeting in all_meetings:
-            start_str = meeting.get("StartTime", "")
-            if start_str:
-                try:
-                    start_time = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                    if start_time > now:
-                        upcoming.append(meeting)
-                    else:
-                        past.append(meeting)
-                except ValueError:
-                    pass
+            start_key = meeting.get("StartTime", "")[:19]
+            if len(start_key) == 19:
+                if start_key > now_key:
+                    upcoming.append(meeting)
+                else:
+                    past.append(meeting)
             
             if meeting.get("Organizer", "").lower() == my_email:
                 organized_by_me.append(meeting)
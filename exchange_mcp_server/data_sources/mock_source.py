@@ -5,16 +5,27 @@ This is the current implementation, refactored to implement the DataSourceBase i
 """
 
 import json
+import time
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Any
 
-from exchange_mcp_server.data_sources import DataSourceBase
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to list filtering
+    np = None
+
+from exchange_mcp_server.data_sources import DataSourceBase, email_row, meeting_row
 
 
 class MockDataSource(DataSourceBase):
     """Data source that reads from a local JSON cache file."""
     
+    # Meeting stats depend on the clock (upcoming vs. past), so they are only
+    # reused for this many seconds even when the data has not changed
+    MEETING_STATS_TTL = 30.0
+    
     def __init__(self, cache_path: str | Path | None = None):
         """
         Initialize mock data source.
@@ -32,6 +43,26 @@ class MockDataSource(DataSourceBase):
         self.cache_path = Path(cache_path)
         self.data: dict[str, Any] = {}
         self.protagonist: dict[str, Any] = {}
+        self._emails_by_id: dict[str, dict] = {}
+        self._meetings_by_id: dict[str, dict] = {}
+        self._email_view: dict[str, tuple] = {}
+        self._meeting_view: dict[str, tuple] = {}
+        self._inbox: list[dict] = []
+        self._inbox_unread: list[dict] = []
+        self._sent: list[dict] = []
+        self._meetings: list[dict] = []
+        self._meeting_starts: list[datetime] = []
+        self._meeting_starts_np = None
+        self._colleagues: list[dict] = []
+        self._colleague_fields: list[tuple[str, str, str]] = []
+        self._colleague_trigrams: dict[str, list[int]] = {}
+        self._colleagues_by_dept: dict[str, list[dict]] = {}
+        
+        # Bumped whenever the data changes; derived results cached against it
+        self._generation = 0
+        self._todays_meetings: tuple[tuple, list[dict]] | None = None
+        self._email_stats: tuple[int, dict] | None = None
+        self._meeting_stats: tuple[int, float, dict] | None = None
     
     def initialize(self) -> None:
         """Load data from JSON file."""
@@ -43,9 +74,62 @@ class MockDataSource(DataSourceBase):
             with open(self.cache_path, "r", encoding="utf-8-sig") as f:
                 self.data = json.load(f)
             self.protagonist = self.data.get("Protagonist", {})
+            self._emails_by_id = self.data.get("Emails", {})
+            self._meetings_by_id = self.data.get("Meetings", {})
+            # Display fields (sender, preview, ...) are fixed per item, so the
+            # list tools read them from here instead of re-deriving per call
+            self._email_view = {
+                e["Id"]: email_row(e) for e in self.data.get("Emails", {}).values()
+            }
+            self._meeting_view = {
+                m["Id"]: meeting_row(m) for m in self.data.get("Meetings", {}).values()
+            }
+            self._build_indexes()
+            self._generation += 1
         else:
             raise FileNotFoundError(f"Cache file not found: {self.cache_path}")
     
+    def _build_indexes(self):
+        """Pre-sort folders and pre-parse meeting start times."""
+        emails = self.data.get("Emails", {}).values()
+        by_date = lambda e: e.get("ReceivedDate", "")
+        self._inbox = sorted((e for e in emails if e.get("FolderPath") == "Inbox"), key=by_date, reverse=True)
+        self._inbox_unread = [e for e in self._inbox if not e.get("IsRead", False)]
+        self._sent = sorted((e for e in emails if e.get("FolderPath") == "Sent Items"), key=by_date, reverse=True)
+        
+        # Meetings in StartTime order, dropping those without a parseable start
+        self._meetings, self._meeting_starts = [], []
+        for meeting in sorted(self.data.get("Meetings", {}).values(), key=lambda m: m.get("StartTime", "")):
+            start_time = self._parse_datetime(meeting.get("StartTime", ""))
+            if start_time:
+                self._meetings.append(meeting)
+                self._meeting_starts.append(start_time)
+        if np is not None:
+            self._meeting_starts_np = np.array(self._meeting_starts, dtype="datetime64[us]")
+        
+        # Colleagues (everyone but me) by DisplayName, with lowercased search
+        # fields, a trigram -> positions index over them, and a department map
+        my_email = self.get_my_email().lower()
+        self._colleagues = sorted(
+            (u for u in self.data.get("Users", {}).values() if u.get("Email", "").lower() != my_email),
+            key=lambda u: u.get("DisplayName", ""),
+        )
+        self._colleague_fields = []
+        trigrams: dict[str, list[int]] = defaultdict(list)
+        by_dept: dict[str, list[dict]] = defaultdict(list)
+        for i, user in enumerate(self._colleagues):
+            fields = (
+                user.get("DisplayName", "").lower(),
+                user.get("Email", "").lower(),
+                user.get("Department", "").lower(),
+            )
+            self._colleague_fields.append(fields)
+            for gram in {f[j:j + 3] for f in fields for j in range(len(f) - 2)}:
+                trigrams[gram].append(i)
+            by_dept[fields[2]].append(user)
+        self._colleague_trigrams = dict(trigrams)
+        self._colleagues_by_dept = dict(by_dept)
+    
     def reload(self) -> None:
         """Reload data from cache file."""
         self._load_data()
@@ -71,35 +155,36 @@ class MockDataSource(DataSourceBase):
     
     def get_colleagues(self, department: str | None = None, limit: int = 20) -> list[dict]:
         """Get colleagues, optionally filtered by department."""
-        my_email = self.get_my_email().lower()
-        colleagues = [
-            u for u in self.data.get("Users", {}).values()
-            if u.get("Email", "").lower() != my_email
-        ]
-        
         if department:
-            colleagues = [u for u in colleagues if u.get("Department", "").lower() == department.lower()]
-        
-        colleagues.sort(key=lambda u: u.get("DisplayName", ""))
-        return colleagues[:limit]
+            return self._colleagues_by_dept.get(department.lower(), [])[:limit]
+        return self._colleagues[:limit]
     
     def search_colleagues(self, query: str, limit: int = 10) -> list[dict]:
         """Search colleagues by name or email."""
         query_lower = query.lower()
-        my_email = self.get_my_email().lower()
-        results = []
         
-        for user in self.data.get("Users", {}).values():
-            if user.get("Email", "").lower() == my_email:
-                continue
-            name = user.get("DisplayName", "").lower()
-            email = user.get("Email", "").lower()
-            dept = user.get("Department", "").lower()
-            
-            if query_lower in name or query_lower in email or query_lower in dept:
-                results.append(user)
+        # Any field containing the query contains all of its trigrams, so the
+        # intersection of their postings is a (sorted) superset of the matches
+        if len(query_lower) >= 3:
+            postings = []
+            for gram in {query_lower[j:j + 3] for j in range(len(query_lower) - 2)}:
+                posting = self._colleague_trigrams.get(gram)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+            positions = sorted(candidates)
+        else:
+            positions = range(len(self._colleagues))
         
-        results.sort(key=lambda u: u.get("DisplayName", ""))
+        results = []
+        for i in positions:
+            name, email, dept = self._colleague_fields[i]
+            if query_lower in name or query_lower in email or query_lower in dept:
+                results.append(self._colleagues[i])
+                if len(results) == limit:
+                    break
         return results[:limit]
     
     def get_org_structure(self) -> dict:
@@ -141,37 +226,25 @@ class MockDataSource(DataSourceBase):
     
     def get_email_by_id(self, email_id: str) -> dict | None:
         """Get an email by ID."""
-        return self.data.get("Emails", {}).get(email_id)
+        return self._emails_by_id.get(email_id)
     
     def get_inbox(self, limit: int = 20, unread_only: bool = False) -> list[dict]:
         """Get emails from inbox (emails TO me)."""
-        emails = [
-            e for e in self.data.get("Emails", {}).values()
-            if e.get("FolderPath") == "Inbox"
-        ]
-        
-        if unread_only:
-            emails = [e for e in emails if not e.get("IsRead", False)]
-        
-        emails.sort(key=lambda e: e.get("ReceivedDate", ""), reverse=True)
+        emails = self._inbox_unread if unread_only else self._inbox
         return emails[:limit]
     
     def get_sent_items(self, limit: int = 20) -> list[dict]:
         """Get sent emails (emails FROM me)."""
-        emails = [
-            e for e in self.data.get("Emails", {}).values()
-            if e.get("FolderPath") == "Sent Items"
-        ]
-        
-        emails.sort(key=lambda e: e.get("ReceivedDate", ""), reverse=True)
-        return emails[:limit]
+        return self._sent[:limit]
+    
+    def _email_rows(self, emails: list[dict]) -> list[tuple]:
+        """Display rows for emails, from the view built at load time."""
+        view = self._email_view
+        return [view.get(e["Id"]) or email_row(e) for e in emails]
     
     def get_unread_count(self) -> int:
         """Get count of unread emails in inbox."""
-        return len([
-            e for e in self.data.get("Emails", {}).values()
-            if e.get("FolderPath") == "Inbox" and not e.get("IsRead", False)
-        ])
+        return len(self._inbox_unread)
     
     # =========================================================================
     # Calendar / Meetings
@@ -183,7 +256,7 @@ class MockDataSource(DataSourceBase):
     
     def get_meeting_by_id(self, meeting_id: str) -> dict | None:
         """Get a meeting by ID."""
-        return self.data.get("Meetings", {}).get(meeting_id)
+        return self._meetings_by_id.get(meeting_id)
     
     def _parse_datetime(self, dt_str: str) -> datetime | None:
         """Parse datetime from various formats."""
@@ -196,35 +269,38 @@ class MockDataSource(DataSourceBase):
                 continue
         return None
     
+    def _meetings_between(self, start: datetime, end: datetime) -> list[dict]:
+        """Meetings starting within [start, end], in StartTime order."""
+        if self._meeting_starts_np is not None:
+            starts = self._meeting_starts_np
+            mask = (starts >= np.datetime64(start, "us")) & (starts <= np.datetime64(end, "us"))
+            return [self._meetings[i] for i in np.flatnonzero(mask)]
+        return [
+            m for m, start_time in zip(self._meetings, self._meeting_starts)
+            if start <= start_time <= end
+        ]
+    
     def get_calendar(self, days: int = 7, include_past: bool = False) -> list[dict]:
         """Get upcoming meetings from my calendar."""
-        meetings = list(self.data.get("Meetings", {}).values())
-        
         now = datetime.now()
         start_date = now - timedelta(days=7) if include_past else now
         end_date = now + timedelta(days=days)
-        
-        result = []
-        for meeting in meetings:
-            start_time = self._parse_datetime(meeting.get("StartTime", ""))
-            if start_time and start_date <= start_time <= end_date:
-                result.append(meeting)
-        
-        result.sort(key=lambda m: m.get("StartTime", ""))
-        return result
+        return self._meetings_between(start_date, end_date)
+    
+    def _meeting_rows(self, meetings: list[dict]) -> list[tuple]:
+        """Display rows for meetings, from the view built at load time."""
+        view = self._meeting_view
+        return [view.get(m["Id"]) or meeting_row(m) for m in meetings]
     
     def get_todays_meetings(self) -> list[dict]:
         """Get today's meetings."""
         today = datetime.now().date()
-        meetings = []
-        
-        for meeting in self.data.get("Meetings", {}).values():
-            start_time = self._parse_datetime(meeting.get("StartTime", ""))
-            if start_time and start_time.date() == today:
-                meetings.append(meeting)
-        
-        meetings.sort(key=lambda m: m.get("StartTime", ""))
-        return meetings
+        key = (self._generation, today)
+        if self._todays_meetings is None or self._todays_meetings[0] != key:
+            midnight = datetime.combine(today, datetime.min.time())
+            meetings = self._meetings_between(midnight, midnight + timedelta(days=1, microseconds=-1))
+            self._todays_meetings = (key, meetings)
+        return list(self._todays_meetings[1])
     
     # =========================================================================
     # Statistics
@@ -232,6 +308,12 @@ class MockDataSource(DataSourceBase):
     
     def get_email_stats(self) -> dict:
         """Get email statistics."""
+        if self._email_stats is None or self._email_stats[0] != self._generation:
+            self._email_stats = (self._generation, self._compute_email_stats())
+        return dict(self._email_stats[1])
+    
+    def _compute_email_stats(self) -> dict:
+        """Aggregate email statistics over the whole mailbox."""
         all_emails = list(self.data.get("Emails", {}).values())
         inbox = [e for e in all_emails if e.get("FolderPath") == "Inbox"]
         sent = [e for e in all_emails if e.get("FolderPath") == "Sent Items"]
@@ -256,6 +338,14 @@ class MockDataSource(DataSourceBase):
     
     def get_meeting_stats(self) -> dict:
         """Get meeting statistics."""
+        now = time.monotonic()
+        cached = self._meeting_stats
+        if cached is None or cached[0] != self._generation or now - cached[1] > self.MEETING_STATS_TTL:
+            cached = self._meeting_stats = (self._generation, now, self._compute_meeting_stats())
+        return dict(cached[2])
+    
+    def _compute_meeting_stats(self) -> dict:
+        """Aggregate meeting statistics over the whole calendar."""
         all_meetings = list(self.data.get("Meetings", {}).values())
         now = datetime.now()
         my_email = self.get_my_email().lower()
@@ -13,7 +13,12 @@ import mcp.types as types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
-from exchange_mcp_server.data_sources import create_data_source, DataSourceBase
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+from exchange_mcp_server.data_sources import create_data_source, preview, DataSourceBase
 from exchange_mcp_server.vector_store import VectorStore
 
 # Configure logging
@@ -29,6 +34,13 @@ data_source: DataSourceBase | None = None
 vector_store: VectorStore | None = None
 
 
+def _dump(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
@@ -93,20 +105,27 @@ def sync_data() -> dict:
     """Reload data from source and index any new documents.
     For mock mode, call after running Update-IncrementalData.ps1.
     For live sources (graph/ews), fetches latest data from server."""
-    global data_source, vector_store
-    
     # Reload data from source
-    data_source.reload()
+    reload_data()
     
     # Index only new documents
-    emails = data_source.get_all_emails()
-    meetings = data_source.get_all_meetings()
-    
-    result = vector_store.index_new_documents(emails, meetings)
+    result = {**sync_emails(), **sync_meetings()}
     logger.info(f"Sync complete: {result}")
     
     return result
 
+def reload_data() -> None:
+    """Reload data from source (first step of a sync)."""
+    data_source.reload()
+
+def sync_emails() -> dict:
+    """Index any new emails. Independent of sync_meetings, so both may run concurrently."""
+    return vector_store.index_new_emails(data_source.get_all_emails())
+
+def sync_meetings() -> dict:
+    """Index any new meetings. Independent of sync_emails, so both may run concurrently."""
+    return vector_store.index_new_meetings(data_source.get_all_meetings())
+
 @server.list_tools()
 async def list_tools() -> list[types.Tool]:
     """List available MCP tools."""
@@ -329,7 +348,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "name": me.get("DisplayName"),
                     "email": me.get("Email"),
                     "department": me.get("Department"),
@@ -338,7 +357,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                     "office": me.get("Office", "N/A"),
                     "unread_emails": unread,
                     "meetings_today": today_meetings
-                }, indent=2)
+                })
             )]
         
         elif name == "get_inbox":
@@ -348,7 +367,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "count": len(emails),
                     "unread_total": data_source.get_unread_count(),
                     "emails": [
@@ -359,11 +378,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                             "date": e["ReceivedDate"],
                             "is_read": e.get("IsRead", False),
                             "importance": e.get("Importance", "Normal"),
-                            "preview": e.get("Body", "")[:100] + "..." if len(e.get("Body", "")) > 100 else e.get("Body", "")
+                            "preview": preview(e.get("Body", ""), 100)
                         }
                         for e in emails
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "get_sent":
@@ -372,7 +391,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "count": len(emails),
                     "emails": [
                         {
@@ -380,11 +399,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                             "subject": e["Subject"],
                             "to": e.get("ToName") or e["To"],
                             "date": e["ReceivedDate"],
-                            "preview": e.get("Body", "")[:100] + "..." if len(e.get("Body", "")) > 100 else e.get("Body", "")
+                            "preview": preview(e.get("Body", ""), 100)
                         }
                         for e in emails
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "read_email":
@@ -393,7 +412,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             if email:
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps({
+                    text=_dump({
                         "id": email["Id"],
                         "subject": email["Subject"],
                         "from": email.get("FromName") or email["From"],
@@ -404,7 +423,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         "importance": email.get("Importance", "Normal"),
                         "has_attachments": email.get("HasAttachments", False),
                         "folder": email.get("FolderPath", "Unknown")
-                    }, indent=2)
+                    })
                 )]
             else:
                 return [types.TextContent(
@@ -419,11 +438,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "query": query,
                     "count": len(results),
                     "results": results
-                }, indent=2)
+                })
             )]
         
         elif name == "get_calendar":
@@ -432,7 +451,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "days_ahead": days,
                     "count": len(meetings),
                     "meetings": [
@@ -447,7 +466,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         }
                         for m in meetings
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "get_todays_meetings":
@@ -455,7 +474,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "count": len(meetings),
                     "meetings": [
                         {
@@ -468,7 +487,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         }
                         for m in meetings
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "get_meeting":
@@ -477,7 +496,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             if meeting:
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps({
+                    text=_dump({
                         "id": meeting["Id"],
                         "subject": meeting["Subject"],
                         "organizer": meeting.get("OrganizerName") or meeting["Organizer"],
@@ -487,7 +506,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         "location": meeting.get("Location", ""),
                         "body": meeting.get("Body", ""),
                         "is_recurring": meeting.get("IsRecurring", False)
-                    }, indent=2)
+                    })
                 )]
             else:
                 return [types.TextContent(
@@ -502,11 +521,11 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "query": query,
                     "count": len(results),
                     "results": results
-                }, indent=2)
+                })
             )]
         
         elif name == "find_colleague":
@@ -515,7 +534,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "query": query,
                     "count": len(colleagues),
                     "colleagues": [
@@ -529,7 +548,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         }
                         for c in colleagues
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "list_colleagues":
@@ -539,7 +558,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "filter": department or "all",
                     "count": len(colleagues),
                     "colleagues": [
@@ -551,14 +570,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
                         }
                         for c in colleagues
                     ]
-                }, indent=2)
+                })
             )]
         
         elif name == "get_org_structure":
             org = data_source.get_org_structure()
             return [types.TextContent(
                 type="text",
-                text=json.dumps(org, indent=2)
+                text=_dump(org)
             )]
         
         elif name == "get_stats":
@@ -567,21 +586,21 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "email": email_stats,
                     "meetings": meeting_stats
-                }, indent=2)
+                })
             )]
         
         elif name == "sync":
             result = sync_data()
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "status": "success",
                     "message": "Data synced successfully",
                     **result
-                }, indent=2)
+                })
             )]
         
         elif name == "find_similar_emails":
@@ -601,10 +620,10 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextCont
             
             return [types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "original": email["Subject"],
                     "similar": results
-                }, indent=2)
+                })
             )]
         
         else:
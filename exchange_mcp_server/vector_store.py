@@ -7,18 +7,32 @@ Uses ChromaDB's built-in ONNX embedding function (no PyTorch required).
 import json
 import hashlib
 import logging
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 
 logger = logging.getLogger("exchange-mcp.vector_store")
 
 
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace (the default embedding model is uncased)."""
+    return " ".join(query.lower().split())
+
+
 class VectorStore:
     """ChromaDB-based vector store for semantic search."""
     
+    # Search results are cached per (collection, query, limit) for this long;
+    # indexing new documents clears the cache
+    RESULT_CACHE_TTL = 3600.0
+    RESULT_CACHE_SIZE = 512
+    
     def __init__(self, persist_path: str):
         self.persist_path = Path(persist_path)
         self.persist_path.mkdir(parents=True, exist_ok=True)
@@ -41,9 +55,51 @@ class VectorStore:
             metadata={"description": "Meeting documents for semantic search"}
         )
         
+        # Both collections use Chroma's default embedding function, so query
+        # embeddings are computed here once per distinct query and reused
+        self._embedding_function = embedding_functions.DefaultEmbeddingFunction()
+        self._embed_query = lru_cache(maxsize=512)(self._embed)
+        self._result_cache: dict[tuple, tuple[float, list[dict]]] = {}
+        # Searches store results while sync threads clear them after indexing
+        self._result_cache_lock = threading.Lock()
+        self._result_generation = 0  # bumped by _clear_results so pre-clear results aren't stored
+        
         logger.info(f"VectorStore initialized at {persist_path}")
         logger.info(f"Emails: {self.emails_collection.count()}, Meetings: {self.meetings_collection.count()}")
     
+    def _embed(self, normalized_query: str) -> Any:
+        """Embed a normalized query string (cached via _embed_query)."""
+        return self._embedding_function([normalized_query])[0]
+    
+    def _query(self, collection, query: str, limit: int) -> dict:
+        """Run a similarity query using the cached query embedding."""
+        return collection.query(
+            query_embeddings=[self._embed_query(_normalize_query(query))],
+            n_results=limit
+        )
+    
+    def _cached_results(self, key: tuple) -> list[dict] | None:
+        """Return a fresh cached result list for key, or None."""
+        entry = self._result_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.RESULT_CACHE_TTL:
+            return None
+        return list(entry[1])
+    
+    def _cache_results(self, key: tuple, output: list[dict], generation: int):
+        """Remember a result list queried at generation, evicting the oldest entry when full."""
+        with self._result_cache_lock:
+            if generation != self._result_generation:
+                return  # documents were indexed while the query ran
+            if len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[key] = (time.monotonic(), list(output))
+    
+    def _clear_results(self):
+        """Drop every cached result list (the indexed documents changed)."""
+        with self._result_cache_lock:
+            self._result_generation += 1
+            self._result_cache.clear()
+    
     def needs_indexing(self) -> bool:
         """Check if documents need to be (re)indexed."""
         # If collections are empty, we need indexing
@@ -64,23 +120,42 @@ class VectorStore:
     def index_new_documents(self, emails: list[dict], meetings: list[dict]) -> dict:
         """Index only new documents that aren't already in the vector store.
         Returns counts of newly indexed items."""
+        email_result = self.index_new_emails(emails)
+        meeting_result = self.index_new_meetings(meetings)
+        return {
+            "new_emails_indexed": email_result["new_emails_indexed"],
+            "new_meetings_indexed": meeting_result["new_meetings_indexed"],
+            "total_emails": email_result["total_emails"],
+            "total_meetings": meeting_result["total_meetings"]
+        }
+    
+    def index_new_emails(self, emails: list[dict]) -> dict:
+        """Index emails that aren't already in the vector store.
+        Independent of index_new_meetings, so the two can run concurrently."""
+        indexed_ids = self.get_indexed_ids("emails")
+        new_emails = [e for e in emails if e.get("Id") not in indexed_ids]
         
-        indexed_email_ids = self.get_indexed_ids("emails")
-        indexed_meeting_ids = self.get_indexed_ids("meetings")
+        if new_emails:
+            logger.info(f"Indexing {len(new_emails)} new emails...")
+            self._index_emails(new_emails)
         
-        # Filter to only new documents
-        new_emails = [e for e in emails if e.get("Id") not in indexed_email_ids]
-        new_meetings = [m for m in meetings if m.get("Id") not in indexed_meeting_ids]
+        return {
+            "new_emails_indexed": len(new_emails),
+            "total_emails": self.emails_collection.count()
+        }
+    
+    def index_new_meetings(self, meetings: list[dict]) -> dict:
+        """Index meetings that aren't already in the vector store.
+        Independent of index_new_emails, so the two can run concurrently."""
+        indexed_ids = self.get_indexed_ids("meetings")
+        new_meetings = [m for m in meetings if m.get("Id") not in indexed_ids]
         
-        if new_emails or new_meetings:
-            logger.info(f"Indexing {len(new_emails)} new emails, {len(new_meetings)} new meetings...")
-            self._index_emails(new_emails)
+        if new_meetings:
+            logger.info(f"Indexing {len(new_meetings)} new meetings...")
             self._index_meetings(new_meetings)
         
         return {
-            "new_emails_indexed": len(new_emails),
             "new_meetings_indexed": len(new_meetings),
-            "total_emails": self.emails_collection.count(),
             "total_meetings": self.meetings_collection.count()
         }
     
@@ -104,6 +179,7 @@ class VectorStore:
             } for e in batch]
             
             self.emails_collection.add(documents=docs, ids=ids, metadatas=metas)
+            self._clear_results()
     
     def _index_meetings(self, meetings: list[dict]):
         """Index a list of meetings."""
@@ -125,6 +201,7 @@ class VectorStore:
             } for m in batch]
             
             self.meetings_collection.add(documents=docs, ids=ids, metadatas=metas)
+            self._clear_results()
 
     def index_documents(self, emails: list[dict], meetings: list[dict]):
         """Index emails and meetings into vector store. ChromaDB handles embeddings."""
@@ -146,6 +223,7 @@ class VectorStore:
                 } for e in batch]
                 
                 self.emails_collection.add(documents=docs, ids=ids, metadatas=metas)
+                self._clear_results()
                 logger.info(f"Indexed emails {i+1}-{min(i+batch_size, len(emails))} of {len(emails)}")
         
         # Index meetings
@@ -166,14 +244,18 @@ class VectorStore:
                 } for m in batch]
                 
                 self.meetings_collection.add(documents=docs, ids=ids, metadatas=metas)
+                self._clear_results()
                 logger.info(f"Indexed meetings {i+1}-{min(i+batch_size, len(meetings))} of {len(meetings)}")
     
     def search_emails(self, query: str, limit: int = 10) -> list[dict]:
         """Search emails using semantic similarity."""
-        results = self.emails_collection.query(
-            query_texts=[query],
-            n_results=limit
-        )
+        key = ("emails", _normalize_query(query), limit)
+        cached = self._cached_results(key)
+        if cached is not None:
+            return cached
+        
+        generation = self._result_generation
+        results = self._query(self.emails_collection, query, limit)
         
         # Format results
         output = []
@@ -190,14 +272,18 @@ class VectorStore:
                     "relevance_score": round(1 - distance, 3) if distance else 1.0
                 })
         
+        self._cache_results(key, output, generation)
         return output
     
     def search_meetings(self, query: str, limit: int = 10) -> list[dict]:
         """Search meetings using semantic similarity."""
-        results = self.meetings_collection.query(
-            query_texts=[query],
-            n_results=limit
-        )
+        key = ("meetings", _normalize_query(query), limit)
+        cached = self._cached_results(key)
+        if cached is not None:
+            return cached
+        
+        generation = self._result_generation
+        results = self._query(self.meetings_collection, query, limit)
         
         # Format results
         output = []
@@ -214,12 +300,14 @@ class VectorStore:
                     "relevance_score": round(1 - distance, 3) if distance else 1.0
                 })
         
+        self._cache_results(key, output, generation)
         return output
     
     def clear(self):
         """Clear all indexed documents."""
         self.client.delete_collection("emails")
         self.client.delete_collection("meetings")
+        self._clear_results()
         
         self.emails_collection = self.client.get_or_create_collection(name="emails")
         self.meetings_collection = self.client.get_or_create_collection(name="meetings")
@@ -9,6 +9,8 @@ class ExchangeAssistant {
         this.isConnected = false;
         this.sessionId = this.generateSessionId();
         this.lastInteractionId = null;
+        this.streamingMessage = null;
+        this.streamingText = '';
         
         this.init();
     }
@@ -169,15 +171,28 @@ class ExchangeAssistant {
                 }
                 break;
                 
+            case 'token':
+                this.appendToken(data.content);
+                break;
+                
+            case 'tokens':
+                this.appendToken(data.content.join(''));
+                break;
+                
+            case 'reset':
+                this.resetStreaming();
+                break;
+                
+            case 'done':
             case 'response':
-                this.hideThinking();
+                this.finishStreaming();
                 this.lastInteractionId = data.interaction_id || null;
                 this.addMessage('assistant', data.content, data.tools_used, this.lastInteractionId);
                 this.loadStatus(); // Refresh status after response
                 break;
                 
             case 'error':
-                this.hideThinking();
+                this.finishStreaming();
                 this.addMessage('assistant', `Error: ${data.content}`);
                 break;
                 
@@ -435,6 +450,39 @@ class ExchangeAssistant {
         return formatted;
     }
     
+    appendToken(delta) {
+        // The first token replaces the thinking indicator with a live message
+        if (!this.streamingMessage) {
+            this.hideThinking();
+            this.addMessage('assistant', '');
+            this.streamingMessage = this.elements.messagesContainer.lastElementChild;
+            this.streamingText = '';
+        }
+        this.streamingText += delta;
+        this.streamingMessage.querySelector('.message-content').innerHTML = this.formatMessage(this.streamingText);
+        this.scrollToBottom();
+    }
+    
+    finishStreaming() {
+        // The final message (with tools and feedback buttons) replaces the live one
+        this.hideThinking();
+        if (this.streamingMessage) {
+            this.streamingMessage.remove();
+            this.streamingMessage = null;
+        }
+        this.streamingText = '';
+    }
+    
+    resetStreaming() {
+        // Text streamed before a tool call is not the answer; wait for the tools
+        if (this.streamingMessage) {
+            this.streamingMessage.remove();
+            this.streamingMessage = null;
+        }
+        this.streamingText = '';
+        this.showThinking();
+    }
+    
     showThinking() {
         // Remove any existing thinking indicator
         this.hideThinking();